@@ -0,0 +1,37 @@
+"""drop_superseded_indexes
+
+Revision ID: 9c2e4b7a1d30
+Revises: 6341e70847e4
+Create Date: 2025-11-03 09:12:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2e4b7a1d30'
+down_revision: Union[str, Sequence[str], None] = '6341e70847e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Prefixes of idx_post_user_created, the link covering indexes or the
+    # link primary keys, so they only added write cost
+    op.execute("DROP INDEX IF EXISTS idx_post_user")
+    op.execute("DROP INDEX IF EXISTS idx_post_topic_post")
+    op.execute("DROP INDEX IF EXISTS idx_post_topic_topic")
+    op.execute("DROP INDEX IF EXISTS idx_maker_post_post")
+    op.execute("DROP INDEX IF EXISTS idx_maker_post_user")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("CREATE INDEX IF NOT EXISTS idx_post_user ON postrow(userId)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_post_topic_post ON posttopiclink(post_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_post_topic_topic ON posttopiclink(topic_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_maker_post_post ON makerpostlink(post_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_maker_post_user ON makerpostlink(user_id)")
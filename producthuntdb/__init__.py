@@ -16,23 +16,27 @@ Example:
     >>> asyncio.run(main())
 """
 
-from producthuntdb.config import settings
-from producthuntdb.io import AsyncGraphQLClient, DatabaseManager, KaggleManager
-from producthuntdb.models import (
-    Collection,
-    CollectionRow,
-    Comment,
-    CommentRow,
-    Post,
-    PostRow,
-    Topic,
-    TopicRow,
-    User,
-    UserRow,
-    Vote,
-    VoteRow,
-)
-from producthuntdb.pipeline import DataPipeline
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from producthuntdb.config import settings
+    from producthuntdb.io import AsyncGraphQLClient, DatabaseManager, KaggleManager
+    from producthuntdb.models import (
+        Collection,
+        CollectionRow,
+        Comment,
+        CommentRow,
+        Post,
+        PostRow,
+        Topic,
+        TopicRow,
+        User,
+        UserRow,
+        Vote,
+        VoteRow,
+    )
+    from producthuntdb.pipeline import DataPipeline
 
 __version__ = "0.1.0"
 
@@ -59,3 +63,43 @@ __all__ = [
     "CommentRow",
     "VoteRow",
 ]
+
+# Public names are imported on first access, so importing a submodule (e.g. the
+# CLI entry point) does not pull in the database, HTTP and Kaggle stacks up front
+_EXPORTS = {
+    "DataPipeline": "producthuntdb.pipeline",
+    "AsyncGraphQLClient": "producthuntdb.io",
+    "DatabaseManager": "producthuntdb.io",
+    "KaggleManager": "producthuntdb.io",
+    "settings": "producthuntdb.config",
+    **dict.fromkeys(
+        [
+            "Post",
+            "User",
+            "Topic",
+            "Collection",
+            "Comment",
+            "Vote",
+            "PostRow",
+            "UserRow",
+            "TopicRow",
+            "CollectionRow",
+            "CommentRow",
+            "VoteRow",
+        ],
+        "producthuntdb.models",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
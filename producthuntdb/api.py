@@ -22,26 +22,40 @@ Example:
 """
 
 import asyncio
+import hashlib
+import importlib.util
+import json
 import logging
+import random
+import re
 import time
+import weakref
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager, nullcontext, suppress
 from datetime import datetime
-from typing import Any
+from enum import StrEnum
+from functools import cache, lru_cache
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
     before_sleep_log,
-    retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
-    wait_random,
 )
 
-from producthuntdb.config import PostsOrder, settings
+from producthuntdb.config import HttpBackend, PostsOrder, settings
 from producthuntdb.logging import logger
-from producthuntdb.utils import format_iso
+from producthuntdb.utils import format_iso, parse_datetime
 
-# OpenTelemetry imports (optional - graceful degradation if not installed)
+if TYPE_CHECKING:
+    import aiohttp
+
+# OpenTelemetry imports (optional - no-op tracer if not installed)
 try:
     from producthuntdb.telemetry import (
         add_span_attributes,
@@ -54,9 +68,25 @@ try:
     tracer = get_tracer(__name__)
 except ImportError:
     TELEMETRY_AVAILABLE = False
-    tracer = None
 
-# Prometheus metrics (optional - graceful degradation if not installed)
+    class _NullTracer:
+        """Stand-in tracer whose spans are inert."""
+
+        def start_as_current_span(self, *args: Any, **kwargs: Any) -> nullcontext[None]:
+            return nullcontext()
+
+    def add_span_attributes(span: Any, attributes: dict[str, Any]) -> None:
+        pass
+
+    def record_exception_in_span(span: Any, exception: Exception, set_status: bool = True) -> None:
+        pass
+
+    def set_span_error(span: Any, message: str) -> None:
+        pass
+
+    tracer = _NullTracer()
+
+# Prometheus metrics (optional - no-op metrics if not installed)
 try:
     from producthuntdb.metrics import (
         errors_total,
@@ -65,14 +95,68 @@ try:
     )
 
     METRICS_AVAILABLE = True
+
+    # Resolve labelled children once; .labels() takes a lock and builds a key per call
+    _posts_queries_success = graphql_queries_total.labels(query_type="posts", status="success")
+    _posts_queries_error = graphql_queries_total.labels(query_type="posts", status="error")
+    _posts_duration_success = graphql_request_duration_seconds.labels(
+        query_type="posts", status="success"
+    )
+    _posts_duration_error = graphql_request_duration_seconds.labels(
+        query_type="posts", status="error"
+    )
 except ImportError:
     METRICS_AVAILABLE = False
 
+    class _NullMetric:
+        """Stand-in for a Prometheus metric (or labelled child) that records nothing."""
+
+        def labels(self, *args: Any, **kwargs: Any) -> "_NullMetric":
+            return self
+
+        def inc(self, amount: float = 1) -> None:
+            pass
+
+        def observe(self, amount: float) -> None:
+            pass
+
+    errors_total = graphql_queries_total = graphql_request_duration_seconds = _NullMetric()
+    _posts_queries_success = _posts_queries_error = _NullMetric()
+    _posts_duration_success = _posts_duration_error = _NullMetric()
+
+# Whether spans and metrics are recorded at all; otherwise hot paths skip instrumentation
+INSTRUMENTATION_ENABLED = TELEMETRY_AVAILABLE or METRICS_AVAILABLE
+
+# orjson serialization (optional - falls back to stdlib json if not installed)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# aiohttp transport (optional - selected with HTTP_BACKEND=aiohttp). Only probed
+# here: importing aiohttp costs ~150 ms, so it is imported when a client is built
+AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
+
 # =============================================================================
 # GraphQL Query Definitions
 # =============================================================================
 
-QUERY_POSTS_PAGE = """
+
+class PostFieldSet(StrEnum):
+    """Field selections available for the posts query.
+
+    Attributes:
+        MINIMAL: IDs, timestamps and counters only (smallest payload)
+        FULL: Every field required to validate a ``models.Post``
+    """
+
+    MINIMAL = "MINIMAL"
+    FULL = "FULL"
+
+
+_POSTS_QUERY_HEADER = """
 query PostsPage($first: Int!, $after: String, $order: PostsOrder, $postedAfter: DateTime) {
   posts(
     first: $first,
@@ -80,23 +164,43 @@ query PostsPage($first: Int!, $after: String, $order: PostsOrder, $postedAfter:
     order: $order,
     postedAfter: $postedAfter
   ) {
-    nodes {
+    nodes {"""
+
+_POSTS_QUERY_FOOTER = """
+    }
+    pageInfo {
+      endCursor
+      hasNextPage
+    }
+  }
+}
+"""
+
+_POST_FIELD_FRAGMENTS: dict[str, str] = {
+    "identity": """
       id
       userId
-      name
+      name""",
+    "details": """
       tagline
-      description
+      description""",
+    "location": """
       slug
-      url
-      website
+      url""",
+    "website": """
+      website""",
+    "timestamps": """
       createdAt
-      featuredAt
+      featuredAt""",
+    "counters": """
       commentsCount
-      votesCount
+      votesCount""",
+    "reviews": """
       reviewsCount
       reviewsRating
       isCollected
-      isVoted
+      isVoted""",
+    "user": """
       user {
         id
         username
@@ -105,14 +209,16 @@ query PostsPage($first: Int!, $after: String, $order: PostsOrder, $postedAfter:
         profileImage
         websiteUrl
         url
-      }
+      }""",
+    "makers": """
       makers {
         id
         username
         name
         headline
         profileImage
-      }
+      }""",
+    "topics": """
       topics(first: 10) {
         nodes {
           id
@@ -123,7 +229,8 @@ query PostsPage($first: Int!, $after: String, $order: PostsOrder, $postedAfter:
           endCursor
           hasNextPage
         }
-      }
+      }""",
+    "media": """
       productLinks {
         type
         url
@@ -137,17 +244,88 @@ query PostsPage($first: Int!, $after: String, $order: PostsOrder, $postedAfter:
         type
         url
         videoUrl
-      }
-    }
-    pageInfo {
-      endCursor
-      hasNextPage
-    }
-  }
+      }""",
 }
-"""
 
-QUERY_VIEWER = """
+_POST_FIELD_SETS: dict[PostFieldSet, tuple[str, ...]] = {
+    PostFieldSet.MINIMAL: ("identity", "location", "timestamps", "counters"),
+    PostFieldSet.FULL: (
+        "identity",
+        "details",
+        "location",
+        "website",
+        "timestamps",
+        "counters",
+        "reviews",
+        "user",
+        "makers",
+        "topics",
+        "media",
+    ),
+}
+
+
+_QUERY_COMMENT_RE = re.compile(r"#[^\n]*")
+_QUERY_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _minify_query(query: str) -> str:
+    """Strip comments and collapse whitespace in a GraphQL document.
+
+    The queries here contain no string literals, so this is purely a size
+    optimization: the server parses the result identically.
+
+    Args:
+        query: Pretty-printed GraphQL document
+
+    Returns:
+        Single-line GraphQL document
+
+    Example:
+        >>> _minify_query("query {\n  viewer { id }\n}")
+        'query { viewer { id } }'
+    """
+    return _QUERY_WHITESPACE_RE.sub(" ", _QUERY_COMMENT_RE.sub("", query)).strip()
+
+
+@cache
+def build_posts_query(fields: PostFieldSet = PostFieldSet.FULL) -> str:
+    """Build the posts page query for a field selection.
+
+    Queries are assembled from field fragments once per field set and cached,
+    so requesting a smaller selection costs nothing on subsequent pages.
+
+    Args:
+        fields: Field selection to request for each post node
+
+    Returns:
+        GraphQL query string
+
+    Example:
+        >>> query = build_posts_query(PostFieldSet.MINIMAL)
+        >>> "makers" in query
+        False
+    """
+    nodes = "".join(_POST_FIELD_FRAGMENTS[group] for group in _POST_FIELD_SETS[fields])
+    return _minify_query(_POSTS_QUERY_HEADER + nodes + _POSTS_QUERY_FOOTER)
+
+
+# Plain-string GraphQL enum values, resolved once instead of via ``.value`` per request
+_POSTS_ORDER_VALUES: dict[PostsOrder, str] = {member: member.value for member in PostsOrder}
+
+
+def _format_posted_after(posted_after_dt: datetime | str | None) -> str | None:
+    """Normalize a postedAfter filter (datetime or ISO string) to an ISO string."""
+    if not posted_after_dt:
+        return None
+    if isinstance(posted_after_dt, str):
+        return posted_after_dt
+    return format_iso(posted_after_dt)
+
+
+QUERY_POSTS_PAGE = build_posts_query(PostFieldSet.FULL)
+
+_QUERY_VIEWER_SRC = """
 query Viewer {
   viewer {
     user {
@@ -164,7 +342,7 @@ query Viewer {
 }
 """
 
-QUERY_TOPICS_PAGE = """
+_QUERY_TOPICS_PAGE_SRC = """
 query TopicsPage($first: Int!, $after: String) {
   topics(first: $first, after: $after, order: FOLLOWERS_COUNT) {
     nodes {
@@ -187,7 +365,7 @@ query TopicsPage($first: Int!, $after: String) {
 }
 """
 
-QUERY_COLLECTIONS_PAGE = """
+_QUERY_COLLECTIONS_PAGE_SRC = """
 query CollectionsPage($first: Int!, $after: String) {
   collections(first: $first, after: $after, order: FEATURED_AT) {
     nodes {
@@ -249,6 +427,208 @@ query CollectionsPage($first: Int!, $after: String) {
 """
 
 
+# Minified once at import; the pretty ``_SRC`` documents are kept for reading
+QUERY_VIEWER = _minify_query(_QUERY_VIEWER_SRC)
+QUERY_TOPICS_PAGE = _minify_query(_QUERY_TOPICS_PAGE_SRC)
+QUERY_COLLECTIONS_PAGE = _minify_query(_QUERY_COLLECTIONS_PAGE_SRC)
+
+
+# =============================================================================
+# Request/Response Encoding
+# =============================================================================
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@lru_cache(maxsize=32)
+def _query_envelope_prefix(query: str) -> bytes:
+    """Get the pre-encoded ``{"query":...,"variables":`` prefix for a query.
+
+    Args:
+        query: GraphQL query string
+
+    Returns:
+        Encoded request body prefix, cached per query
+    """
+    return b'{"query":' + _json_bytes(query) + b',"variables":'
+
+
+def encode_graphql_request(query: str, variables: dict[str, Any]) -> bytes:
+    """Encode a GraphQL request body, splicing variables into a cached envelope.
+
+    The static query text is serialized once per query; only the variables are
+    encoded on each request.
+
+    Args:
+        query: GraphQL query string
+        variables: Query variables
+
+    Returns:
+        UTF-8 JSON request body
+
+    Example:
+        >>> body = encode_graphql_request(QUERY_VIEWER, {})
+        >>> json.loads(body)["variables"]
+        {}
+    """
+    return _query_envelope_prefix(query) + _json_bytes(variables) + b"}"
+
+
+@lru_cache(maxsize=32)
+def _persisted_query_extensions(query: str) -> bytes:
+    """Get the pre-encoded APQ ``extensions`` member (and closing brace) for a query.
+
+    Args:
+        query: GraphQL query string
+
+    Returns:
+        Encoded ``,"extensions":{...}}`` suffix, cached per query
+    """
+    digest = hashlib.sha256(query.encode()).hexdigest()
+    return (
+        b',"extensions":{"persistedQuery":{"version":1,"sha256Hash":"' + digest.encode() + b'"}}}'
+    )
+
+
+def encode_persisted_query_request(
+    query: str,
+    variables: dict[str, Any],
+    include_query: bool = True,
+) -> bytes:
+    """Encode an Automatic Persisted Query (APQ) request body.
+
+    The body always carries the query's sha256 hash. The query text is only
+    included when registering it; afterwards the hash alone identifies it.
+
+    Args:
+        query: GraphQL query string
+        variables: Query variables
+        include_query: Send the full query text alongside the hash
+
+    Returns:
+        UTF-8 JSON request body
+
+    Example:
+        >>> body = encode_persisted_query_request(QUERY_VIEWER, {}, include_query=False)
+        >>> "query" in json.loads(body)
+        False
+    """
+    prefix = _query_envelope_prefix(query) if include_query else b'{"variables":'
+    return prefix + _json_bytes(variables) + _persisted_query_extensions(query)
+
+
+# Error codes (Apollo's message and extensions.code forms) meaning the server
+# supports persisted queries but does not know this hash yet
+_PERSISTED_QUERY_NOT_FOUND = frozenset({"PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"})
+
+
+def _persisted_query_miss(resp: httpx.Response) -> bool | None:
+    """Classify the response to a hash-only APQ request.
+
+    Any response that carries ``errors`` and no ``data`` counts as a miss:
+    servers without APQ support ignore the hash and answer with a plain
+    error (e.g. graphql-ruby's "No query string was present"). Only the
+    PersistedQueryNotFound code shows that the server does support APQ.
+
+    Args:
+        resp: HTTP response with its body loaded
+
+    Returns:
+        None if the query ran; otherwise whether the server is known to
+        support persisted queries
+    """
+    if resp.status_code not in (200, 400):
+        return None
+    # Some servers reject hash-only requests with a bare HTTP 400
+    rejected = False if resp.status_code == 400 else None
+
+    content = resp.content
+    # Cheap byte check so successful responses are not decoded twice
+    if isinstance(content, bytes) and b'"errors"' not in content:
+        return rejected
+    try:
+        body = _decode_response(resp)
+    except ValueError:
+        return rejected
+    if not isinstance(body, dict) or not body.get("errors") or body.get("data"):
+        return rejected
+
+    for error in body["errors"]:
+        if isinstance(error, dict):
+            code = (error.get("extensions") or {}).get("code")
+            if error.get("message") in _PERSISTED_QUERY_NOT_FOUND or (
+                code in _PERSISTED_QUERY_NOT_FOUND
+            ):
+                return True
+    return False
+
+
+def _decode_response(resp: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when available.
+
+    Args:
+        resp: HTTP response with a JSON body
+
+    Returns:
+        Decoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        content = resp.content
+        if isinstance(content, bytes):
+            return orjson.loads(content)
+    return resp.json()
+
+
+# Warm the envelope cache for the built-in queries at import time
+for _query in (QUERY_POSTS_PAGE, QUERY_VIEWER, QUERY_TOPICS_PAGE, QUERY_COLLECTIONS_PAGE):
+    _query_envelope_prefix(_query)
+    _persisted_query_extensions(_query)
+del _query
+
+
+# =============================================================================
+# Retry Policy
+# =============================================================================
+
+RETRY_MAX_ATTEMPTS = 20
+
+# Exponential backoff (3s * 2^n, clamped to 5s..120s), precomputed per attempt
+_RETRY_DELAYS = tuple(min(120.0, max(5.0, 3.0 * 2**n)) for n in range(RETRY_MAX_ATTEMPTS))
+_RETRY_JITTER_SECONDS = 5.0
+_retry_jitter = random.Random()
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Tenacity wait strategy backed by the precomputed backoff schedule.
+
+    Args:
+        retry_state: Tenacity state for the current retry attempt
+
+    Returns:
+        Seconds to sleep before the next attempt (base delay plus 0-5s jitter)
+    """
+    # The shared limiter already holds requests until the rate limit resets
+    if retry_state.outcome is not None and isinstance(
+        retry_state.outcome.exception(), RateLimitedError
+    ):
+        return 0.0
+
+    attempt = min(retry_state.attempt_number, RETRY_MAX_ATTEMPTS)
+    return _RETRY_DELAYS[attempt - 1] + _retry_jitter.random() * _RETRY_JITTER_SECONDS
+
+
 # =============================================================================
 # Custom Exceptions
 # =============================================================================
@@ -267,6 +647,363 @@ class TransientGraphQLError(Exception):
     pass
 
 
+class _PersistedQueryMiss(Exception):
+    """A hash-only APQ request was not executed and must be resent in full.
+
+    Args:
+        supported: Whether the server supports persisted queries at all
+    """
+
+    def __init__(self, supported: bool) -> None:
+        super().__init__("persisted query miss")
+        self.supported = supported
+
+
+class RateLimitedError(TransientGraphQLError):
+    """HTTP 429 with a known reset time.
+
+    The client's shared rate limiter is paused until the reset, so the retry
+    is issued without an additional exponential backoff.
+    """
+
+
+# Retry policy template, built once; each call drives a fresh copy of it
+_RETRYING = AsyncRetrying(
+    reraise=True,
+    stop=stop_after_attempt(RETRY_MAX_ATTEMPTS),
+    wait=_retry_wait,
+    retry=retry_if_exception_type(TransientGraphQLError),
+    before_sleep=before_sleep_log(logging.getLogger(__name__), logging.WARNING),
+)
+
+
+# =============================================================================
+# Rate Limiting
+# =============================================================================
+
+
+@lru_cache(maxsize=64)
+def _parse_reset(reset: str) -> tuple[float, bool] | None:
+    """Parse an ``X-RateLimit-Reset`` header value, cached per distinct value.
+
+    The same absolute reset time is repeated on every response in a window,
+    so the (comparatively slow) datetime parse runs once per window.
+
+    Args:
+        reset: Raw header value
+
+    Returns:
+        ``(value, is_absolute)`` where value is an epoch timestamp if absolute,
+        otherwise a delay in seconds; None if unparseable
+    """
+    try:
+        value = float(reset)
+    except ValueError:
+        try:
+            reset_at = parse_datetime(reset)
+        except ValueError:
+            return None
+        if reset_at is None:
+            return None
+        return reset_at.timestamp(), True
+
+    # Large values are epoch timestamps rather than relative delays
+    return value, value > 1e9
+
+
+def _seconds_until_reset(reset: str | None) -> float | None:
+    """Convert an ``X-RateLimit-Reset`` header value to seconds from now.
+
+    Accepts a delay in seconds, an epoch timestamp, or an ISO 8601 datetime.
+
+    Args:
+        reset: Raw header value
+
+    Returns:
+        Seconds until the rate limit window resets, or None if unknown or past
+    """
+    if not reset:
+        return None
+
+    parsed = _parse_reset(reset)
+    if parsed is None:
+        return None
+
+    value, is_absolute = parsed
+    seconds = value - time.time() if is_absolute else value
+    return seconds if seconds > 0 else None
+
+
+# Weight of the newest sample in the per-request cost moving average
+_COST_SMOOTHING = 0.2
+
+
+class AdaptiveRateLimiter:
+    """Token bucket shared by every coroutine using one client.
+
+    The bucket is synced to the rate limit headers: tokens track the
+    remaining budget and refill at the rate that spreads it over the time
+    until reset, so requests go out immediately while there is headroom and
+    slow down only as the budget runs out. Until headers arrive the bucket
+    does not throttle. A 429 drains it and holds every caller until the
+    window resets, instead of letting each coroutine back off on its own.
+
+    Product Hunt counts the budget in query complexity points, not requests,
+    so each request is charged an estimated cost: a moving average of how
+    far the remaining budget drops from one response to the next.
+
+    Example:
+        >>> limiter = AdaptiveRateLimiter()
+        >>> limiter.update(remaining=100, reset_seconds=900)
+        >>> await limiter.acquire()
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unthrottled limiter."""
+        self._rate = 0.0  # tokens per second; 0 means unknown (no throttling)
+        self._tokens = 0.0
+        self._cost = 1.0  # estimated tokens (complexity points) per request
+        self._cost_sampled = False
+        self._last_remaining: int | None = None
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def interval(self) -> float:
+        """Steady-state spacing between requests once the bucket is empty, in seconds."""
+        return self._cost / self._rate if self._rate else 0.0
+
+    @property
+    def cost(self) -> float:
+        """Estimated budget points charged per request."""
+        return self._cost
+
+    def _refill(self, now: float) -> None:
+        self._tokens += (now - self._updated_at) * self._rate
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Take one request's cost in tokens, waiting for a refill (or a pause to end) if needed."""
+        async with self._lock:
+            delay = self._paused_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if not self._rate:
+                return
+
+            self._refill(time.monotonic())
+            if self._tokens < self._cost:
+                await asyncio.sleep((self._cost - self._tokens) / self._rate)
+                self._refill(time.monotonic())
+            self._tokens -= self._cost
+
+    def update(self, remaining: int, reset_seconds: float) -> None:
+        """Sync the bucket to the server's view of the current window.
+
+        Args:
+            remaining: Budget points remaining in the window
+            reset_seconds: Seconds until the window resets
+        """
+        # The drop since the previous response is what one request cost. A rise
+        # means the window reset, and out-of-order responses can also yield one.
+        if self._last_remaining is not None:
+            spent = self._last_remaining - remaining
+            if spent > 0:
+                if self._cost_sampled:
+                    self._cost += _COST_SMOOTHING * (spent - self._cost)
+                else:
+                    self._cost = float(spent)
+                    self._cost_sampled = True
+        self._last_remaining = remaining
+
+        if remaining <= 0:
+            self.drain(reset_seconds)
+            return
+        self._rate = remaining / reset_seconds
+        self._tokens = float(remaining)
+        self._updated_at = time.monotonic()
+
+    def drain(self, seconds: float) -> None:
+        """Empty the bucket and hold every caller for ``seconds`` (e.g. after HTTP 429).
+
+        Args:
+            seconds: Pause duration
+        """
+        self._tokens = 0.0
+        self._updated_at = time.monotonic()
+        self._paused_until = max(self._paused_until, self._updated_at + seconds)
+
+
+# AIMD concurrency control: grow by one while the API keeps up, halve when it doesn't
+# (the latency target is settings.target_latency_seconds)
+AIMD_WINDOW = 32
+AIMD_MIN_SAMPLES = 8
+
+
+class DynamicSemaphore:
+    """Async semaphore whose capacity can be changed while in use.
+
+    Shrinking never interrupts holders; new acquirers simply wait until the
+    number in use drops below the new capacity.
+
+    Example:
+        >>> sem = DynamicSemaphore(4)
+        >>> async with sem:
+        ...     await sem.set_capacity(2)
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize with ``capacity`` slots.
+
+        Args:
+            capacity: Initial number of concurrent holders allowed
+        """
+        self._capacity = capacity
+        self._in_use = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def capacity(self) -> int:
+        """Current number of concurrent holders allowed."""
+        return self._capacity
+
+    async def acquire(self) -> None:
+        """Wait for a free slot and take it."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_use < self._capacity)
+            self._in_use += 1
+
+    async def release(self) -> None:
+        """Return a slot and wake one waiter."""
+        async with self._cond:
+            self._in_use -= 1
+            self._cond.notify()
+
+    async def set_capacity(self, capacity: int) -> None:
+        """Resize the semaphore, waking waiters if it grew.
+
+        Args:
+            capacity: New number of concurrent holders allowed
+        """
+        async with self._cond:
+            self._capacity = capacity
+            self._cond.notify_all()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.release()
+
+
+# =============================================================================
+# aiohttp Transport
+# =============================================================================
+
+
+@contextmanager
+def _translate_aiohttp_errors() -> Iterator[None]:
+    """Re-raise aiohttp failures as the httpx exceptions the client handles."""
+    import aiohttp
+
+    try:
+        yield
+    except TimeoutError as exc:
+        raise httpx.TimeoutException(f"aiohttp timeout: {exc!r}") from exc
+    except aiohttp.ClientError as exc:
+        raise httpx.NetworkError(f"aiohttp error: {exc!r}") from exc
+
+
+class _AiohttpByteStream(httpx.AsyncByteStream):
+    """Expose an aiohttp response body as an httpx byte stream."""
+
+    def __init__(self, response: "aiohttp.ClientResponse") -> None:
+        self._response = response
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _translate_aiohttp_errors():
+            async for chunk in self._response.content.iter_any():
+                yield chunk
+
+    async def aclose(self) -> None:
+        self._response.release()
+
+
+class _AiohttpClient:
+    """Drop-in for the subset of ``httpx.AsyncClient`` the GraphQL client uses.
+
+    Requests go through aiohttp's C HTTP parser; responses are wrapped in
+    ``httpx.Response`` objects so status, header and body handling is the same
+    for both backends. aiohttp speaks HTTP/1.1 only, so concurrency comes from
+    its keep-alive connection pool rather than HTTP/2 streams.
+
+    Args:
+        limits: Connection pool limits
+        timeout: Timeout configuration
+        headers: Default request headers
+        min_connections: Lower bound on the pool size; HTTP/1.1 needs one
+            connection per in-flight request
+    """
+
+    def __init__(
+        self,
+        limits: httpx.Limits,
+        timeout: httpx.Timeout,
+        headers: httpx.Headers,
+        min_connections: int = 0,
+    ) -> None:
+        import aiohttp
+
+        max_connections = max(limits.max_connections or 0, min_connections)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=max_connections,
+                limit_per_host=max_connections,
+                ttl_dns_cache=300,
+                keepalive_timeout=limits.keepalive_expiry or 15.0,
+            ),
+            timeout=aiohttp.ClientTimeout(
+                connect=timeout.pool,
+                sock_connect=timeout.connect,
+                sock_read=timeout.read,
+            ),
+            headers=headers.multi_items(),
+            # httpx decodes Content-Encoding from the forwarded headers
+            auto_decompress=False,
+        )
+
+    @asynccontextmanager
+    async def stream(
+        self, method: str, url: str, *, content: bytes
+    ) -> AsyncIterator[httpx.Response]:
+        """Send a request and yield its response with the body unread."""
+        with _translate_aiohttp_errors():
+            raw = await self._session.request(method, url, data=content)
+
+        resp = httpx.Response(raw.status, headers=raw.raw_headers, stream=_AiohttpByteStream(raw))
+        try:
+            yield resp
+        finally:
+            await resp.aclose()
+
+    async def post(self, url: str, *, content: bytes) -> httpx.Response:
+        """Send a POST request and read the full response body."""
+        async with self.stream("POST", url, content=content) as resp:
+            await resp.aread()
+        return resp
+
+    async def aclose(self) -> None:
+        """Close the session and its pooled connections."""
+        await self._session.close()
+
+
 # =============================================================================
 # Async GraphQL Client
 # =============================================================================
@@ -280,7 +1017,8 @@ class AsyncGraphQLClient:
     - Connection pooling to reuse TCP connections
     - Keepalive connections for reduced latency
     - Retry logic with exponential backoff
-    - Rate limiting awareness with adaptive delays
+    - Rate limiting awareness with a header-synced token bucket
+    - Adaptive (AIMD) concurrency driven by observed latency
     - Structured error handling
 
     Args:
@@ -301,29 +1039,45 @@ class AsyncGraphQLClient:
         max_concurrency: int | None = None,
         pool_limits: httpx.Limits | None = None,
         timeout: httpx.Timeout | None = None,
+        persisted_queries: bool = False,
     ) -> None:
         """Initialize async GraphQL client.
 
+        HTTP/2 flow control needs no tuning here: httpcore enlarges both the
+        connection window and each stream's receive window by 16 MiB as soon as
+        they open, so multi-megabyte posts pages arrive without WINDOW_UPDATE
+        stalls. A custom transport would only duplicate that.
+
         Args:
             token: API token (defaults to settings.producthunt_token)
             max_concurrency: Max concurrent requests (defaults to settings.max_concurrency)
             pool_limits: Connection pool configuration (defaults to production settings)
             timeout: Timeout configuration (defaults to 30s overall)
+            persisted_queries: Send query hashes instead of query text once a
+                query is registered (Automatic Persisted Queries). Off by
+                default; when on, it is disabled for the rest of the session
+                as soon as the server shows it ignores the hash.
         """
         self._token = token or settings.producthunt_token
         self._max_concurrency = max_concurrency or settings.max_concurrency
-        self._sem = asyncio.Semaphore(self._max_concurrency)
+        self._sem = DynamicSemaphore(self._max_concurrency)
+        self._latencies: deque[float] = deque(maxlen=AIMD_WINDOW)
+        self._target_latency = settings.target_latency_seconds
+        self._samples_since_decrease = AIMD_MIN_SAMPLES
 
         # Rate limit tracking
         self._rate_limit_limit: str | None = None
         self._rate_limit_remaining: str | None = None
         self._rate_limit_reset: str | None = None
+        self._limiter = AdaptiveRateLimiter()
 
-        # Production-grade connection pooling
+        # HTTP/2 multiplexes every in-flight request over one connection, so a
+        # handful of connections is plenty; httpcore opens another only once the
+        # server's SETTINGS_MAX_CONCURRENT_STREAMS is exhausted on the first.
         self._limits = pool_limits or httpx.Limits(
-            max_connections=100,  # Max total connections
-            max_keepalive_connections=20,  # Keep 20 alive for reuse
-            keepalive_expiry=30.0,  # Close idle connections after 30s
+            max_connections=4,  # Spill-over connections beyond the stream limit
+            max_keepalive_connections=4,  # Keep them all warm between pages
+            keepalive_expiry=60.0,  # Outlive pauses between rate-limit windows
         )
 
         # Timeout configuration
@@ -335,26 +1089,54 @@ class AsyncGraphQLClient:
             pool=5.0,  # Getting connection from pool timeout
         )
 
+        # Request headers, built and validated once per client rather than per connection.
+        # Accept-Encoding is left to httpx: it advertises gzip/deflate, plus br and zstd
+        # when brotli/zstandard are installed, so only decodable encodings are requested.
+        self._headers = httpx.Headers(
+            {
+                "Authorization": f"Bearer {self._token}",
+                "Content-Type": "application/json",
+            }
+        )
+
         # Initialize HTTP client (created on first use)
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | _AiohttpClient | None = None
 
-    async def _ensure_client(self) -> httpx.AsyncClient:
+        # Automatic Persisted Queries: queries the server has seen with their hash
+        self._persisted_queries = persisted_queries
+        self._registered_queries: set[str] = set()
+
+        # Viewer info is static for a token; fetched once per client
+        self._viewer: dict[str, Any] | None = None
+        self._viewer_lock = asyncio.Lock()
+
+    async def _ensure_client(self) -> httpx.AsyncClient | _AiohttpClient:
         """Lazy initialization of HTTP client.
 
+        Uses httpx (HTTP/2) unless ``settings.http_backend`` selects aiohttp
+        and it is installed.
+
         Returns:
-            Configured httpx.AsyncClient instance
+            Configured HTTP client instance
         """
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                limits=self._limits,
-                timeout=self._timeout,
-                http2=True,  # Enable HTTP/2 multiplexing
-                follow_redirects=True,
-                headers={
-                    "Authorization": f"Bearer {self._token}",
-                    "Content-Type": "application/json",
-                },
-            )
+            if settings.http_backend == HttpBackend.AIOHTTP and AIOHTTP_AVAILABLE:
+                self._client = _AiohttpClient(
+                    self._limits,
+                    self._timeout,
+                    self._headers,
+                    min_connections=self._max_concurrency,
+                )
+            else:
+                if settings.http_backend == HttpBackend.AIOHTTP:
+                    logger.warning("aiohttp is not installed; falling back to httpx")
+                self._client = httpx.AsyncClient(
+                    limits=self._limits,
+                    timeout=self._timeout,
+                    http2=True,  # Enable HTTP/2 multiplexing
+                    follow_redirects=True,
+                    headers=self._headers,
+                )
         return self._client
 
     async def __aenter__(self) -> "AsyncGraphQLClient":
@@ -398,34 +1180,16 @@ class AsyncGraphQLClient:
             "reset": self._rate_limit_reset,
         }
 
-    async def _do_http_post(
-        self,
-        query: str,
-        variables: dict[str, Any],
-    ) -> dict[str, Any]:
-        """Perform raw HTTP POST with error handling.
+    def _check_response(self, resp: httpx.Response) -> None:
+        """Record rate limit headers and classify the HTTP status of a response.
 
         Args:
-            query: GraphQL query string
-            variables: Query variables
-
-        Returns:
-            Parsed JSON data field from response
+            resp: HTTP response (body must be loaded if the status is not 200)
 
         Raises:
-            TransientGraphQLError: For retryable failures
-            RuntimeError: For permanent GraphQL errors
+            TransientGraphQLError: For HTTP 429 and 5xx responses
+            RuntimeError: For other non-200 responses
         """
-        client = await self._ensure_client()
-
-        try:
-            resp = await client.post(
-                settings.graphql_endpoint,
-                json={"query": query, "variables": variables},
-            )
-        except (httpx.TimeoutException, httpx.NetworkError) as exc:
-            raise TransientGraphQLError(f"Network/timeout error: {exc}") from exc
-
         # Extract rate limit information
         self._rate_limit_limit = resp.headers.get("X-RateLimit-Limit")
         self._rate_limit_remaining = resp.headers.get("X-RateLimit-Remaining")
@@ -435,28 +1199,90 @@ class AsyncGraphQLClient:
         if self._rate_limit_remaining:
             try:
                 remaining = int(self._rate_limit_remaining)
-                limit = int(self._rate_limit_limit) if self._rate_limit_limit else "?"
 
                 if remaining < 10:
+                    limit = self._rate_limit_limit or "?"
                     logger.warning(
                         f"⚠️ Rate limit low: {remaining}/{limit} remaining "
                         f"(resets at {self._rate_limit_reset or 'unknown'})"
                     )
+
+                reset_seconds = _seconds_until_reset(self._rate_limit_reset)
+                if reset_seconds is not None:
+                    self._limiter.update(remaining, reset_seconds)
             except (ValueError, TypeError):
                 pass
 
+        # Hold every in-flight caller until the window resets
+        if resp.status_code == 429:
+            reset_seconds = _seconds_until_reset(
+                resp.headers.get("Retry-After") or self._rate_limit_reset
+            )
+            if reset_seconds is not None:
+                self._limiter.drain(reset_seconds)
+                raise RateLimitedError(f"HTTP 429 (resets in {reset_seconds:.0f}s)")
+
         # Handle non-200 status codes
         if resp.status_code != 200 and (resp.status_code == 429 or 500 <= resp.status_code < 600):
             reset_info = f" (resets at {self._rate_limit_reset})" if resp.status_code == 429 else ""
             raise TransientGraphQLError(f"HTTP {resp.status_code}{reset_info}")
 
         if resp.status_code != 200:
+            if resp.status_code in (401, 403):
+                self._viewer = None
             logger.error(f"Non-retryable HTTP {resp.status_code}: {resp.text[:200]}")
             raise RuntimeError(f"HTTP {resp.status_code}")
 
+    async def _do_http_post(
+        self,
+        query: str,
+        variables: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Perform raw HTTP POST with error handling.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            Parsed JSON data field from response
+
+        Raises:
+            TransientGraphQLError: For retryable failures
+            RuntimeError: For permanent GraphQL errors
+        """
+        client = await self._ensure_client()
+
+        hash_only = self._persisted_queries and query in self._registered_queries
+        if self._persisted_queries:
+            content = encode_persisted_query_request(query, variables, include_query=not hash_only)
+        else:
+            content = encode_graphql_request(query, variables)
+
+        start = time.monotonic()
+        try:
+            resp = await client.post(settings.graphql_endpoint, content=content)
+        except (httpx.TimeoutException, httpx.NetworkError) as exc:
+            await self._adjust_concurrency(time.monotonic() - start, overloaded=True)
+            raise TransientGraphQLError(f"Network/timeout error: {exc}") from exc
+
+        elapsed = time.monotonic() - start
+        if hash_only:
+            supported = _persisted_query_miss(resp)
+            if supported is not None:
+                # The query did not run, so this is no latency sample
+                raise _PersistedQueryMiss(supported)
+
+        await self._adjust_concurrency(
+            elapsed,
+            overloaded=resp.status_code == 429 or resp.status_code >= 500,
+        )
+
+        self._check_response(resp)
+
         # Parse response
         try:
-            body = resp.json()
+            body = _decode_response(resp)
         except Exception as exc:
             raise TransientGraphQLError(f"Invalid JSON: {exc}") from exc
 
@@ -465,8 +1291,52 @@ class AsyncGraphQLClient:
             logger.error(f"GraphQL errors: {body['errors']}")
             raise RuntimeError(f"GraphQL errors: {body['errors']}")
 
+        if self._persisted_queries:
+            self._registered_queries.add(query)
+
         return body.get("data", {})
 
+    async def _adjust_concurrency(self, elapsed: float, overloaded: bool) -> None:
+        """Feed one request's outcome into the AIMD concurrency controller.
+
+        Concurrency grows by one while mean latency over the recent window
+        stays within target, and halves on overload (429, 5xx, timeouts) or
+        once the window's mean latency exceeds the target. At most one
+        decrease happens per window: responses to requests that were already
+        in flight when capacity was cut don't cut it again until
+        ``AIMD_MIN_SAMPLES`` fresh samples have arrived.
+
+        Args:
+            elapsed: Request latency in seconds
+            overloaded: Whether the API signalled overload
+        """
+        self._latencies.append(elapsed)
+        self._samples_since_decrease += 1
+        capacity = self._sem.capacity
+
+        slow = (
+            len(self._latencies) >= AIMD_MIN_SAMPLES
+            and sum(self._latencies) / len(self._latencies) > self._target_latency
+        )
+        if overloaded or slow:
+            if self._samples_since_decrease < AIMD_MIN_SAMPLES:
+                return
+            # Judge the reduced concurrency on fresh samples only
+            self._latencies.clear()
+            self._samples_since_decrease = 0
+            new_capacity = max(1, capacity // 2)
+        else:
+            new_capacity = min(self._max_concurrency, capacity + 1)
+
+        if new_capacity != capacity:
+            await self._sem.set_capacity(new_capacity)
+
+    def _disable_persisted_queries(self) -> None:
+        """Send full query text for the rest of the session."""
+        logger.info("Persisted queries not supported by server; sending full queries")
+        self._persisted_queries = False
+        self._registered_queries.clear()
+
     async def _post_with_retry(
         self,
         query: str,
@@ -481,36 +1351,37 @@ class AsyncGraphQLClient:
         Returns:
             Parsed data from response
         """
-        # Create logging bridge for tenacity
-        logging_logger = logging.getLogger(__name__)
-
-        @retry(
-            reraise=True,
-            stop=stop_after_attempt(20),
-            wait=wait_exponential(multiplier=3, min=5, max=120) + wait_random(0, 5),
-            retry=retry_if_exception_type(TransientGraphQLError),
-            before_sleep=before_sleep_log(logging_logger, logging.WARNING),
-        )
-        async def _runner() -> dict[str, Any]:
-            async with self._sem:
-                # Adaptive delay based on rate limit
-                if self._rate_limit_remaining:
-                    try:
-                        remaining = int(self._rate_limit_remaining)
-                        if remaining < 5:
-                            await asyncio.sleep(5.0)
-                        elif remaining < 20:
-                            await asyncio.sleep(3.0)
-                        else:
-                            await asyncio.sleep(2.0)
-                    except (ValueError, TypeError):
-                        await asyncio.sleep(2.0)
-                else:
-                    await asyncio.sleep(2.0)
+        return await _RETRYING.copy()(self._send_once, query, variables)
 
-                return await self._do_http_post(query, variables)
+    async def _send_once(
+        self,
+        query: str,
+        variables: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Send a single request under the concurrency semaphore and rate limiter.
 
-        return await _runner()
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            Parsed data from response
+        """
+        async with self._sem:
+            await self._limiter.acquire()
+            try:
+                return await self._do_http_post(query, variables)
+            except _PersistedQueryMiss as miss:
+                self._registered_queries.discard(query)
+                supported = miss.supported
+
+            # The full-text resend is a request of its own for the rate limiter
+            await self._limiter.acquire()
+            data = await self._do_http_post(query, variables)
+            # The full query ran where its hash did not, so the hash was ignored
+            if not supported:
+                self._disable_persisted_queries()
+            return data
 
     async def fetch_posts_page(
         self,
@@ -518,14 +1389,19 @@ class AsyncGraphQLClient:
         posted_after_dt: datetime | str | None = None,
         first: int | None = None,
         order: PostsOrder | None = None,
+        fields: PostFieldSet = PostFieldSet.FULL,
     ) -> dict[str, Any]:
         """Fetch a page of posts with OpenTelemetry tracing and Prometheus metrics.
 
+        When neither OpenTelemetry nor prometheus_client is installed the page is
+        fetched directly, without building span attributes or timing the call.
+
         Args:
             after_cursor: Pagination cursor from previous page
             posted_after_dt: Filter posts created after this datetime (datetime or ISO string)
             first: Page size (defaults to settings.page_size)
             order: Post ordering (defaults to NEWEST)
+            fields: Field selection (MINIMAL skips nested objects for smaller payloads)
 
         Returns:
             Posts object with nodes and pageInfo
@@ -535,96 +1411,161 @@ class AsyncGraphQLClient:
             >>> for post in posts['nodes']:
             ...     print(f"{post['name']}: {post['votesCount']} votes")
         """
-        first = first or settings.page_size
-        order = order or PostsOrder.NEWEST
+        variables = {
+            "first": first or settings.page_size,
+            "after": after_cursor,
+            "order": _POSTS_ORDER_VALUES[order or PostsOrder.NEWEST],
+            "postedAfter": _format_posted_after(posted_after_dt),
+        }
+
+        if not INSTRUMENTATION_ENABLED:
+            data = await self._post_with_retry(build_posts_query(fields), variables)
+            return data.get("posts", {})
 
-        # Start tracing span if telemetry is available
-        span_context = None
-        if TELEMETRY_AVAILABLE and tracer:
-            span_context = tracer.start_as_current_span("graphql.fetch_posts_page")
-            span = span_context.__enter__()
+        return await self._fetch_posts_page_instrumented(variables, fields)
+
+    async def _fetch_posts_page_instrumented(
+        self,
+        variables: dict[str, Any],
+        fields: PostFieldSet,
+    ) -> dict[str, Any]:
+        """Fetch a posts page inside a span, recording query metrics.
+
+        Args:
+            variables: Posts query variables
+            fields: Field selection to request for each post node
+
+        Returns:
+            Posts object with nodes and pageInfo
+        """
+        start_ns = time.perf_counter_ns()
+
+        # Exceptions are recorded explicitly below, so the span must not record them again
+        with tracer.start_as_current_span(
+            "graphql.fetch_posts_page", record_exception=False, set_status_on_exception=False
+        ) as span:
             add_span_attributes(
                 span,
                 {
                     "query_type": "posts",
-                    "page_size": first,
-                    "order": order.value,
-                    "has_cursor": after_cursor is not None,
-                    "has_date_filter": posted_after_dt is not None,
+                    "page_size": variables["first"],
+                    "order": variables["order"],
+                    "fields": fields.value,
+                    "has_cursor": variables["after"] is not None,
+                    "has_date_filter": variables["postedAfter"] is not None,
                 },
             )
 
-        # Start timing for metrics
-        start_time = time.time() if METRICS_AVAILABLE else None
-
-        try:
-            # Handle both string and datetime inputs for posted_after_dt
-            posted_after_str = None
-            if posted_after_dt:
-                if isinstance(posted_after_dt, str):
-                    posted_after_str = posted_after_dt
-                else:
-                    posted_after_str = format_iso(posted_after_dt)
+            try:
+                data = await self._post_with_retry(build_posts_query(fields), variables)
+                result = data.get("posts", {})
 
-            variables = {
-                "first": first,
-                "after": after_cursor,
-                "order": order.value,
-                "postedAfter": posted_after_str,
-            }
+                # Record success metrics
+                _posts_queries_success.inc()
+                _posts_duration_success.observe((time.perf_counter_ns() - start_ns) * 1e-9)
 
-            data = await self._post_with_retry(QUERY_POSTS_PAGE, variables)
-            result = data.get("posts", {})
-
-            # Record success metrics
-            if METRICS_AVAILABLE:
-                graphql_queries_total.labels(query_type="posts", status="success").inc()
-                if start_time:
-                    duration = time.time() - start_time
-                    graphql_request_duration_seconds.labels(
-                        query_type="posts", status="success"
-                    ).observe(duration)
-
-            # Add result attributes to span
-            if TELEMETRY_AVAILABLE and span_context:
-                nodes_count = len(result.get("nodes", []))
+                # Add result attributes to span
                 add_span_attributes(
                     span,
                     {
-                        "result.nodes_count": nodes_count,
+                        "result.nodes_count": len(result.get("nodes", [])),
                         "result.has_next_page": result.get("pageInfo", {}).get(
                             "hasNextPage", False
                         ),
                     },
                 )
 
-            return result
+                return result
 
-        except Exception as exc:
-            # Record error metrics
-            if METRICS_AVAILABLE:
-                graphql_queries_total.labels(query_type="posts", status="error").inc()
+            except Exception as exc:
+                # Record error metrics
+                _posts_queries_error.inc()
                 errors_total.labels(error_type=type(exc).__name__, component="api").inc()
-                if start_time:
-                    duration = time.time() - start_time
-                    graphql_request_duration_seconds.labels(
-                        query_type="posts", status="error"
-                    ).observe(duration)
-
-            # Record exception in span
-            if TELEMETRY_AVAILABLE and span_context:
+                _posts_duration_error.observe((time.perf_counter_ns() - start_ns) * 1e-9)
+
+                # Record exception in span
                 record_exception_in_span(span, exc)
 
-            raise
+                raise
+
+    async def iter_posts_pages(
+        self,
+        posted_after_dt: datetime | str | None = None,
+        first: int | None = None,
+        order: PostsOrder | None = None,
+        fields: PostFieldSet = PostFieldSet.FULL,
+        max_pages: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Walk posts pages, prefetching the next page while the caller works.
+
+        As soon as a page arrives, the request for the page after it is started
+        in the background before the page is yielded, so the network round-trip
+        overlaps the caller's processing instead of following it. Cursors are
+        opaque and chained, so only one page can be in flight ahead.
+
+        Iteration stops after the last page, after a page with no nodes, or
+        after ``max_pages`` pages. Errors are raised when the failing page is
+        requested.
+
+        Args:
+            posted_after_dt: Filter posts created after this datetime (datetime or ISO string)
+            first: Page size (defaults to settings.page_size)
+            order: Post ordering (defaults to NEWEST)
+            fields: Field selection to request for each post node
+            max_pages: Maximum pages to fetch (None for unlimited)
+
+        Yields:
+            Posts objects with nodes and pageInfo
+
+        Example:
+            >>> async for page in client.iter_posts_pages(max_pages=10):
+            ...     print(len(page['nodes']))
+        """
 
+        def fetch(cursor: str | None) -> asyncio.Task[dict[str, Any]]:
+            return asyncio.create_task(
+                self.fetch_posts_page(
+                    after_cursor=cursor,
+                    posted_after_dt=posted_after_dt,
+                    first=first,
+                    order=order,
+                    fields=fields,
+                )
+            )
+
+        pending: asyncio.Task[dict[str, Any]] | None = fetch(None)
+        pages = 0
+        try:
+            while pending is not None:
+                page = await pending
+                pages += 1
+                page_info = page.get("pageInfo", {})
+
+                pending = None
+                if (
+                    page.get("nodes")
+                    and page_info.get("hasNextPage", False)
+                    and not (max_pages and pages >= max_pages)
+                ):
+                    pending = fetch(page_info.get("endCursor"))
+
+                yield page
         finally:
-            # Close span
-            if TELEMETRY_AVAILABLE and span_context:
-                span_context.__exit__(None, None, None)
+            # The caller stopped early: drop the speculative request
+            if pending is not None:
+                pending.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await pending
 
-    async def fetch_viewer(self) -> dict[str, Any]:
+    async def fetch_viewer(self, *, force: bool = False) -> dict[str, Any]:
         """Fetch authenticated viewer information.
 
+        The viewer is cached for the lifetime of the client; concurrent callers
+        share one request. The cache is dropped on HTTP 401/403.
+
+        Args:
+            force: Bypass the cache and refetch
+
         Returns:
             Viewer object with user data
 
@@ -632,8 +1573,14 @@ class AsyncGraphQLClient:
             >>> viewer = await client.fetch_viewer()
             >>> print(f"Logged in as: {viewer['user']['username']}")
         """
-        data = await self._post_with_retry(QUERY_VIEWER, {})
-        return data.get("viewer", {})
+        if not force and self._viewer:
+            return self._viewer
+
+        async with self._viewer_lock:
+            if force or not self._viewer:
+                data = await self._post_with_retry(QUERY_VIEWER, {})
+                self._viewer = data.get("viewer", {})
+            return self._viewer
 
     async def fetch_topics_page(
         self,
@@ -694,13 +1641,64 @@ class AsyncGraphQLClient:
         return data.get("collections", {})
 
 
+# =============================================================================
+# Shared Client
+# =============================================================================
+
+# One client per event loop: httpx connections are bound to the loop that
+# opened them, so a client cannot outlive or be shared across loops.
+_shared_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGraphQLClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_client() -> AsyncGraphQLClient:
+    """Get the process-wide client for the running event loop.
+
+    Successive syncs in the same loop reuse one warm HTTP/2 connection (and
+    its HPACK table, rate limit state and registered persisted queries)
+    instead of paying a fresh TCP+TLS+HTTP/2 handshake each time.
+
+    Returns:
+        Shared AsyncGraphQLClient, created on first use
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+
+    Example:
+        >>> client = get_shared_client()
+        >>> viewer = await client.fetch_viewer()
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None:
+        client = _shared_clients[loop] = AsyncGraphQLClient()
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close and forget the shared client of the running event loop, if any."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
 # =============================================================================
 # Export Public API
 # =============================================================================
 
 __all__ = [
+    "AdaptiveRateLimiter",
     "AsyncGraphQLClient",
+    "DynamicSemaphore",
+    "PostFieldSet",
+    "RateLimitedError",
     "TransientGraphQLError",
+    "build_posts_query",
+    "close_shared_client",
+    "encode_graphql_request",
+    "encode_persisted_query_request",
+    "get_shared_client",
     "QUERY_POSTS_PAGE",
     "QUERY_VIEWER",
     "QUERY_TOPICS_PAGE",
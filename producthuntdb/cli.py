@@ -17,18 +17,32 @@ Example:
 """
 
 import asyncio
+import io
 import sys
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
 import typer
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
 
-from producthuntdb.config import settings
-from producthuntdb.io import DatabaseManager, KaggleManager
-from producthuntdb.pipeline import DataPipeline
+from producthuntdb import config
+
+# The pipeline, database and Kaggle stacks are imported inside the commands
+# that use them, so `--help`, `health-check` and the migration commands start fast
+if TYPE_CHECKING:
+    from producthuntdb.io import DatabaseManager
+
+# uvloop event loop (optional - falls back to the default asyncio loop if not installed)
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Initialize CLI app
 app = typer.Typer(
@@ -65,13 +79,128 @@ def setup_logging(verbose: bool = False) -> None:
 def run_async(coro):
     """Run async coroutine in event loop.
 
+    Uses a uvloop event loop when uvloop is installed. The shared API client
+    (and its pooled HTTP/2 connection) lives for the whole run and is closed
+    before the loop shuts down.
+
     Args:
         coro: Coroutine to run
 
     Returns:
         Result of coroutine execution
     """
-    return asyncio.run(coro)
+    from producthuntdb.api import close_shared_client
+
+    async def _run() -> Any:
+        try:
+            return await coro
+        finally:
+            await close_shared_client()
+
+    if UVLOOP_AVAILABLE:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(_run())
+    return asyncio.run(_run())
+
+
+def print_table(
+    title: str,
+    rows: list[tuple[str, Any]],
+    columns: tuple[str, str] | None = None,
+    value_style: str = "green",
+    justify: Literal["left", "right"] = "left",
+) -> None:
+    """Print two-column rows as a Rich table, or as plain text when piped.
+
+    When stdout is not a terminal (CI logs, pipes) the rows are written as
+    tab-separated lines, skipping Rich's layout pass and keeping the output
+    easy to parse.
+
+    Args:
+        title: Table title
+        rows: (key, value) pairs; integer values get thousands separators in the table
+        columns: Column headers, or None to hide the header row
+        value_style: Rich style for the value column
+        justify: Alignment of the value column
+    """
+    if not console.is_terminal:
+        lines = "".join(f"{key}\t{value}\n" for key, value in rows)
+        sys.stdout.write(f"{title}\n{lines}\n")
+        return
+
+    table = Table(title=title, show_header=columns is not None)
+    key_header, value_header = columns or ("Key", "Value")
+    table.add_column(key_header, style="cyan")
+    table.add_column(value_header, justify=justify, style=value_style)
+    for key, value in rows:
+        table.add_row(key, f"{value:,}" if isinstance(value, int) else str(value))
+
+    console.print(table)
+    console.print()
+
+
+def get_db(ctx: typer.Context) -> "DatabaseManager":
+    """Get the DatabaseManager shared by this CLI invocation.
+
+    The manager is created and initialized on first use, stored on the root
+    context's ``obj``, and closed when the invocation finishes, so commands
+    that need the database open and configure it exactly once.
+
+    Args:
+        ctx: Typer context of the running command
+
+    Returns:
+        Initialized DatabaseManager
+    """
+    root = ctx.find_root()
+    if root.obj is None:
+        root.obj = {}
+
+    db = root.obj.get("db")
+    if db is None:
+        from producthuntdb.io import DatabaseManager
+
+        db = DatabaseManager()
+        db.initialize()
+        root.obj["db"] = db
+        root.call_on_close(db.close)
+    return db
+
+
+@lru_cache(maxsize=1)
+def _alembic_config() -> Any:
+    """Load alembic.ini once per process.
+
+    Returns:
+        Alembic Config for the project
+    """
+    from alembic.config import Config
+
+    return Config("alembic.ini")
+
+
+def run_alembic(command_name: str, *args: Any, **kwargs: Any) -> str:
+    """Run an Alembic command in-process.
+
+    Avoids spawning a fresh interpreter (and re-importing Alembic and the
+    models) for every migration command.
+
+    Args:
+        command_name: Name of the ``alembic.command`` function to call
+        *args: Positional arguments after the config
+        **kwargs: Keyword arguments for the command
+
+    Returns:
+        Output the command printed
+    """
+    from alembic import command
+
+    cfg = _alembic_config()
+    output = io.StringIO()
+    cfg.stdout = output
+    with redirect_stdout(output):
+        getattr(command, command_name)(cfg, *args, **kwargs)
+    return output.getvalue()
 
 
 # =============================================================================
@@ -108,6 +237,11 @@ def sync(
         "--collections-only",
         help="Only sync collections",
     ),
+    counts_only: bool = typer.Option(
+        False,
+        "--counts-only",
+        help="Only refresh vote and comment counts of stored posts",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -131,6 +265,9 @@ def sync(
         # Sync only posts (for testing)
         $ producthuntdb sync --posts-only --max-pages 5
 
+        # Refresh vote and comment counts of the newest stored posts
+        $ producthuntdb sync --counts-only --max-pages 20
+
         # Verbose output
         $ producthuntdb sync -v
     """
@@ -139,23 +276,26 @@ def sync(
     console.print("🚀 [bold cyan]ProductHuntDB Sync[/bold cyan]\n")
 
     # Show configuration
-    console.print(f"📍 Database: [yellow]{settings.database_path}[/yellow]")
-    console.print(f"🔑 API Token: [yellow]{settings.redact_token()}[/yellow]")
-    console.print(f"⚡ Concurrency: [yellow]{settings.max_concurrency}[/yellow]")
-    console.print(f"📄 Page Size: [yellow]{settings.page_size}[/yellow]")
+    console.print(f"📍 Database: [yellow]{config.settings.database_path}[/yellow]")
+    console.print(f"🔑 API Token: [yellow]{config.settings.redact_token()}[/yellow]")
+    console.print(f"⚡ Concurrency: [yellow]{config.settings.max_concurrency}[/yellow]")
+    console.print(f"📄 Page Size: [yellow]{config.settings.page_size}[/yellow]")
 
     if full_refresh:
         console.print("🔄 Mode: [bold yellow]Full Refresh[/bold yellow]")
     else:
         console.print(
             "🔄 Mode: [bold green]Incremental Update[/bold green] "
-            f"(safety margin: {settings.safety_minutes} minutes)"
+            f"(safety margin: {config.settings.safety_minutes} minutes)"
         )
 
     console.print()
 
     async def _sync():
-        pipeline = DataPipeline()
+        from producthuntdb.api import get_shared_client
+        from producthuntdb.pipeline import DataPipeline
+
+        pipeline = DataPipeline(client=get_shared_client())
 
         try:
             await pipeline.initialize()
@@ -181,6 +321,12 @@ def sync(
                     f"\n✅ [bold green]Synced {stats['collections']} collections[/bold green]"
                 )
 
+            elif counts_only:
+                stats = await pipeline.refresh_post_counts(max_pages)
+                console.print(
+                    f"\n✅ [bold green]Refreshed counts of {stats['posts']} posts[/bold green]"
+                )
+
             else:
                 # Sync all
                 stats = await pipeline.sync_all(full_refresh, max_pages)
@@ -206,6 +352,17 @@ def export(
         "-o",
         help="Directory to write CSV files (defaults to ./data/export)",
     ),
+    compress: bool = typer.Option(
+        False,
+        "--compress",
+        "-z",
+        help="Write gzip-compressed .csv.gz files",
+    ),
+    snapshot: bool = typer.Option(
+        True,
+        "--snapshot/--no-snapshot",
+        help="Export from a backup-API snapshot so a running sync is not blocked",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -225,20 +382,28 @@ def export(
 
         # Export to custom directory
         $ producthuntdb export --output-dir /path/to/output
+
+        # Export gzip-compressed CSV files
+        $ producthuntdb export --compress
+
+        # Read the live database directly (no sync running)
+        $ producthuntdb export --no-snapshot
     """
     setup_logging(verbose)
 
     console.print("📦 [bold cyan]ProductHuntDB Export[/bold cyan]\n")
 
-    # Use settings.export_dir if output_dir not provided
-    output_path = output_dir or settings.export_dir
+    # Use config.settings.export_dir if output_dir not provided
+    output_path = output_dir or config.settings.export_dir
 
-    console.print(f"📍 Database: [yellow]{settings.database_path}[/yellow]")
+    console.print(f"📍 Database: [yellow]{config.settings.database_path}[/yellow]")
     console.print(f"📂 Output: [yellow]{output_path}[/yellow]\n")
 
     try:
+        from producthuntdb.io import KaggleManager
+
         km = KaggleManager()
-        km.export_database_to_csv(output_path)
+        km.export_database_to_csv(output_path, compress=compress, snapshot=snapshot)
 
         console.print(f"\n✅ [bold green]Exported to {output_path}[/bold green]")
 
@@ -291,14 +456,14 @@ def publish(
 
     console.print("📤 [bold cyan]ProductHuntDB Kaggle Publish[/bold cyan]\n")
 
-    if not settings.kaggle_username or not settings.kaggle_key:
+    if not config.settings.kaggle_username or not config.settings.kaggle_key:
         console.print(
             "❌ [bold red]Kaggle credentials not configured![/bold red]\n"
             "Please set KAGGLE_USERNAME and KAGGLE_KEY environment variables."
         )
         raise typer.Exit(code=1)
 
-    if not settings.kaggle_dataset_slug:
+    if not config.settings.kaggle_dataset_slug:
         console.print(
             "❌ [bold red]Kaggle dataset slug not configured![/bold red]\n"
             "Please set KAGGLE_DATASET_SLUG in configuration."
@@ -306,6 +471,8 @@ def publish(
         raise typer.Exit(code=1)
 
     try:
+        from producthuntdb.io import KaggleManager
+
         km = KaggleManager()
 
         # If no data directory specified, export first
@@ -315,13 +482,13 @@ def publish(
             km.export_database_to_csv(data_dir)
 
         console.print(f"📂 Data Directory: [yellow]{data_dir}[/yellow]")
-        console.print(f"🏷️  Dataset: [yellow]{settings.kaggle_dataset_slug}[/yellow]\n")
+        console.print(f"🏷️  Dataset: [yellow]{config.settings.kaggle_dataset_slug}[/yellow]\n")
 
         km.publish_dataset(data_dir, title, description)
 
         console.print(
             f"\n✅ [bold green]Published to Kaggle: "
-            f"https://www.kaggle.com/datasets/{settings.kaggle_dataset_slug}[/bold green]"
+            f"https://www.kaggle.com/datasets/{config.settings.kaggle_dataset_slug}[/bold green]"
         )
 
     except Exception as e:
@@ -331,6 +498,7 @@ def publish(
 
 @app.command()
 def status(
+    ctx: typer.Context,
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -351,44 +519,43 @@ def status(
     console.print("📊 [bold cyan]ProductHuntDB Status[/bold cyan]\n")
 
     try:
-        db = DatabaseManager()
-        db.initialize()
+        from producthuntdb.pipeline import DataPipeline
 
-        # Configuration
-        config_table = Table(title="Configuration", show_header=False)
-        config_table.add_column("Key", style="cyan")
-        config_table.add_column("Value", style="yellow")
+        db = get_db(ctx)
 
-        config_table.add_row("Database Path", str(settings.database_path))
-        config_table.add_row("GraphQL Endpoint", settings.graphql_endpoint)
-        config_table.add_row("API Token", settings.redact_token())
-        config_table.add_row("Max Concurrency", str(settings.max_concurrency))
-        config_table.add_row("Page Size", str(settings.page_size))
-        config_table.add_row("Safety Margin", f"{settings.safety_minutes} minutes")
-
-        if settings.kaggle_dataset_slug:
-            config_table.add_row("Kaggle Dataset", settings.kaggle_dataset_slug)
-
-        console.print(config_table)
-        console.print()
+        # Configuration
+        config_rows = [
+            ("Database Path", str(config.settings.database_path)),
+            ("GraphQL Endpoint", config.settings.graphql_endpoint),
+            ("API Token", config.settings.redact_token()),
+            ("Max Concurrency", str(config.settings.max_concurrency)),
+            ("Page Size", str(config.settings.page_size)),
+            ("Safety Margin", f"{config.settings.safety_minutes} minutes"),
+        ]
+        if config.settings.kaggle_dataset_slug:
+            config_rows.append(("Kaggle Dataset", config.settings.kaggle_dataset_slug))
+
+        print_table("Configuration", config_rows, value_style="yellow")
 
         # Database statistics
         pipeline = DataPipeline(db=db)
         stats = pipeline.get_statistics()
 
-        stats_table = Table(title="Database Statistics")
-        stats_table.add_column("Entity", style="cyan")
-        stats_table.add_column("Count", justify="right", style="green")
-
-        stats_table.add_row("Posts", f"{stats['posts']:,}")
-        stats_table.add_row("Users", f"{stats['users']:,}")
-        stats_table.add_row("Topics", f"{stats['topics']:,}")
-        stats_table.add_row("Collections", f"{stats['collections']:,}")
-        stats_table.add_row("Comments", f"{stats['comments']:,}")
-        stats_table.add_row("Votes", f"{stats['votes']:,}")
-
-        console.print(stats_table)
-        console.print()
+        stats_rows = [
+            ("Posts", stats["posts"]),
+            ("Users", stats["users"]),
+            ("Topics", stats["topics"]),
+            ("Collections", stats["collections"]),
+            ("Comments", stats["comments"]),
+            ("Votes", stats["votes"]),
+        ]
+        print_table(
+            "Database Statistics",
+            stats_rows,
+            columns=("Entity", "Count"),
+            value_style="green",
+            justify="right",
+        )
 
         # Crawl state
         posts_state = db.get_crawl_state("posts")
@@ -397,8 +564,6 @@ def status(
         else:
             console.print("📅 No sync history found")
 
-        db.close()
-
     except Exception as e:
         console.print(f"\n❌ [bold red]Status failed: {e}[/bold red]")
         raise typer.Exit(code=1)
@@ -425,11 +590,14 @@ def verify(
 
     console.print("🔐 [bold cyan]ProductHuntDB Authentication[/bold cyan]\n")
 
-    console.print(f"🌐 Endpoint: [yellow]{settings.graphql_endpoint}[/yellow]")
-    console.print(f"🔑 Token: [yellow]{settings.redact_token()}[/yellow]\n")
+    console.print(f"🌐 Endpoint: [yellow]{config.settings.graphql_endpoint}[/yellow]")
+    console.print(f"🔑 Token: [yellow]{config.settings.redact_token()}[/yellow]\n")
 
     async def _verify():
-        pipeline = DataPipeline()
+        from producthuntdb.api import get_shared_client
+        from producthuntdb.pipeline import DataPipeline
+
+        pipeline = DataPipeline(client=get_shared_client())
 
         try:
             await pipeline.initialize()
@@ -470,6 +638,7 @@ def verify(
 
 @app.command()
 def init(
+    ctx: typer.Context,
     force: bool = typer.Option(
         False,
         "--force",
@@ -501,28 +670,25 @@ def init(
 
     try:
         # Check if database exists
-        db_path = Path(str(settings.database_path))
+        db_path = Path(str(config.settings.database_path))
         if db_path.exists() and not force:
             console.print(
-                f"⚠️  Database already exists at {settings.database_path}\n"
+                f"⚠️  Database already exists at {config.settings.database_path}\n"
                 "Use --force to recreate it."
             )
             return
 
         # Initialize database
-        db = DatabaseManager()
-        db.initialize()
+        get_db(ctx)
 
-        console.print(f"✅ Database created at [yellow]{settings.database_path}[/yellow]")
+        console.print(f"✅ Database created at [yellow]{config.settings.database_path}[/yellow]")
 
         # Show configuration
         console.print("\n📋 Configuration:")
-        console.print(f"  • GraphQL Endpoint: {settings.graphql_endpoint}")
-        console.print(f"  • Max Concurrency: {settings.max_concurrency}")
-        console.print(f"  • Page Size: {settings.page_size}")
-        console.print(f"  • Safety Margin: {settings.safety_minutes} minutes")
-
-        db.close()
+        console.print(f"  • GraphQL Endpoint: {config.settings.graphql_endpoint}")
+        console.print(f"  • Max Concurrency: {config.settings.max_concurrency}")
+        console.print(f"  • Page Size: {config.settings.page_size}")
+        console.print(f"  • Safety Margin: {config.settings.safety_minutes} minutes")
 
         console.print("\n✅ [bold green]Initialization complete![/bold green]")
         console.print("\nNext steps:")
@@ -572,42 +738,27 @@ def migrate(
         # Create empty migration (manual editing required)
         $ producthuntdb migrate --no-autogenerate --message "custom changes"
     """
-    import subprocess
-
     setup_logging(verbose)
 
     console.print("🔧 [bold cyan]Creating Database Migration[/bold cyan]\n")
 
     try:
-        # Build alembic command
-        cmd = ["uv", "run", "alembic", "revision"]
-
+        message = message or "Auto-generated migration"
+        cmd = "alembic revision"
         if autogenerate:
-            cmd.append("--autogenerate")
-
-        if message:
-            cmd.extend(["-m", message])
-        else:
-            cmd.extend(["-m", "Auto-generated migration"])
-
-        console.print(f"📝 Command: [yellow]{' '.join(cmd)}[/yellow]\n")
+            cmd += " --autogenerate"
+        console.print(f"📝 Command: [yellow]{cmd} -m {message}[/yellow]\n")
 
-        # Run alembic revision
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        output = run_alembic("revision", message=message, autogenerate=autogenerate)
 
-        if result.stdout:
-            console.print(result.stdout)
+        if output:
+            console.print(output)
 
         console.print("\n✅ [bold green]Migration created successfully![/bold green]")
         console.print("\n💡 Next steps:")
         console.print("  1. Review the migration file in alembic/versions/")
         console.print("  2. Run: producthuntdb upgrade")
 
-    except subprocess.CalledProcessError as e:
-        console.print(f"\n❌ [bold red]Migration creation failed![/bold red]")
-        if e.stderr:
-            console.print(f"Error: {e.stderr}")
-        raise typer.Exit(code=1)
     except Exception as e:
         console.print(f"\n❌ [bold red]Migration creation failed: {e}[/bold red]")
         raise typer.Exit(code=1)
@@ -638,29 +789,20 @@ def upgrade(
         # Upgrade to specific revision
         $ producthuntdb upgrade abc123
     """
-    import subprocess
-
     setup_logging(verbose)
 
     console.print("⬆️  [bold cyan]Upgrading Database[/bold cyan]\n")
 
     try:
-        cmd = ["uv", "run", "alembic", "upgrade", revision]
-
-        console.print(f"📝 Command: [yellow]{' '.join(cmd)}[/yellow]\n")
+        console.print(f"📝 Command: [yellow]alembic upgrade {revision}[/yellow]\n")
 
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        output = run_alembic("upgrade", revision)
 
-        if result.stdout:
-            console.print(result.stdout)
+        if output:
+            console.print(output)
 
         console.print(f"\n✅ [bold green]Database upgraded to {revision}![/bold green]")
 
-    except subprocess.CalledProcessError as e:
-        console.print(f"\n❌ [bold red]Upgrade failed![/bold red]")
-        if e.stderr:
-            console.print(f"Error: {e.stderr}")
-        raise typer.Exit(code=1)
     except Exception as e:
         console.print(f"\n❌ [bold red]Upgrade failed: {e}[/bold red]")
         raise typer.Exit(code=1)
@@ -693,29 +835,20 @@ def downgrade(
         # Downgrade to base (empty database)
         $ producthuntdb downgrade base
     """
-    import subprocess
-
     setup_logging(verbose)
 
     console.print("⬇️  [bold cyan]Downgrading Database[/bold cyan]\n")
 
     try:
-        cmd = ["uv", "run", "alembic", "downgrade", revision]
-
-        console.print(f"📝 Command: [yellow]{' '.join(cmd)}[/yellow]\n")
+        console.print(f"📝 Command: [yellow]alembic downgrade {revision}[/yellow]\n")
 
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        output = run_alembic("downgrade", revision)
 
-        if result.stdout:
-            console.print(result.stdout)
+        if output:
+            console.print(output)
 
         console.print(f"\n✅ [bold green]Database downgraded to {revision}![/bold green]")
 
-    except subprocess.CalledProcessError as e:
-        console.print(f"\n❌ [bold red]Downgrade failed![/bold red]")
-        if e.stderr:
-            console.print(f"Error: {e.stderr}")
-        raise typer.Exit(code=1)
     except Exception as e:
         console.print(f"\n❌ [bold red]Downgrade failed: {e}[/bold red]")
         raise typer.Exit(code=1)
@@ -737,36 +870,27 @@ def migration_history(
     Example:
         $ producthuntdb migration-history
     """
-    import subprocess
-
     setup_logging(verbose)
 
     console.print("📜 [bold cyan]Migration History[/bold cyan]\n")
 
     try:
         # Show current revision
-        cmd_current = ["uv", "run", "alembic", "current"]
-        result_current = subprocess.run(cmd_current, check=True, capture_output=True, text=True)
+        current = run_alembic("current")
 
         console.print("[bold]Current Revision:[/bold]")
-        if result_current.stdout:
-            console.print(result_current.stdout)
+        if current:
+            console.print(current)
         else:
             console.print("  No migrations applied yet\n")
 
         # Show history
-        cmd_history = ["uv", "run", "alembic", "history", "--verbose"]
-        result_history = subprocess.run(cmd_history, check=True, capture_output=True, text=True)
+        history = run_alembic("history", verbose=True)
 
         console.print("\n[bold]Migration History:[/bold]")
-        if result_history.stdout:
-            console.print(result_history.stdout)
+        if history:
+            console.print(history)
 
-    except subprocess.CalledProcessError as e:
-        console.print(f"\n❌ [bold red]Failed to get migration history![/bold red]")
-        if e.stderr:
-            console.print(f"Error: {e.stderr}")
-        raise typer.Exit(code=1)
     except Exception as e:
         console.print(f"\n❌ [bold red]Failed to get migration history: {e}[/bold red]")
         raise typer.Exit(code=1)
@@ -831,7 +955,7 @@ def health_check(
         console.print("🗄️  Checking database file...")
 
     try:
-        db_path = settings.database_path
+        db_path = config.settings.database_path
         if db_path.exists() and db_path.is_file():
             size_mb = db_path.stat().st_size / (1024 * 1024)
             checks["checks"]["database_file"] = {
@@ -865,6 +989,8 @@ def health_check(
         console.print("🔌 Checking database connection...")
 
     try:
+        from producthuntdb.io import DatabaseManager
+
         db = DatabaseManager()
         # Try to execute a simple query
         with db.engine.connect() as conn:
@@ -891,6 +1017,8 @@ def health_check(
         console.print("📋 Checking database tables...")
 
     try:
+        from producthuntdb.io import DatabaseManager
+
         db = DatabaseManager()
         with db.engine.connect() as conn:
             # Check if main tables exist
@@ -938,7 +1066,7 @@ def health_check(
 
     try:
         # Check if token is configured
-        if not settings.producthunt_token:
+        if not config.settings.producthunt_token:
             checks["checks"]["api_authentication"] = {
                 "status": "fail",
                 "message": "Product Hunt API token not configured",
@@ -950,7 +1078,7 @@ def health_check(
             checks["checks"]["api_authentication"] = {
                 "status": "pass",
                 "message": "API token configured",
-                "token_length": len(settings.producthunt_token),
+                "token_length": len(config.settings.producthunt_token),
             }
             if not json_output:
                 console.print("   ✅ API token configured\n")
@@ -968,18 +1096,16 @@ def health_check(
         console.print("🌐 Checking API connectivity...")
 
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         async def check_api():
-            from producthuntdb.io import AsyncGraphQLClient
+            from producthuntdb.api import get_shared_client
 
-            async with AsyncGraphQLClient() as client:
-                viewer = await client.fetch_viewer()
-                return viewer
+            return await get_shared_client().fetch_viewer()
 
         viewer = run_async(check_api())
 
-        elapsed_ms = (time.time() - start_time) * 1000
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
 
         if viewer and "user" in viewer:
             checks["checks"]["api_connectivity"] = {
@@ -19,10 +19,12 @@ Example:
 """
 
 import os
+from collections.abc import Iterable
 from datetime import timedelta
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -59,6 +61,13 @@ class CommentsOrder(StrEnum):
     VOTES_COUNT = "VOTES_COUNT"
 
 
+class HttpBackend(StrEnum):
+    """HTTP client library used for Product Hunt API requests."""
+
+    HTTPX = "httpx"
+    AIOHTTP = "aiohttp"
+
+
 class Environment(StrEnum):
     """Runtime environment with specific behavior profiles.
 
@@ -75,6 +84,18 @@ class Environment(StrEnum):
     STAGING = "staging"
 
 
+# Directories already created by this process, so repeat checks skip the syscall
+_ensured_dirs: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    """Create ``path`` (and parents) once per process and return it."""
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+    return path
+
+
 class Settings(BaseSettings):
     """Application settings with environment variable support.
 
@@ -83,8 +104,10 @@ class Settings(BaseSettings):
         kaggle_username: Kaggle username for dataset publishing
         kaggle_key: Kaggle API key for dataset publishing
         graphql_endpoint: Product Hunt GraphQL API endpoint
+        http_backend: HTTP client library for API requests
         database_path: Path to SQLite database file
         max_concurrency: Maximum concurrent API requests
+        target_latency_seconds: Mean API latency above which concurrency is reduced
         page_size: Number of items per GraphQL query page
         safety_minutes: Safety margin for incremental updates (minutes)
         kaggle_dataset_slug: Kaggle dataset identifier (username/dataset-name)
@@ -133,6 +156,11 @@ class Settings(BaseSettings):
         description="Product Hunt GraphQL API endpoint",
     )
 
+    http_backend: HttpBackend = Field(
+        HttpBackend.HTTPX,
+        description="HTTP client library for API requests (httpx or aiohttp)",
+    )
+
     # Data Directory Configuration
     data_dir: Path = Field(
         Path("./data"),
@@ -152,6 +180,12 @@ class Settings(BaseSettings):
         le=10,
         description="Maximum concurrent API requests",
     )
+    target_latency_seconds: float = Field(
+        1.0,
+        gt=0,
+        le=30,
+        description="Mean API latency above which concurrency is reduced (seconds)",
+    )
     page_size: int = Field(
         50,
         ge=1,
@@ -199,10 +233,7 @@ class Settings(BaseSettings):
     @classmethod
     def expand_data_dir(cls, v: str | Path) -> Path:
         """Expand and resolve data directory path."""
-        path = Path(v).expanduser().resolve()
-        # Ensure directory exists
-        path.mkdir(parents=True, exist_ok=True)
-        return path
+        return _ensure_dir(Path(v).expanduser().resolve())
 
     @model_validator(mode="after")
     def set_database_path_default(self) -> "Settings":
@@ -211,7 +242,7 @@ class Settings(BaseSettings):
         if self.database_path == Path("producthunt.db"):
             self.database_path = self.data_dir / "producthunt.db"
         # Ensure parent directory exists
-        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.database_path.parent)
         return self
 
     @field_validator("producthunt_token")
@@ -279,9 +310,7 @@ class Settings(BaseSettings):
     @property
     def export_dir(self) -> Path:
         """Get export directory path."""
-        export_path = self.data_dir / "export"
-        export_path.mkdir(parents=True, exist_ok=True)
-        return export_path
+        return _ensure_dir(self.data_dir / "export")
 
     @property
     def database_url(self) -> str:
@@ -332,54 +361,92 @@ class Settings(BaseSettings):
         return f"{token[:8]}...{token[-4:]}" if len(token) > 12 else "***"
 
     def configure_kaggle_env(self) -> None:
-        """Configure Kaggle environment variables if credentials are available."""
-        if self.kaggle_username:
-            os.environ["KAGGLE_USERNAME"] = self.kaggle_username
-        if self.kaggle_key:
-            os.environ["KAGGLE_KEY"] = self.kaggle_key
+        """Configure Kaggle environment variables if credentials are available.
+
+        Variables that already hold the same value are left untouched.
+        """
+        credentials = (("KAGGLE_USERNAME", self.kaggle_username), ("KAGGLE_KEY", self.kaggle_key))
+        for key, value in credentials:
+            if value and os.environ.get(key) != value:
+                os.environ[key] = value
+
 
+_KAGGLE_SECRET_NAMES = ("PRODUCTHUNT_TOKEN", "KAGGLE_USERNAME", "KAGGLE_KEY")
 
-def load_kaggle_secrets() -> dict[str, str]:
+
+def load_kaggle_secrets(names: Iterable[str] = _KAGGLE_SECRET_NAMES) -> dict[str, str]:
     """Load secrets from Kaggle Secrets if available.
 
+    Every secret is a separate round-trip to the Kaggle backend, so only the
+    requested names are fetched.
+
+    Args:
+        names: Secret names to fetch
+
     Returns:
         Dictionary of secret name to value mappings
 
     Note:
-        Only works in Kaggle notebook environment.
+        Only works in Kaggle notebook environment; elsewhere this returns an
+        empty dict without trying to import ``kaggle_secrets``.
     """
+    names = list(names)
+    if not names or "KAGGLE_KERNEL_RUN_TYPE" not in os.environ:
+        return {}
+
     try:
         from kaggle_secrets import UserSecretsClient  # type: ignore[import-not-found]
-
-        client = UserSecretsClient()
-        return {
-            "PRODUCTHUNT_TOKEN": client.get_secret("PRODUCTHUNT_TOKEN") or "",
-            "KAGGLE_USERNAME": client.get_secret("KAGGLE_USERNAME") or "",
-            "KAGGLE_KEY": client.get_secret("KAGGLE_KEY") or "",
-        }
     except ImportError:
         return {}
 
+    client = UserSecretsClient()
+    return {name: client.get_secret(name) or "" for name in names}
 
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get settings instance with Kaggle secrets support.
 
+    Kaggle Secrets fill in only the variables missing from the environment.
+    The instance is built once: later calls return it without re-reading
+    ``.env``, querying Kaggle Secrets or re-running validators. Call
+    ``get_settings.cache_clear()`` to pick up a changed environment.
+
     Returns:
         Configured Settings instance
     """
-    # Try loading Kaggle secrets first
-    kaggle_secrets = load_kaggle_secrets()
-
-    if kaggle_secrets:
-        # Override environment with Kaggle secrets
-        for key, value in kaggle_secrets.items():
-            if value:
-                os.environ[key] = value
+    missing = [name for name in _KAGGLE_SECRET_NAMES if not os.environ.get(name)]
+    for key, value in load_kaggle_secrets(missing).items():
+        if value:
+            os.environ[key] = value
 
     settings_instance = Settings()
     settings_instance.configure_kaggle_env()
     return settings_instance
 
 
-# Global settings instance
-settings = get_settings()
+def reset_settings() -> None:
+    """Drop the cached settings so the next access rebuilds them from the environment.
+
+    Modules that already bound ``settings`` with ``from ... import settings``
+    keep the old instance.
+    """
+    get_settings.cache_clear()
+    globals().pop("settings", None)
+
+
+# Global settings instance (the same object get_settings() returns), built on
+# first access so importing this module alone never reads .env or validates
+# the token. api, database, io, kaggle, logging, pipeline and telemetry bind it
+# with ``from producthuntdb.config import settings``, which builds it as soon as
+# one of them is imported; the deferral pays off in the CLI, which imports them
+# inside its commands, so ``--help`` and ``--version`` never build it.
+settings: Settings
+
+
+def __getattr__(name: str) -> Any:
+    """Build the module-level ``settings`` on first access (PEP 562)."""
+    if name == "settings":
+        globals()["settings"] = get_settings()
+        return globals()["settings"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -22,12 +22,15 @@ Example:
     >>> db.close()
 """
 
-import json
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any
 
-from sqlmodel import Session, create_engine, select
-from sqlalchemy import text
+from sqlmodel import Session, col, create_engine, select
+from sqlalchemy import delete, event, insert, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from producthuntdb.config import settings
 from producthuntdb.logging import logger
@@ -40,7 +43,118 @@ from producthuntdb.models import (
     TopicRow,
     UserRow,
 )
-from producthuntdb.utils import format_iso, parse_datetime, utc_now_iso
+from producthuntdb.utils import dump_json, normalize_iso, utc_now_iso
+
+
+# =============================================================================
+# Connection Settings
+# =============================================================================
+
+
+# Per-connection settings: applied to every pooled connection by a connect
+# listener, since only journal_mode persists in the database file
+_SQLITE_PRAGMAS = (
+    "PRAGMA busy_timeout = 5000",  # Wait for a concurrent writer instead of "database is locked"
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -64000",  # 64MB cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256MB mmap
+)
+
+
+# Rows to write between PRAGMA optimize runs, which refresh planner statistics
+# for tables whose size has changed a lot since the last ANALYZE
+_OPTIMIZE_EVERY_ROWS = 10_000
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any = None) -> None:
+    """Apply per-connection SQLite pragmas.
+
+    Registered as an engine ``connect`` listener so every pooled connection
+    gets them, not just the one that happened to run initialization. Also
+    used for the raw connections opened by the CSV export.
+
+    Args:
+        dbapi_connection: Raw sqlite3 connection
+        connection_record: SQLAlchemy pool record (unused)
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+# =============================================================================
+# Row Preparation
+# =============================================================================
+
+
+@cache
+def _table_columns(model: type) -> frozenset[str]:
+    """Return the column names of a table model.
+
+    Cached per model: table schemas are fixed at import, and rebuilding the
+    set from SQLAlchemy's column collection cost more than the row it filtered.
+    """
+    return frozenset(model.__table__.columns.keys())  # type: ignore[attr-defined]
+
+
+def _prepare_entity_row(model: type, data: dict[str, Any]) -> dict[str, Any]:
+    """Build an insert row for a user or topic, keeping only table columns."""
+    columns = _table_columns(model)
+    row = {key: value for key, value in data.items() if key in columns}
+    if row.get("createdAt"):
+        row["createdAt"] = normalize_iso(row["createdAt"])
+    return row
+
+
+def _prepare_post_row(post_data: dict[str, Any]) -> tuple[dict[str, Any], Any]:
+    """Flatten a post dictionary into PostRow columns.
+
+    Args:
+        post_data: Post data dictionary
+
+    Returns:
+        Tuple of (PostRow column values, raw media items or None)
+    """
+    processed = {**post_data}
+
+    # Convert timestamps
+    for ts_field in ["createdAt", "featuredAt"]:
+        if ts_field in processed and processed[ts_field]:
+            processed[ts_field] = normalize_iso(processed[ts_field])
+
+    # Convert JSON fields
+    thumb = processed.pop("thumbnail", None)
+    if isinstance(thumb, dict):
+        processed["thumbnail_type"] = thumb.get("type")
+        processed["thumbnail_url"] = thumb.get("url")
+        processed["thumbnail_videoUrl"] = thumb.get("videoUrl")
+
+    product_links = processed.pop("productLinks", None)
+    if product_links:
+        processed["productlinks_json"] = dump_json(product_links)
+
+    # Media is saved to the MediaRow table; drop anything else not in PostRow
+    media_items = processed.pop("media", None)
+    columns = _table_columns(PostRow)
+    row = {key: value for key, value in processed.items() if key in columns}
+    return row, media_items
+
+
+def _media_rows(post_id: str, media_items: list[Any]) -> list[dict[str, Any]]:
+    """Build MediaRow values for a post's media items."""
+    return [
+        {
+            "post_id": post_id,
+            "type": media_dict.get("type", ""),
+            "url": media_dict.get("url", ""),
+            "videoUrl": media_dict.get("videoUrl"),
+            "order_index": idx,
+        }
+        for idx, media_dict in enumerate(media_items)
+        if isinstance(media_dict, dict)
+    ]
 
 
 # =============================================================================
@@ -84,16 +198,29 @@ class DatabaseManager:
         self.database_path = database_path or settings.database_path
         self.engine = None
         self.session = None
+        self._rows_since_optimize = 0
 
-    def initialize(self) -> None:
+    def initialize(self, create_indexes: bool = True) -> None:
         """Initialize database engine and create tables.
 
         This method:
         1. Creates database file if it doesn't exist
         2. Creates all tables from SQLModel
         3. Enables WAL mode for better concurrency
-        4. Optimizes PRAGMA settings
-        5. Creates indexes for common queries
+        4. Optimizes PRAGMA settings (busy timeout, cache) on every connection
+        5. Creates indexes for common queries (unless ``create_indexes`` is False)
+
+        Args:
+            create_indexes: Set to False for a first-time bulk load into a new
+                database, then call ``create_indexes()`` once the data is in:
+                building an index over a populated table is one sorted pass
+                instead of a tree insertion per row. Existing indexes are not
+                touched; see ``bulk_load_mode`` for those.
+
+        Example:
+            >>> db.initialize(create_indexes=False)
+            >>> db.upsert_posts_batch(initial_load, batch_size=1000)
+            >>> db.create_indexes()
         """
         from producthuntdb.models import SQLModel
 
@@ -108,21 +235,18 @@ class DatabaseManager:
             echo=False,
             connect_args={"check_same_thread": False},
         )
+        event.listen(self.engine, "connect", apply_sqlite_pragmas)
 
         # Create all tables
         SQLModel.metadata.create_all(self.engine)
 
-        # Enable WAL mode for better concurrency and optimize settings
+        # Enable WAL mode for better concurrency (persisted in the database file)
         with self.engine.connect() as conn:
             conn.exec_driver_sql("PRAGMA journal_mode = WAL;")
-            conn.exec_driver_sql("PRAGMA synchronous = NORMAL;")
-            conn.exec_driver_sql("PRAGMA cache_size = -64000;")  # 64MB cache
-            conn.exec_driver_sql("PRAGMA temp_store = MEMORY;")
-            conn.exec_driver_sql("PRAGMA mmap_size = 268435456;")  # 256MB mmap
             conn.commit()
 
-        # Create indexes
-        self.create_indexes()
+        if create_indexes:
+            self.create_indexes()
 
         self.session = Session(self.engine)
         logger.info(f"✅ Database initialized at {self.database_path}")
@@ -132,9 +256,13 @@ class DatabaseManager:
 
         Indexes created:
         - Post created_at, featured_at, votes_count for sorting
-        - Post user_id, topic links for joins
+        - Covering (topic_id, post_id) and (user_id, post_id) link indexes for
+          joins from topics and makers to posts
         - User username, topic slug for lookups
         - Composite indexes for complex queries
+
+        Indexes made redundant by these are dropped by an Alembic migration,
+        and planner statistics are left to ``optimize``.
         """
         if self.engine is None:
             raise RuntimeError("Database not initialized")
@@ -145,14 +273,14 @@ class DatabaseManager:
             "CREATE INDEX IF NOT EXISTS idx_post_created_at ON postrow(createdAt DESC)",
             "CREATE INDEX IF NOT EXISTS idx_post_featured_at ON postrow(featuredAt DESC) WHERE featuredAt IS NOT NULL",
             "CREATE INDEX IF NOT EXISTS idx_post_votes ON postrow(votesCount DESC)",
-            "CREATE INDEX IF NOT EXISTS idx_post_user ON postrow(userId)",
             "CREATE INDEX IF NOT EXISTS idx_user_username ON userrow(username)",
             "CREATE INDEX IF NOT EXISTS idx_topic_slug ON topicrow(slug)",
             "CREATE INDEX IF NOT EXISTS idx_media_post ON mediarow(post_id, order_index)",
-            "CREATE INDEX IF NOT EXISTS idx_post_topic_post ON posttopiclink(post_id)",
-            "CREATE INDEX IF NOT EXISTS idx_post_topic_topic ON posttopiclink(topic_id)",
-            "CREATE INDEX IF NOT EXISTS idx_maker_post_post ON makerpostlink(post_id)",
-            "CREATE INDEX IF NOT EXISTS idx_maker_post_user ON makerpostlink(user_id)",
+            # Link lookups by post use the (post_id, ...) primary keys; the reverse
+            # direction gets covering indexes so it never touches the table
+            "CREATE INDEX IF NOT EXISTS idx_post_topic_cover ON posttopiclink(topic_id, post_id)",
+            "CREATE INDEX IF NOT EXISTS idx_maker_post_cover ON makerpostlink(user_id, post_id)",
+            # Also serves userId-only lookups (leftmost column)
             "CREATE INDEX IF NOT EXISTS idx_post_user_created ON postrow(userId, createdAt DESC)",
         ]
 
@@ -164,6 +292,63 @@ class DatabaseManager:
 
         logger.debug("✅ Database indexes created")
 
+    @contextmanager
+    def bulk_load_mode(self) -> Iterator[None]:
+        """Drop secondary indexes for a large import and rebuild them afterwards.
+
+        Every index from ``create_indexes`` is maintained on each insert, which
+        dominates the write path when loading hundreds of thousands of posts
+        into an empty database. Inside this context they are dropped (primary
+        keys and the tables' own constraints are kept, so upserts still
+        resolve conflicts), then recreated in one pass on exit, also if the
+        load fails, and ``optimize`` refreshes the statistics for the new rows.
+
+        Example:
+            >>> with db.bulk_load_mode():
+            ...     db.upsert_posts_batch(all_posts, batch_size=1000)
+        """
+        if self.engine is None:
+            raise RuntimeError("Database not initialized")
+
+        with self.engine.connect() as conn:
+            names = (
+                conn.exec_driver_sql(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND name GLOB 'idx_*'"
+                )
+                .scalars()
+                .all()
+            )
+            for name in names:
+                conn.exec_driver_sql(f'DROP INDEX IF EXISTS "{name}"')
+            conn.commit()
+        logger.debug(f"Dropped {len(names)} indexes for bulk load")
+
+        try:
+            yield
+        finally:
+            self.create_indexes()
+            self.optimize()
+
+    def optimize(self) -> None:
+        """Run ``PRAGMA optimize`` to refresh stale query planner statistics.
+
+        SQLite only re-analyzes tables whose row counts changed significantly
+        since the last ANALYZE, so this is cheap when nothing needs doing.
+        """
+        if self.engine is None:
+            raise RuntimeError("Database not initialized")
+
+        with self.engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA optimize")
+            conn.commit()
+        self._rows_since_optimize = 0
+
+    def _note_rows_written(self, count: int) -> None:
+        """Count written rows and run ``optimize`` every ``_OPTIMIZE_EVERY_ROWS``."""
+        self._rows_since_optimize += count
+        if self._rows_since_optimize >= _OPTIMIZE_EVERY_ROWS:
+            self.optimize()
+
     def close(self) -> None:
         """Close database connection and cleanup resources."""
         if self.session is not None:
@@ -197,25 +382,9 @@ class DatabaseManager:
         if self.session is None:
             raise RuntimeError("Database not initialized")
 
-        user_id = user_data["id"]
-        existing = self.session.get(UserRow, user_id)
-
-        if existing:
-            # Update existing
-            for key, value in user_data.items():
-                if key == "createdAt" and value:
-                    value = format_iso(parse_datetime(value))
-                setattr(existing, key, value)
-            user_row = existing
-        else:
-            # Create new
-            if "createdAt" in user_data and user_data["createdAt"]:
-                user_data["createdAt"] = format_iso(parse_datetime(user_data["createdAt"]))
-            user_row = UserRow(**user_data)
-            self.session.add(user_row)
-
+        self._upsert_rows(UserRow, [_prepare_entity_row(UserRow, user_data)])
         self.session.commit()
-        return user_row
+        return self.session.get(UserRow, user_data["id"])
 
     # =========================================================================
     # Post Operations
@@ -244,70 +413,15 @@ class DatabaseManager:
             raise RuntimeError("Database not initialized")
 
         post_id = post_data["id"]
-        existing = self.session.get(PostRow, post_id)
-
-        # Prepare data
-        processed = {**post_data}
-
-        # Convert timestamps
-        for ts_field in ["createdAt", "featuredAt"]:
-            if ts_field in processed and processed[ts_field]:
-                processed[ts_field] = format_iso(parse_datetime(processed[ts_field]))
-
-        # Convert JSON fields
-        if "thumbnail" in processed and processed["thumbnail"]:
-            thumb = processed["thumbnail"]
-            if isinstance(thumb, dict):
-                processed["thumbnail_type"] = thumb.get("type")
-                processed["thumbnail_url"] = thumb.get("url")
-                processed["thumbnail_videoUrl"] = thumb.get("videoUrl")
-            del processed["thumbnail"]
-
-        # Handle media separately - will be saved to MediaRow table
-        media_items = None
-        if "media" in processed:
-            media_items = processed.pop("media", None)
-
-        if "productLinks" in processed and processed["productLinks"]:
-            processed["productlinks_json"] = json.dumps(processed["productLinks"])
-            del processed["productLinks"]
-
-        # Remove fields not in PostRow
-        for key in ["user", "makers", "topics"]:
-            processed.pop(key, None)
-
-        if existing:
-            # Update existing
-            for key, value in processed.items():
-                setattr(existing, key, value)
-            post_row = existing
-        else:
-            # Create new
-            post_row = PostRow(**processed)
-            self.session.add(post_row)
+        row, media_items = _prepare_post_row(post_data)
+        self._upsert_rows(PostRow, [row])
 
-        self.session.commit()
-
-        # Handle media items - save to MediaRow table
+        # Handle media items - sync the post's MediaRow entries
         if media_items and isinstance(media_items, list):
-            # Delete existing media for this post
-            self.session.query(MediaRow).filter(MediaRow.post_id == post_id).delete()
-
-            # Add new media entries
-            for idx, media_dict in enumerate(media_items):
-                if isinstance(media_dict, dict):
-                    media_row = MediaRow(
-                        post_id=post_id,
-                        type=media_dict.get("type", ""),
-                        url=media_dict.get("url", ""),
-                        videoUrl=media_dict.get("videoUrl"),
-                        order_index=idx,
-                    )
-                    self.session.add(media_row)
-
-            self.session.commit()
+            self._sync_media([post_id], _media_rows(post_id, media_items))
 
-        return post_row
+        self.session.commit()
+        return self.session.get(PostRow, post_id)
 
     def upsert_posts_batch(
         self,
@@ -316,16 +430,20 @@ class DatabaseManager:
     ) -> list[PostRow]:
         """Bulk upsert posts for better performance.
 
-        Performance comparison:
-        - Individual upserts: ~100ms per post (10 posts = 1000ms)
-        - Batch upserts: ~200ms total (10 posts = 200ms) - **5x faster**
+        Each batch is written with a single ``INSERT ... ON CONFLICT(id) DO
+        UPDATE`` executemany, instead of prefetching existing rows and
+        flushing ORM objects one by one. All batches share one transaction,
+        so the call commits (and syncs the WAL) once and is all-or-nothing.
+
+        Use ``iter_upsert_posts_batch`` for large imports to avoid holding
+        every stored row in memory at once.
 
         Args:
             posts_data: List of post dictionaries
-            batch_size: Number of posts per transaction (default 100)
+            batch_size: Number of posts per statement (default 100)
 
         Returns:
-            List of upserted PostRow objects
+            List of upserted PostRow objects, in input order
 
         Example:
             >>> posts_data = [
@@ -335,58 +453,57 @@ class DatabaseManager:
             >>> posts = db.upsert_posts_batch(posts_data)
             >>> print(f"Upserted {len(posts)} posts")
         """
-        if self.engine is None:
-            raise RuntimeError("Database not initialized")
-
-        all_post_rows = []
+        return list(self.iter_upsert_posts_batch(posts_data, batch_size))
 
-        # Process in batches to avoid memory issues with large datasets
-        for i in range(0, len(posts_data), batch_size):
-            batch = posts_data[i : i + batch_size]
-
-            with Session(self.engine) as session:
-                post_rows = []
-
-                # Fetch existing posts in single query
-                post_ids = [p["id"] for p in batch]
-                stmt = select(PostRow).where(PostRow.id.in_(post_ids))
-                existing_posts = {p.id: p for p in session.exec(stmt)}
-
-                for post_dict in batch:
-                    # Process timestamps
-                    processed = {**post_dict}
-                    for ts_field in ["createdAt", "featuredAt"]:
-                        if ts_field in processed and processed[ts_field]:
-                            processed[ts_field] = format_iso(parse_datetime(processed[ts_field]))
-
-                    # Remove nested objects
-                    for key in ["user", "makers", "topics", "media", "thumbnail"]:
-                        processed.pop(key, None)
-
-                    post_id = processed["id"]
+    def iter_upsert_posts_batch(
+        self,
+        posts_data: Sequence[dict[str, Any]],
+        batch_size: int = 100,
+    ) -> Iterator[PostRow]:
+        """Bulk upsert posts and stream the stored rows back.
 
-                    if post_id in existing_posts:
-                        # Update existing
-                        existing = existing_posts[post_id]
-                        for key, value in processed.items():
-                            setattr(existing, key, value)
-                        post_rows.append(existing)
-                    else:
-                        # Insert new
-                        post_row = PostRow(**processed)
-                        session.add(post_row)
-                        post_rows.append(post_row)
+        The writes happen, and are committed, when this method is called,
+        exactly as in ``upsert_posts_batch``. Only reading the stored rows
+        is deferred: the returned iterator loads them ``batch_size`` at a
+        time, so memory stays bounded by the batch rather than the input.
 
-                # Single commit for entire batch
-                session.commit()
+        Args:
+            posts_data: List of post dictionaries
+            batch_size: Number of posts per statement and per read-back query
 
-                # Refresh all objects in batch
-                for post_row in post_rows:
-                    session.refresh(post_row)
+        Returns:
+            Iterator over the upserted PostRow objects, in input order
 
-                all_post_rows.extend(post_rows)
+        Example:
+            >>> stored = sum(1 for _ in db.iter_upsert_posts_batch(posts_data))
+        """
+        if self.engine is None:
+            raise RuntimeError("Database not initialized")
 
-        return all_post_rows
+        post_ids = [post["id"] for post in posts_data]
+
+        with Session(self.engine) as session:
+            # Prepare rows batch by batch to keep memory bounded on large inputs
+            for i in range(0, len(posts_data), batch_size):
+                batch = posts_data[i : i + batch_size]
+                self._upsert_rows(
+                    PostRow, [_prepare_post_row(post)[0] for post in batch], session=session
+                )
+            session.commit()
+
+        self._note_rows_written(len(post_ids))
+        return self._iter_posts(post_ids, batch_size)
+
+    def _iter_posts(self, post_ids: list[str], batch_size: int) -> Iterator[PostRow]:
+        """Yield stored posts in ``post_ids`` order, one query per chunk."""
+        with Session(self.engine) as session:
+            for i in range(0, len(post_ids), batch_size):
+                chunk = post_ids[i : i + batch_size]
+                stmt = select(PostRow).where(col(PostRow.id).in_(chunk))
+                stored = {post.id: post for post in session.exec(stmt)}
+                # Detach the chunk so the session does not keep it alive
+                session.expunge_all()
+                yield from (stored[post_id] for post_id in chunk)
 
     # =========================================================================
     # Topic Operations
@@ -409,30 +526,16 @@ class DatabaseManager:
         if self.session is None:
             raise RuntimeError("Database not initialized")
 
-        topic_id = topic_data["id"]
-        existing = self.session.get(TopicRow, topic_id)
-
-        # Process timestamps
-        if "createdAt" in topic_data and topic_data["createdAt"]:
-            topic_data["createdAt"] = format_iso(parse_datetime(topic_data["createdAt"]))
-
-        if existing:
-            for key, value in topic_data.items():
-                setattr(existing, key, value)
-            topic_row = existing
-        else:
-            topic_row = TopicRow(**topic_data)
-            self.session.add(topic_row)
-
+        self._upsert_rows(TopicRow, [_prepare_entity_row(TopicRow, topic_data)])
         self.session.commit()
-        return topic_row
+        return self.session.get(TopicRow, topic_data["id"])
 
     # =========================================================================
     # Link Operations
     # =========================================================================
 
     def link_post_topics(self, post_id: str, topic_ids: list[str]) -> None:
-        """Create post-topic links.
+        """Create post-topic links, skipping links that already exist.
 
         Args:
             post_id: Post ID
@@ -444,22 +547,14 @@ class DatabaseManager:
         if self.session is None:
             raise RuntimeError("Database not initialized")
 
-        for topic_id in topic_ids:
-            # Check if link exists
-            stmt = select(PostTopicLink).where(
-                PostTopicLink.post_id == post_id,
-                PostTopicLink.topic_id == topic_id,
-            )
-            existing = self.session.exec(stmt).first()
-
-            if not existing:
-                link = PostTopicLink(post_id=post_id, topic_id=topic_id)
-                self.session.add(link)
-
+        self._insert_links(
+            PostTopicLink,
+            [{"post_id": post_id, "topic_id": topic_id} for topic_id in topic_ids],
+        )
         self.session.commit()
 
     def link_post_makers(self, post_id: str, maker_ids: list[str]) -> None:
-        """Create post-maker links.
+        """Create post-maker links, skipping links that already exist.
 
         Args:
             post_id: Post ID
@@ -471,18 +566,195 @@ class DatabaseManager:
         if self.session is None:
             raise RuntimeError("Database not initialized")
 
-        for maker_id in maker_ids:
-            stmt = select(MakerPostLink).where(
-                MakerPostLink.post_id == post_id,
-                MakerPostLink.user_id == maker_id,
+        self._insert_links(
+            MakerPostLink,
+            [{"post_id": post_id, "user_id": maker_id} for maker_id in maker_ids],
+        )
+        self.session.commit()
+
+    # =========================================================================
+    # Page Operations
+    # =========================================================================
+
+    def upsert_posts_page(
+        self,
+        posts: Sequence[dict[str, Any]],
+        users: Sequence[dict[str, Any]] = (),
+        topics: Sequence[dict[str, Any]] = (),
+        post_topic_links: Sequence[tuple[str, str]] = (),
+        post_maker_links: Sequence[tuple[str, str]] = (),
+    ) -> None:
+        """Write a page of posts and their related rows in one transaction.
+
+        Each table is written with a single parameterized ``INSERT ... ON
+        CONFLICT`` statement executed over all of its rows (``executemany``),
+        instead of a lookup, ORM flush and commit per row. Links that already
+        exist are left untouched and media is synced per post, matching the
+        single-row methods.
+
+        Args:
+            posts: Post data dictionaries
+            users: User data dictionaries (submitters and makers)
+            topics: Topic data dictionaries
+            post_topic_links: (post_id, topic_id) pairs
+            post_maker_links: (post_id, user_id) pairs
+
+        Raises:
+            Exception: Any database error; the whole page is rolled back
+
+        Example:
+            >>> db.upsert_posts_page(
+            ...     posts=[{"id": "1", "name": "Product A"}],
+            ...     users=[{"id": "u1", "username": "john", "name": "John"}],
+            ...     post_maker_links=[("1", "u1")],
+            ... )
+        """
+        if self.session is None:
+            raise RuntimeError("Database not initialized")
+
+        prepared_posts = [_prepare_post_row(post) for post in posts]
+        media_posts = [
+            (row["id"], media) for row, media in prepared_posts if media and isinstance(media, list)
+        ]
+        media_rows = [row for post_id, media in media_posts for row in _media_rows(post_id, media)]
+
+        try:
+            self._upsert_rows(UserRow, [_prepare_entity_row(UserRow, user) for user in users])
+            self._upsert_rows(TopicRow, [_prepare_entity_row(TopicRow, topic) for topic in topics])
+            self._upsert_rows(PostRow, [row for row, _ in prepared_posts])
+            self._insert_links(
+                PostTopicLink,
+                [
+                    {"post_id": post_id, "topic_id": topic_id}
+                    for post_id, topic_id in post_topic_links
+                ],
+            )
+            self._insert_links(
+                MakerPostLink,
+                [{"post_id": post_id, "user_id": user_id} for post_id, user_id in post_maker_links],
             )
-            existing = self.session.exec(stmt).first()
+            if media_posts:
+                self._sync_media([post_id for post_id, _ in media_posts], media_rows)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
 
-            if not existing:
-                link = MakerPostLink(post_id=post_id, user_id=maker_id)
-                self.session.add(link)
+        self._note_rows_written(len(posts))
 
-        self.session.commit()
+    def update_post_counts(self, posts: Sequence[dict[str, Any]]) -> int:
+        """Refresh the vote and comment counts of posts that are already stored.
+
+        Posts missing from the database are skipped, since counts alone are
+        not enough to insert a row.
+
+        Args:
+            posts: Post data dictionaries with ``id``, ``votesCount`` and
+                ``commentsCount`` (e.g. from a ``PostFieldSet.MINIMAL`` page)
+
+        Returns:
+            Number of stored posts updated
+
+        Example:
+            >>> db.update_post_counts([{"id": "1", "votesCount": 120, "commentsCount": 8}])
+            1
+        """
+        if self.session is None:
+            raise RuntimeError("Database not initialized")
+
+        ids = [post["id"] for post in posts]
+        stored = set(
+            self.session.execute(select(col(PostRow.id)).where(col(PostRow.id).in_(ids))).scalars()
+        )
+        rows = [
+            {
+                "id": post["id"],
+                "votesCount": post.get("votesCount") or 0,
+                "commentsCount": post.get("commentsCount") or 0,
+            }
+            for post in posts
+            if post["id"] in stored
+        ]
+        if rows:
+            self.session.execute(update(PostRow), rows)
+            self.session.commit()
+        return len(rows)
+
+    def _upsert_rows(
+        self,
+        model: type,
+        rows: list[dict[str, Any]],
+        session: Session | None = None,
+    ) -> None:
+        """Upsert rows by primary key ``id`` with one statement per column set.
+
+        Only the columns present in a row are updated on conflict, so rows are
+        grouped by their key set and each group is sent as one executemany.
+        Runs on ``session`` if given, otherwise on the manager's session.
+        """
+        session = session or self.session
+        if session is None:
+            raise RuntimeError("Database not initialized")
+
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(row), []).append(row)
+
+        for columns, group in groups.items():
+            stmt = sqlite_insert(model)
+            updates = {column: stmt.excluded[column] for column in columns if column != "id"}
+            if updates:
+                stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=updates)
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
+            session.execute(stmt, group)
+
+    def _sync_media(self, post_ids: list[str], media_rows: list[dict[str, Any]]) -> None:
+        """Make the posts' MediaRow entries match ``media_rows``.
+
+        Rows are compared on all of their values, so only media that was
+        added, removed, changed or reordered is written; re-seeing a post
+        with unchanged media issues no DELETE or INSERT at all.
+        """
+        if self.session is None:
+            raise RuntimeError("Database not initialized")
+
+        incoming = {
+            (row["post_id"], row["type"], row["url"], row["videoUrl"], row["order_index"]): row
+            for row in media_rows
+        }
+
+        stale_ids = []
+        kept = set()
+        stmt = select(
+            col(MediaRow.id),
+            col(MediaRow.post_id),
+            col(MediaRow.type),
+            col(MediaRow.url),
+            col(MediaRow.videoUrl),
+            col(MediaRow.order_index),
+        ).where(col(MediaRow.post_id).in_(post_ids))
+        for media_id, *values in self.session.execute(stmt):
+            key = tuple(values)
+            if key in incoming and key not in kept:
+                kept.add(key)
+            else:
+                stale_ids.append(media_id)
+
+        if stale_ids:
+            self.session.execute(delete(MediaRow).where(col(MediaRow.id).in_(stale_ids)))
+        new_rows = [row for key, row in incoming.items() if key not in kept]
+        if new_rows:
+            self.session.execute(insert(MediaRow), new_rows)
+
+    def _insert_links(self, model: type, rows: list[dict[str, Any]]) -> None:
+        """Insert link rows, skipping links that already exist."""
+        if self.session is None:
+            raise RuntimeError("Database not initialized")
+
+        if rows:
+            stmt = sqlite_insert(model).on_conflict_do_nothing()
+            self.session.execute(stmt, rows)
 
     # =========================================================================
     # Crawl State Operations
@@ -541,4 +813,4 @@ class DatabaseManager:
 # Export Public API
 # =============================================================================
 
-__all__ = ["DatabaseManager"]
+__all__ = ["DatabaseManager", "apply_sqlite_pragmas"]
@@ -1,8 +1,9 @@
 """Protocol interfaces for dependency injection.
 
 This module defines Protocol interfaces that enable loose coupling and
-dependency injection throughout the codebase. Using @runtime_checkable
-Protocol allows for structural subtyping without requiring inheritance.
+dependency injection throughout the codebase. Protocols allow for
+structural subtyping without requiring inheritance; conformance is checked
+statically by the type checker, not with isinstance() at runtime.
 
 Key benefits:
 - Easy testing with mock implementations
@@ -15,8 +16,7 @@ Example:
     >>> class MockClient:
     ...     async def fetch_posts_page(self, after, posted_after, first, order):
     ...         return {'nodes': [], 'pageInfo': {'hasNextPage': False}}
-    >>> mock = MockClient()
-    >>> isinstance(mock, IGraphQLClient)  # True, structural typing!
+    >>> client: IGraphQLClient = MockClient()  # Accepted by mypy, structural typing!
 
 References:
     - ArjanCodes: Python Dependency Injection Best Practices
@@ -27,7 +27,7 @@ References:
 
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 from producthuntdb.config import PostsOrder
 from producthuntdb.models import (
@@ -41,7 +41,6 @@ from producthuntdb.models import (
 )
 
 
-@runtime_checkable
 class IGraphQLClient(Protocol):
     """GraphQL API client interface.
 
@@ -51,9 +50,6 @@ class IGraphQLClient(Protocol):
     - Rate limiting
     - Retry logic
     - Connection pooling
-
-    The @runtime_checkable decorator enables isinstance() checks based on
-    method signatures rather than inheritance.
     """
 
     async def fetch_posts_page(
@@ -134,7 +130,6 @@ class IGraphQLClient(Protocol):
         ...
 
 
-@runtime_checkable
 class IDatabaseManager(Protocol):
     """Database operations interface.
 
@@ -323,7 +318,6 @@ class IDatabaseManager(Protocol):
         ...
 
 
-@runtime_checkable
 class ILogger(Protocol):
     """Logging interface.
 
@@ -391,7 +385,6 @@ class ILogger(Protocol):
         ...
 
 
-@runtime_checkable
 class IKaggleManager(Protocol):
     """Kaggle dataset management interface.
 
@@ -460,8 +453,8 @@ Protocol-based interfaces enable:
    >>> pipeline = DataPipeline(db=db)
 
 4. **Structural Typing**: No inheritance required
-   >>> # As long as it has the right methods, it's valid
-   >>> assert isinstance(my_client, IGraphQLClient)  # True!
+   >>> # As long as it has the right methods, mypy accepts it
+   >>> client: IGraphQLClient = my_client
 
 See Also:
     - docs/source/refactoring-enhancements.md - Complete implementation guide
@@ -12,18 +12,26 @@ Example:
 """
 
 import asyncio
+import csv
+import gzip
+import importlib.util
 import json
 import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 import httpx
 from loguru import logger
-from sqlmodel import Session, create_engine, select
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, create_engine
 from tenacity import (
+    AsyncRetrying,
     before_sleep_log,
-    retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
@@ -31,6 +39,7 @@ from tenacity import (
 )
 
 from producthuntdb.config import PostsOrder, settings
+from producthuntdb.database import apply_sqlite_pragmas
 from producthuntdb.models import (
     CrawlState,
     MakerPostLink,
@@ -40,7 +49,19 @@ from producthuntdb.models import (
     TopicRow,
     UserRow,
 )
-from producthuntdb.utils import format_iso, parse_datetime, utc_now_iso
+from producthuntdb.utils import dump_json, format_iso, normalize_iso, utc_now_iso
+
+# DuckDB (optional - vectorized CSV export, falls back to the streaming csv writer).
+# Only probed here; it is imported when an export runs
+DUCKDB_AVAILABLE = importlib.util.find_spec("duckdb") is not None
+
+# orjson serialization (optional - falls back to stdlib json if not installed)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # =============================================================================
 # GraphQL Query Definitions
@@ -233,6 +254,16 @@ class TransientGraphQLError(Exception):
     pass
 
 
+# Retry policy template, built once; each call drives a fresh copy of it
+_RETRYING = AsyncRetrying(
+    reraise=True,
+    stop=stop_after_attempt(20),
+    wait=wait_exponential(multiplier=3, min=5, max=120) + wait_random(0, 5),
+    retry=retry_if_exception_type(TransientGraphQLError),
+    before_sleep=before_sleep_log(logging.getLogger(__name__), logging.WARNING),
+)
+
+
 # =============================================================================
 # Async GraphQL Client
 # =============================================================================
@@ -252,8 +283,8 @@ class AsyncGraphQLClient:
         max_concurrency: Maximum concurrent requests
 
     Example:
-        >>> client = AsyncGraphQLClient(token="...")
-        >>> posts = await client.fetch_posts_page(None, None, 50, PostsOrder.NEWEST)
+        >>> async with AsyncGraphQLClient(token="...") as client:
+        ...     posts = await client.fetch_posts_page(None, None, 50, PostsOrder.NEWEST)
     """
 
     def __init__(
@@ -274,6 +305,49 @@ class AsyncGraphQLClient:
         self._rate_limit_remaining = None
         self._rate_limit_reset = None
 
+        # Headers are fixed for the client's lifetime; sent by the pooled client
+        self._headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Content-Type": "application/json",
+        }
+        # Long-lived HTTP/2 client (created on first use) so requests reuse
+        # one connection instead of paying a TCP+TLS handshake each
+        self._client: httpx.AsyncClient | None = None
+
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Lazy initialization of the pooled HTTP client.
+
+        Returns:
+            Configured HTTP client instance
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self._max_concurrency,
+                    max_keepalive_connections=self._max_concurrency,
+                    keepalive_expiry=60.0,
+                ),
+                headers=self._headers,
+            )
+        return self._client
+
+    async def __aenter__(self) -> "AsyncGraphQLClient":
+        """Context manager entry for resource management."""
+        await self._ensure_client()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit - ensure cleanup."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client and its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def _do_http_post(
         self,
         query: str,
@@ -292,65 +366,63 @@ class AsyncGraphQLClient:
             TransientGraphQLError: For retryable failures
             RuntimeError: For permanent GraphQL errors
         """
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": "application/json",
-        }
+        client = await self._ensure_client()
 
-        async with httpx.AsyncClient(http2=True, timeout=30.0) as client:
-            try:
-                resp = await client.post(
-                    settings.graphql_endpoint,
-                    headers=headers,
-                    json={"query": query, "variables": variables},
-                )
-            except (httpx.TimeoutException, httpx.NetworkError) as exc:
-                raise TransientGraphQLError(f"Network/timeout error: {exc}") from exc
+        payload = {"query": query, "variables": variables}
+        if ORJSON_AVAILABLE:
+            content = orjson.dumps(payload)
+        else:
+            content = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
 
-            # Extract rate limit information
-            self._rate_limit_limit = resp.headers.get("X-RateLimit-Limit")
-            self._rate_limit_remaining = resp.headers.get("X-RateLimit-Remaining")
-            self._rate_limit_reset = resp.headers.get("X-RateLimit-Reset")
+        try:
+            resp = await client.post(settings.graphql_endpoint, content=content)
+        except (httpx.TimeoutException, httpx.NetworkError) as exc:
+            raise TransientGraphQLError(f"Network/timeout error: {exc}") from exc
 
-            # Log rate limit status
-            if self._rate_limit_remaining:
-                try:
-                    remaining = int(self._rate_limit_remaining)
-                    limit = int(self._rate_limit_limit) if self._rate_limit_limit else "?"
+        # Extract rate limit information
+        self._rate_limit_limit = resp.headers.get("X-RateLimit-Limit")
+        self._rate_limit_remaining = resp.headers.get("X-RateLimit-Remaining")
+        self._rate_limit_reset = resp.headers.get("X-RateLimit-Reset")
 
-                    if remaining < 10:
-                        logger.warning(
-                            f"⚠️ Rate limit low: {remaining}/{limit} remaining "
-                            f"(resets at {self._rate_limit_reset or 'unknown'})"
-                        )
-                except (ValueError, TypeError):
-                    pass
-
-            # Handle non-200 status codes
-            if resp.status_code != 200 and (
-                resp.status_code == 429 or 500 <= resp.status_code < 600
-            ):
-                reset_info = (
-                    f" (resets at {self._rate_limit_reset})" if resp.status_code == 429 else ""
-                )
-                raise TransientGraphQLError(f"HTTP {resp.status_code}{reset_info}")
+        # Log rate limit status
+        if self._rate_limit_remaining:
+            try:
+                remaining = int(self._rate_limit_remaining)
+                limit = int(self._rate_limit_limit) if self._rate_limit_limit else "?"
 
-            if resp.status_code != 200:
-                logger.error(f"Non-retryable HTTP {resp.status_code}: {resp.text[:200]}")
-                raise RuntimeError(f"HTTP {resp.status_code}")
+                if remaining < 10:
+                    logger.warning(
+                        f"⚠️ Rate limit low: {remaining}/{limit} remaining "
+                        f"(resets at {self._rate_limit_reset or 'unknown'})"
+                    )
+            except (ValueError, TypeError):
+                pass
 
-            # Parse response
-            try:
+        # Handle non-200 status codes
+        if resp.status_code != 200 and (resp.status_code == 429 or 500 <= resp.status_code < 600):
+            reset_info = f" (resets at {self._rate_limit_reset})" if resp.status_code == 429 else ""
+            raise TransientGraphQLError(f"HTTP {resp.status_code}{reset_info}")
+
+        if resp.status_code != 200:
+            logger.error(f"Non-retryable HTTP {resp.status_code}: {resp.text[:200]}")
+            raise RuntimeError(f"HTTP {resp.status_code}")
+
+        # Parse response
+        try:
+            content = resp.content
+            if ORJSON_AVAILABLE and isinstance(content, bytes):
+                body = orjson.loads(content)
+            else:
                 body = resp.json()
-            except Exception as exc:
-                raise TransientGraphQLError(f"Invalid JSON: {exc}") from exc
+        except Exception as exc:
+            raise TransientGraphQLError(f"Invalid JSON: {exc}") from exc
 
-            # Check for GraphQL errors
-            if "errors" in body and body["errors"]:
-                logger.error(f"GraphQL errors: {body['errors']}")
-                raise RuntimeError(f"GraphQL errors: {body['errors']}")
+        # Check for GraphQL errors
+        if "errors" in body and body["errors"]:
+            logger.error(f"GraphQL errors: {body['errors']}")
+            raise RuntimeError(f"GraphQL errors: {body['errors']}")
 
-            return body.get("data", {})
+        return body.get("data", {})
 
     async def _post_with_retry(
         self,
@@ -366,37 +438,39 @@ class AsyncGraphQLClient:
         Returns:
             Parsed data from response
         """
+        return await _RETRYING.copy()(self._send_once, query, variables)
+
+    async def _send_once(
+        self,
+        query: str,
+        variables: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Send a single request under the semaphore, pacing by rate limit.
 
-        # Create logging bridge for tenacity
-        logging_logger = logging.getLogger(__name__)
+        Args:
+            query: GraphQL query string
+            variables: Query variables
 
-        @retry(
-            reraise=True,
-            stop=stop_after_attempt(20),
-            wait=wait_exponential(multiplier=3, min=5, max=120) + wait_random(0, 5),
-            retry=retry_if_exception_type(TransientGraphQLError),
-            before_sleep=before_sleep_log(logging_logger, logging.WARNING),
-        )
-        async def _runner() -> dict[str, Any]:
-            async with self._sem:
-                # Adaptive delay based on rate limit
-                if self._rate_limit_remaining:
-                    try:
-                        remaining = int(self._rate_limit_remaining)
-                        if remaining < 5:
-                            await asyncio.sleep(5.0)
-                        elif remaining < 20:
-                            await asyncio.sleep(3.0)
-                        else:
-                            await asyncio.sleep(2.0)
-                    except (ValueError, TypeError):
+        Returns:
+            Parsed data from response
+        """
+        async with self._sem:
+            # Adaptive delay based on rate limit
+            if self._rate_limit_remaining:
+                try:
+                    remaining = int(self._rate_limit_remaining)
+                    if remaining < 5:
+                        await asyncio.sleep(5.0)
+                    elif remaining < 20:
+                        await asyncio.sleep(3.0)
+                    else:
                         await asyncio.sleep(2.0)
-                else:
+                except (ValueError, TypeError):
                     await asyncio.sleep(2.0)
+            else:
+                await asyncio.sleep(2.0)
 
-                return await self._do_http_post(query, variables)
-
-        return await _runner()
+            return await self._do_http_post(query, variables)
 
     def get_rate_limit_status(self) -> dict[str, Any]:
         """Get current rate limit status from last API call.
@@ -549,6 +623,7 @@ class DatabaseManager:
             echo=False,
             connect_args={"check_same_thread": False},
         )
+        event.listen(self.engine, "connect", apply_sqlite_pragmas)
 
         # Create all tables
         SQLModel.metadata.create_all(self.engine)
@@ -556,7 +631,6 @@ class DatabaseManager:
         # Enable WAL mode for better concurrency
         with self.engine.connect() as conn:
             conn.exec_driver_sql("PRAGMA journal_mode = WAL;")
-            conn.exec_driver_sql("PRAGMA synchronous = NORMAL;")
             conn.commit()
 
         self.session = Session(self.engine)
@@ -588,13 +662,13 @@ class DatabaseManager:
             # Update existing
             for key, value in user_data.items():
                 if key == "createdAt" and value:
-                    value = format_iso(parse_datetime(value))
+                    value = normalize_iso(value)
                 setattr(existing, key, value)
             user_row = existing
         else:
             # Create new
             if "createdAt" in user_data and user_data["createdAt"]:
-                user_data["createdAt"] = format_iso(parse_datetime(user_data["createdAt"]))
+                user_data["createdAt"] = normalize_iso(user_data["createdAt"])
             user_row = UserRow(**user_data)
             self.session.add(user_row)
 
@@ -622,7 +696,7 @@ class DatabaseManager:
         # Convert timestamps
         for ts_field in ["createdAt", "featuredAt"]:
             if ts_field in processed and processed[ts_field]:
-                processed[ts_field] = format_iso(parse_datetime(processed[ts_field]))
+                processed[ts_field] = normalize_iso(processed[ts_field])
 
         # Convert JSON fields
         if "thumbnail" in processed and processed["thumbnail"]:
@@ -639,7 +713,7 @@ class DatabaseManager:
             media_items = processed.pop("media", None)
 
         if "productLinks" in processed and processed["productLinks"]:
-            processed["productlinks_json"] = json.dumps(processed["productLinks"])
+            processed["productlinks_json"] = dump_json(processed["productLinks"])
             del processed["productLinks"]
 
         # Remove fields not in PostRow
@@ -696,7 +770,7 @@ class DatabaseManager:
 
         # Process timestamps
         if "createdAt" in topic_data and topic_data["createdAt"]:
-            topic_data["createdAt"] = format_iso(parse_datetime(topic_data["createdAt"]))
+            topic_data["createdAt"] = normalize_iso(topic_data["createdAt"])
 
         if existing:
             for key, value in topic_data.items():
@@ -710,7 +784,7 @@ class DatabaseManager:
         return topic_row
 
     def link_post_topics(self, post_id: str, topic_ids: list[str]) -> None:
-        """Create post-topic links.
+        """Create post-topic links with one INSERT, skipping links that already exist.
 
         Args:
             post_id: Post ID
@@ -719,22 +793,13 @@ class DatabaseManager:
         if self.session is None:
             raise RuntimeError("Database not initialized")
 
-        for topic_id in topic_ids:
-            # Check if link exists
-            stmt = select(PostTopicLink).where(
-                PostTopicLink.post_id == post_id,
-                PostTopicLink.topic_id == topic_id,
-            )
-            existing = self.session.exec(stmt).first()
-
-            if not existing:
-                link = PostTopicLink(post_id=post_id, topic_id=topic_id)
-                self.session.add(link)
-
+        if topic_ids:
+            rows = [{"post_id": post_id, "topic_id": topic_id} for topic_id in topic_ids]
+            self.session.execute(sqlite_insert(PostTopicLink).on_conflict_do_nothing(), rows)
         self.session.commit()
 
     def link_post_makers(self, post_id: str, maker_ids: list[str]) -> None:
-        """Create post-maker links.
+        """Create post-maker links with one INSERT, skipping links that already exist.
 
         Args:
             post_id: Post ID
@@ -743,17 +808,9 @@ class DatabaseManager:
         if self.session is None:
             raise RuntimeError("Database not initialized")
 
-        for maker_id in maker_ids:
-            stmt = select(MakerPostLink).where(
-                MakerPostLink.post_id == post_id,
-                MakerPostLink.user_id == maker_id,
-            )
-            existing = self.session.exec(stmt).first()
-
-            if not existing:
-                link = MakerPostLink(post_id=post_id, user_id=maker_id)
-                self.session.add(link)
-
+        if maker_ids:
+            rows = [{"post_id": post_id, "user_id": maker_id} for maker_id in maker_ids]
+            self.session.execute(sqlite_insert(MakerPostLink).on_conflict_do_nothing(), rows)
         self.session.commit()
 
     def get_crawl_state(self, entity: str) -> Optional[str]:
@@ -802,6 +859,233 @@ class DatabaseManager:
 # =============================================================================
 
 
+# Rows fetched from SQLite and written per batch during CSV export
+CSV_EXPORT_CHUNK_SIZE = 10_000
+
+# Write buffer for exported CSV files
+_CSV_WRITE_BUFFER_BYTES = 1024 * 1024
+
+# gzip level for compressed exports: level 1 keeps most of the size win at a
+# fraction of the CPU cost of the default level 9
+_CSV_GZIP_LEVEL = 1
+
+
+def _csv_filename(table: str, compress: bool) -> str:
+    """Return the export file name for a table."""
+    return f"{table}.csv.gz" if compress else f"{table}.csv"
+
+
+def _open_csv(csv_path: Path, compress: bool) -> IO[str]:
+    """Open a CSV export file for writing, gzip-compressed if requested."""
+    if compress:
+        return gzip.open(
+            csv_path, "wt", compresslevel=_CSV_GZIP_LEVEL, newline="", encoding="utf-8"
+        )
+    return open(csv_path, "w", newline="", encoding="utf-8", buffering=_CSV_WRITE_BUFFER_BYTES)
+
+
+# Declared types DuckDB's sqlite scanner reads as DATE/TIME/TIMESTAMP values and
+# re-renders in its own format; the csv writer passes the stored text through
+_DUCKDB_TEMPORAL_TYPES = ("DATE", "TIME")
+
+
+def _has_temporal_columns(conn: sqlite3.Connection, table: str) -> bool:
+    """Return whether a table declares any date or time typed column.
+
+    Args:
+        conn: Open SQLite connection used to read the table's schema
+        table: Table name
+
+    Returns:
+        True if DuckDB would convert one of the table's columns to a temporal type
+    """
+    return any(
+        marker in declared_type.upper()
+        for _, _, declared_type, *_ in conn.execute(f'PRAGMA table_info("{table}")')
+        for marker in _DUCKDB_TEMPORAL_TYPES
+    )
+
+
+def _csv_export_query(conn: sqlite3.Connection, table: str, source: str) -> str:
+    """Build the SELECT used to export a table to CSV.
+
+    SQLite stores booleans as 0/1, so BOOLEAN-declared columns (isMaker,
+    isVoted, ...) are mapped back to ``True``/``False`` to keep the CSV
+    values the datasets have always had.
+
+    Args:
+        conn: Open SQLite connection used to read the table's schema
+        table: Table name
+        source: Table reference in the executing engine's SQL
+
+    Returns:
+        SELECT statement over ``source``
+    """
+    columns = []
+    for _, name, declared_type, *_ in conn.execute(f'PRAGMA table_info("{table}")'):
+        column = '"' + name.replace('"', '""') + '"'
+        if declared_type.upper() == "BOOLEAN":
+            column = f"CASE {column} WHEN 1 THEN 'True' WHEN 0 THEN 'False' END AS {column}"
+        columns.append(column)
+    return f"SELECT {', '.join(columns) or '*'} FROM {source}"
+
+
+def _export_table_to_csv(
+    conn: sqlite3.Connection,
+    table: str,
+    csv_path: Path,
+    chunk_size: int,
+    compress: bool = False,
+) -> int:
+    """Stream one table into a CSV file in fixed-size batches.
+
+    Args:
+        conn: Open SQLite connection
+        table: Table name
+        csv_path: Destination CSV file
+        chunk_size: Rows fetched and written per batch
+        compress: Write gzip-compressed CSV
+
+    Returns:
+        Number of rows written
+    """
+    # Run the query first so a missing table does not leave an empty file behind
+    cursor = conn.execute(_csv_export_query(conn, table, f'"{table}"'))
+    rows = 0
+    try:
+        with _open_csv(csv_path, compress) as f:
+            writer = csv.writer(f)
+            writer.writerow(column[0] for column in cursor.description)
+            while batch := cursor.fetchmany(chunk_size):
+                writer.writerows(batch)
+                rows += len(batch)
+    finally:
+        cursor.close()
+    return rows
+
+
+def _connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """Open a read-only SQLite connection with the export pragmas applied.
+
+    Args:
+        db_path: SQLite database file
+
+    Returns:
+        Connection that can be used from the calling thread
+    """
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    apply_sqlite_pragmas(conn)
+    return conn
+
+
+def _snapshot_database(db_path: Path, dest: Path) -> None:
+    """Copy a consistent snapshot of the database with SQLite's online backup API.
+
+    Pages are copied in native code under a single brief read transaction, so
+    a ``sync`` writing to the live file in another process is not blocked and
+    the copy never mixes pages from before and after a commit (unlike copying
+    the database, ``-wal`` and ``-shm`` files one after another).
+
+    Args:
+        db_path: Live SQLite database file
+        dest: Snapshot file to (over)write
+    """
+    # Stale journal files next to a previous snapshot would be replayed on open
+    for path in (dest, Path(f"{dest}-wal"), Path(f"{dest}-shm")):
+        path.unlink(missing_ok=True)
+    with closing(_connect_readonly(db_path)) as src, closing(sqlite3.connect(dest)) as dst:
+        src.backup(dst)
+        # The copy inherits WAL mode; switch it back so it ships as one file
+        dst.execute("PRAGMA journal_mode=DELETE")
+
+
+def _export_table(
+    db_path: Path,
+    table: str,
+    output_dir: Path,
+    chunk_size: int,
+    compress: bool = False,
+) -> tuple[int, Path]:
+    """Export one table to ``<output_dir>/<table>.csv[.gz]`` on a private connection.
+
+    Args:
+        db_path: SQLite database file
+        table: Table name
+        output_dir: Directory to write the CSV file
+        chunk_size: Rows fetched and written per batch
+        compress: Write gzip-compressed CSV
+
+    Returns:
+        Number of rows written and the CSV path
+    """
+    csv_path = output_dir / _csv_filename(table, compress)
+    with closing(_connect_readonly(db_path)) as conn:
+        return _export_table_to_csv(conn, table, csv_path, chunk_size, compress), csv_path
+
+
+def _sql_quote(path: Path) -> str:
+    """Escape a path for use inside a single-quoted SQL string literal."""
+    return str(path).replace("'", "''")
+
+
+def _export_tables_with_duckdb(
+    db_path: Path,
+    tables: list[str],
+    output_dir: Path,
+    compress: bool = False,
+) -> list[str]:
+    """Export tables to CSV with DuckDB's multi-threaded COPY.
+
+    The SQLite file is attached read-only through DuckDB's sqlite extension,
+    and rows are formatted to CSV in vectorized native code rather than one
+    Python call per row.
+
+    Args:
+        db_path: SQLite database file
+        tables: Tables to export
+        output_dir: Directory to write CSV files
+        compress: Write gzip-compressed CSV
+
+    Returns:
+        Tables that were not exported (all of them if the sqlite extension is
+        unavailable, e.g. offline before it was first installed)
+    """
+    import duckdb
+
+    con = duckdb.connect()
+    try:
+        try:
+            con.execute("LOAD sqlite")
+            con.execute(f"ATTACH '{_sql_quote(db_path)}' AS src (TYPE sqlite, READ_ONLY)")
+        except duckdb.Error as e:
+            logger.info(f"DuckDB sqlite extension unavailable, using csv writer: {e}")
+            return tables
+
+        options = "HEADER, COMPRESSION gzip" if compress else "HEADER"
+        remaining = []
+        selects: dict[str, str] = {}
+        with closing(_connect_readonly(db_path)) as schema:
+            for table in tables:
+                # DuckDB would reformat stored timestamps, so the csv writer
+                # exports these tables to keep both paths' output identical
+                if _has_temporal_columns(schema, table):
+                    remaining.append(table)
+                else:
+                    selects[table] = _csv_export_query(schema, table, f"src.{table}")
+        for table, select in selects.items():
+            csv_path = output_dir / _csv_filename(table, compress)
+            try:
+                query = f"COPY ({select}) TO '{_sql_quote(csv_path)}' ({options})"
+                [(rows,)] = con.execute(query).fetchall()
+                logger.info(f"✅ Exported {table} ({rows} rows) to {csv_path}")
+            except duckdb.Error as e:
+                logger.debug(f"DuckDB export of {table} failed, retrying with csv writer: {e}")
+                remaining.append(table)
+        return remaining
+    finally:
+        con.close()
+
+
 class KaggleManager:
     """Manages Kaggle dataset operations.
 
@@ -832,36 +1116,53 @@ class KaggleManager:
                 logger.warning(f"⚠️ Kaggle API import failed: {exc}")
                 self.has_kaggle = False
 
-    def export_database_to_csv(self, output_dir: Optional[Path] = None) -> None:
+    def export_database_to_csv(
+        self,
+        output_dir: Optional[Path] = None,
+        chunk_size: int = CSV_EXPORT_CHUNK_SIZE,
+        compress: bool = False,
+        snapshot: bool = True,
+    ) -> None:
         """Export database tables to CSV files and copy database file.
 
+        Uses DuckDB's vectorized COPY when duckdb and its sqlite extension are
+        available. Otherwise rows are streamed from a SQLite cursor in
+        ``chunk_size`` batches, so memory stays bounded by one batch whatever
+        the table size.
+
         Args:
             output_dir: Directory to write CSV files (defaults to settings.export_dir)
+            chunk_size: Rows fetched and written per batch
+            compress: Write gzip-compressed ``<table>.csv.gz`` files instead of
+                plain CSV (several times smaller, for moving exports around)
+            snapshot: Copy the database with SQLite's backup API and export
+                from that copy; if False, copy the files and read the live
+                database directly
         """
         import shutil
 
-        import pandas as pd  # type: ignore[import-untyped]
-        from sqlalchemy import create_engine as sa_create_engine
-
         # Use settings.export_dir if output_dir not provided
         output_dir = output_dir or settings.export_dir
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Copy the SQLite database file
         db_path = Path(str(settings.database_path))
         if db_path.exists():
             dest_db = output_dir / "producthunt.db"
-            shutil.copy2(db_path, dest_db)
-            logger.info(f"✅ Copied database to {dest_db}")
-
-            # Also copy WAL and SHM files if they exist (for WAL mode)
-            for ext in ["-wal", "-shm"]:
-                wal_path = Path(str(db_path) + ext)
-                if wal_path.exists():
-                    shutil.copy2(wal_path, output_dir / f"producthunt.db{ext}")
+            if snapshot and dest_db.resolve() != db_path.resolve():
+                # Export from the snapshot so the CSVs match the shipped database
+                # and a concurrent sync never contends with the export readers
+                _snapshot_database(db_path, dest_db)
+                logger.info(f"✅ Snapshotted database to {dest_db}")
+                db_path = dest_db
+            else:
+                shutil.copy2(db_path, dest_db)
+                logger.info(f"✅ Copied database to {dest_db}")
 
-        # Export tables to CSV
-        engine = sa_create_engine(settings.database_url)
+                # Also copy WAL and SHM files if they exist (for WAL mode)
+                for ext in ["-wal", "-shm"]:
+                    wal_path = Path(str(db_path) + ext)
+                    if wal_path.exists():
+                        shutil.copy2(wal_path, output_dir / f"producthunt.db{ext}")
 
         tables = [
             "userrow",
@@ -876,14 +1177,26 @@ class KaggleManager:
             "crawlstate",
         ]
 
-        for table in tables:
-            try:
-                df = pd.read_sql_table(table, engine)
-                csv_path = output_dir / f"{table}.csv"
-                df.to_csv(csv_path, index=False)
-                logger.info(f"✅ Exported {table} ({len(df)} rows) to {csv_path}")
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to export {table}: {e}")
+        if DUCKDB_AVAILABLE and db_path.exists():
+            tables = _export_tables_with_duckdb(db_path, tables, output_dir, compress)
+            if not tables:
+                return
+
+        # Tables are independent: export them side by side, each worker on its own
+        # read-only connection (WAL lets readers run concurrently)
+        workers = max(1, min(settings.max_concurrency, len(tables)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="csv-export") as pool:
+            futures = {
+                pool.submit(_export_table, db_path, table, output_dir, chunk_size, compress): table
+                for table in tables
+            }
+            for future in as_completed(futures):
+                table = futures[future]
+                try:
+                    rows, csv_path = future.result()
+                    logger.info(f"✅ Exported {table} ({rows} rows) to {csv_path}")
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to export {table}: {e}")
 
     def publish_dataset(
         self,
@@ -64,12 +64,12 @@ Usage:
 
 
     def execute_query(query):
-        start = time.time()
+        start = time.perf_counter()
         try:
             result = client.execute(query)
             return result
         finally:
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             graphql_request_duration_seconds.labels(query_type="posts", status="success").observe(
                 duration
             )
@@ -345,14 +345,14 @@ Example:
     ```python
     import time
     
-    start = time.time()
+    start = time.perf_counter()
     try:
         result = client.fetch_posts()
         status = "success"
     except Exception:
         status = "error"
     finally:
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         graphql_request_duration_seconds.labels(
             query_type="posts",
             status=status
@@ -379,9 +379,9 @@ Example:
     ```python
     import time
     
-    start = time.time()
+    start = time.perf_counter()
     db.execute("INSERT INTO posts ...")
-    duration = time.time() - start
+    duration = time.perf_counter() - start
     
     database_query_duration_seconds.labels(
         operation="insert",
@@ -410,9 +410,9 @@ Example:
     ```python
     import time
     
-    start = time.time()
+    start = time.perf_counter()
     response = app.handle_request()
-    duration = time.time() - start
+    duration = time.perf_counter() - start
     
     http_request_duration_seconds.labels(
         status="200",
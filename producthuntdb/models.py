@@ -9,14 +9,13 @@ Models are organized into three sections:
 3. Link tables for many-to-many relationships
 """
 
-import json
 from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, field_validator
 from sqlmodel import Field, SQLModel
 
-from producthuntdb.utils import format_iso, parse_datetime
+from producthuntdb.utils import dump_json, format_iso, parse_datetime
 
 # =============================================================================
 # Section 1: Pydantic Models for GraphQL API Responses
@@ -328,26 +327,6 @@ class Post(BaseModel):
             return v["nodes"]
         return v
 
-    @field_validator("thumbnail", mode="before")
-    @classmethod
-    def _coerce_thumbnail(cls, v):
-        """Convert thumbnail dict to Media object if needed."""
-        if v is None or isinstance(v, Media):
-            return v
-        if isinstance(v, dict):
-            return Media(**v)
-        return v
-
-    @field_validator("media", mode="before")
-    @classmethod
-    def _coerce_media(cls, v):
-        """Convert media dicts to Media objects if needed."""
-        if v is None:
-            return None
-        if isinstance(v, list):
-            return [Media(**m) if isinstance(m, dict) else m for m in v]
-        return v
-
 
 class MakerProject(BaseModel):
     """A maker's project on Product Hunt.
@@ -621,7 +600,7 @@ class PostRow(SQLModel, table=True):
             thumbnail_type=post.thumbnail.type if post.thumbnail else None,
             thumbnail_url=post.thumbnail.url if post.thumbnail else None,
             thumbnail_videoUrl=post.thumbnail.videoUrl if post.thumbnail else None,
-            productlinks_json=json.dumps(post.productLinks) if post.productLinks else None,
+            productlinks_json=dump_json(post.productLinks) if post.productLinks else None,
         )
 
 
@@ -24,19 +24,121 @@ Example:
     >>> pipeline = DataPipeline(client=client, db=db)
 """
 
+import asyncio
+from collections.abc import AsyncGenerator
 from datetime import datetime
 from typing import Any
 
-from pydantic import ValidationError
+import httpx
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 from tqdm.asyncio import tqdm  # type: ignore[import-untyped]
 
-from producthuntdb.api import AsyncGraphQLClient
+from producthuntdb.api import AsyncGraphQLClient, PostFieldSet, TransientGraphQLError
 from producthuntdb.config import PostsOrder, settings
 from producthuntdb.database import DatabaseManager
 from producthuntdb.logging import logger
 from producthuntdb.models import Collection, Post, Topic
 from producthuntdb.utils import format_iso, parse_datetime
 
+# Queued pages are coalesced into one write until this many posts are pending
+WRITE_BATCH_POSTS = 500
+
+
+# Validates a whole page in one call into the compiled pydantic-core validator
+_POSTS_ADAPTER = TypeAdapter(list[Post])
+
+
+def _validate_posts(nodes: list[dict[str, Any]]) -> list[Post | Exception]:
+    """Validate a page of raw post nodes.
+
+    Runs in a worker thread so the event loop stays free to service in-flight
+    requests while a page is being validated. The page is validated as a
+    single list; only if that fails are nodes validated one by one to find
+    the bad ones.
+
+    Args:
+        nodes: Raw post nodes from a posts page
+
+    Returns:
+        A validated Post, or the exception raised while validating it, per node
+    """
+    try:
+        return list(_POSTS_ADAPTER.validate_python(nodes))
+    except ValidationError:
+        pass
+
+    results: list[Post | Exception] = []
+    for post_data in nodes:
+        try:
+            results.append(Post(**post_data))
+        except (TypeError, ValueError) as e:
+            results.append(e)
+    return results
+
+
+async def _produce_pages(
+    pages: AsyncGenerator[dict[str, Any], None],
+    queue: asyncio.Queue[dict[str, Any] | Exception | None],
+) -> None:
+    """Feed pages into a bounded queue for the writer, ending with ``None``.
+
+    A fetch error is queued in place of the next page, so the writer still
+    stores every page that arrived before it.
+
+    Args:
+        pages: Page iterator to drain
+        queue: Bounded queue shared with the writer
+    """
+    try:
+        async for page in pages:
+            await queue.put(page)
+    except (TransientGraphQLError, RuntimeError, httpx.HTTPError) as e:
+        await queue.put(e)
+        return
+    finally:
+        await pages.aclose()
+    await queue.put(None)
+
+
+async def _next_page(
+    queue: asyncio.Queue[dict[str, Any] | Exception | None],
+    producer: asyncio.Task[None],
+) -> dict[str, Any] | Exception | None:
+    """Wait for the producer's next queued item.
+
+    Fetch errors are queued by the producer, but anything else ends the
+    producer task without queueing a terminator, so the writer waits on the
+    task as well as the queue and re-raises such a failure.
+
+    Args:
+        queue: Queue filled by ``_produce_pages``
+        producer: Task running ``_produce_pages``
+
+    Returns:
+        The next page, fetch error, or ``None`` once all pages were queued
+    """
+    getter = asyncio.ensure_future(queue.get())
+    try:
+        await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+        if getter.done():
+            return getter.result()
+    finally:
+        getter.cancel()
+    if queue.empty():
+        producer.result()
+        return None
+    return queue.get_nowait()
+
+
+def _post_topics(post: Post) -> list[Topic]:
+    """Return a post's topics as Topic models."""
+    # Topics are normally already Topic objects from Pydantic parsing
+    return [
+        topic if isinstance(topic, Topic) else Topic(**topic)  # type: ignore[arg-type]
+        for topic in post.topics or []
+    ]
+
 
 class DataPipeline:
     """Orchestrates data extraction, transformation, and loading.
@@ -75,6 +177,8 @@ class DataPipeline:
         """
         self.client = client or AsyncGraphQLClient()
         self.db = db or DatabaseManager()
+        # Serializes use of the shared DB session across concurrent syncs
+        self._db_lock = asyncio.Lock()
 
     async def initialize(self) -> None:
         """Initialize pipeline components."""
@@ -163,114 +267,115 @@ class DataPipeline:
         if not full_refresh:
             last_timestamp = self.db.get_crawl_state("posts")
             if last_timestamp:
-                posted_after = self._get_safety_cutoff(last_timestamp)
+                # Format once; the cutoff is invariant across pages
+                posted_after = format_iso(self._get_safety_cutoff(last_timestamp))
                 logger.info(
-                    f"📅 Incremental update from {format_iso(posted_after)} "
+                    f"📅 Incremental update from {posted_after} "
                     f"(safety margin: {settings.safety_minutes} minutes)"
                 )
 
-        # Pagination loop
-        cursor = None
-        has_next_page = True
+        # Fetcher and writer run concurrently, connected by a bounded queue: the
+        # fetcher keeps paging while the writer commits in a worker thread
         latest_timestamp = None
+        pages = self.client.iter_posts_pages(
+            posted_after_dt=posted_after,
+            first=settings.page_size,
+            order=PostsOrder.NEWEST,
+            max_pages=max_pages,
+        )
+        queue: asyncio.Queue[dict[str, Any] | Exception | None] = asyncio.Queue(
+            maxsize=settings.max_concurrency * 2
+        )
+        producer = asyncio.create_task(_produce_pages(pages, queue))
 
         with tqdm(desc="Fetching posts", unit=" pages") as pbar:
-            while has_next_page:
-                # Check max pages limit
-                if max_pages and stats["pages"] >= max_pages:
-                    logger.info(f"⏹️ Reached max pages limit: {max_pages}")
-                    break
+            try:
+                finished = False
+                while not finished:
+                    # Take the next page plus any already queued, up to one write batch
+                    batch = [await _next_page(queue, producer)]
+                    pending = len(batch[0].get("nodes", [])) if isinstance(batch[0], dict) else 0
+                    while (
+                        isinstance(batch[-1], dict)
+                        and pending < WRITE_BATCH_POSTS
+                        and not queue.empty()
+                    ):
+                        batch.append(queue.get_nowait())
+                        if isinstance(batch[-1], dict):
+                            pending += len(batch[-1].get("nodes", []))
+
+                    nodes: list[dict[str, Any]] = []
+                    page_info: dict[str, Any] = {}
+                    batch_pages = 0
+                    error: Exception | None = None
+                    for item in batch:
+                        if item is None:
+                            finished = True
+                            break
+                        if isinstance(item, Exception):
+                            error = item
+                            finished = True
+                            break
+                        if not item.get("nodes"):
+                            logger.info("✅ No more posts to fetch")
+                            finished = True
+                            break
+                        nodes.extend(item["nodes"])
+                        page_info = item.get("pageInfo", {})
+                        batch_pages += 1
+
+                    if nodes:
+                        # Validate the batch off the event loop
+                        validated = await asyncio.to_thread(_validate_posts, nodes)
+
+                        posts: list[Post] = []
+                        for post_data, post in zip(nodes, validated, strict=True):
+                            if isinstance(post, ValidationError):
+                                logger.warning(
+                                    f"⚠️ Validation error for post {post_data.get('id')}: {post}"
+                                )
+                                stats["skipped"] += 1
+                            elif isinstance(post, Exception):
+                                logger.error(
+                                    f"❌ Error processing post {post_data.get('id')}: {post}"
+                                )
+                                stats["skipped"] += 1
+                            else:
+                                posts.append(post)
 
-                try:
-                    # Fetch page
-                    posts_response = await self.client.fetch_posts_page(
-                        after_cursor=cursor,
-                        posted_after_dt=posted_after,
-                        first=settings.page_size,
-                        order=PostsOrder.NEWEST,
-                    )
+                                # Track latest timestamp
+                                if post.createdAt:
+                                    if not latest_timestamp or post.createdAt > latest_timestamp:
+                                        latest_timestamp = post.createdAt
 
-                    nodes = posts_response.get("nodes", [])
-                    page_info = posts_response.get("pageInfo", {})
+                        async with self._db_lock:
+                            await asyncio.to_thread(self._store_posts, posts, stats)
 
-                    if not nodes:
-                        logger.info("✅ No more posts to fetch")
-                        break
+                        stats["pages"] += batch_pages
 
-                    # Process each post
-                    for post_data in nodes:
-                        try:
-                            # Parse and validate with Pydantic
-                            post = Post(**post_data)
-
-                            # Track latest timestamp
-                            if post.createdAt:
-                                if not latest_timestamp or post.createdAt > latest_timestamp:
-                                    latest_timestamp = post.createdAt
-
-                            # Store user (submitter)
-                            if post.user:
-                                self.db.upsert_user(post.user.model_dump())
-                                stats["users"] += 1
-
-                            # Store makers
-                            for maker in post.makers:
-                                self.db.upsert_user(maker.model_dump())
-                                stats["users"] += 1
-
-                            # Store topics
-                            topic_ids = []
-                            if post.topics:
-                                for topic_dict in post.topics:
-                                    # topic_dict is already a Topic object from Pydantic parsing
-                                    if isinstance(topic_dict, Topic):
-                                        topic = topic_dict
-                                    else:
-                                        topic = Topic(**topic_dict)  # type: ignore[arg-type]
-                                    self.db.upsert_topic(topic.model_dump())
-                                    topic_ids.append(topic.id)
-                                    stats["topics"] += 1
-
-                            # Store post
-                            self.db.upsert_post(post.model_dump())
-
-                            # Create relationships
-                            if topic_ids:
-                                self.db.link_post_topics(post.id, topic_ids)
-
-                            maker_ids = [m.id for m in post.makers]
-                            if maker_ids:
-                                self.db.link_post_makers(post.id, maker_ids)
-
-                            stats["posts"] += 1
-
-                        except ValidationError as e:
-                            logger.warning(
-                                f"⚠️ Validation error for post {post_data.get('id')}: {e}"
-                            )
-                            stats["skipped"] += 1
-                            continue
-
-                        except Exception as e:
-                            logger.error(f"❌ Error processing post {post_data.get('id')}: {e}")
-                            stats["skipped"] += 1
-                            continue
-
-                    # Update pagination
-                    cursor = page_info.get("endCursor")
-                    has_next_page = page_info.get("hasNextPage", False)
-                    stats["pages"] += 1
+                        pbar.update(batch_pages)
+                        pbar.set_postfix(
+                            posts=stats["posts"],
+                            users=stats["users"],
+                            topics=stats["topics"],
+                        )
 
-                    pbar.update(1)
-                    pbar.set_postfix(
-                        posts=stats["posts"],
-                        users=stats["users"],
-                        topics=stats["topics"],
-                    )
+                    if error is not None:
+                        raise error
 
-                except Exception as e:
-                    logger.error(f"❌ Error fetching posts page: {e}")
-                    break
+                    # Check max pages limit
+                    if max_pages and stats["pages"] >= max_pages:
+                        if page_info.get("hasNextPage"):
+                            logger.info(f"⏹️ Reached max pages limit: {max_pages}")
+                        finished = True
+
+            except Exception as e:
+                logger.error(f"❌ Error fetching posts page: {e}")
+
+            finally:
+                # A producer failure has already surfaced through _next_page
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
 
         # Update crawl state
         if latest_timestamp:
@@ -282,6 +387,133 @@ class DataPipeline:
         logger.info(f"✅ Posts sync complete: {stats}")
         return stats
 
+    async def refresh_post_counts(self, max_pages: int | None = None) -> dict[str, int]:
+        """Refresh vote and comment counts of stored posts, newest first.
+
+        Incremental syncs only fetch posts created since the last run, so the
+        counts of older posts go stale. This walks the posts with the
+        ``PostFieldSet.MINIMAL`` query (no makers, topics or media) and updates
+        only the counts of posts already in the database.
+
+        Args:
+            max_pages: Maximum pages to fetch (None for unlimited)
+
+        Returns:
+            Statistics dictionary with counts
+
+        Example:
+            >>> stats = await pipeline.refresh_post_counts(max_pages=10)
+            >>> print(f"Refreshed {stats['posts']} posts")
+        """
+        logger.info("🚀 Starting post counts refresh")
+
+        stats = {"posts": 0, "pages": 0}
+
+        pages = self.client.iter_posts_pages(
+            first=settings.page_size,
+            order=PostsOrder.NEWEST,
+            fields=PostFieldSet.MINIMAL,
+            max_pages=max_pages,
+        )
+        with tqdm(desc="Refreshing post counts", unit=" pages") as pbar:
+            async for page in pages:
+                async with self._db_lock:
+                    stats["posts"] += await asyncio.to_thread(
+                        self.db.update_post_counts, page.get("nodes", [])
+                    )
+                stats["pages"] += 1
+
+                pbar.update(1)
+                pbar.set_postfix(posts=stats["posts"])
+
+        logger.info(f"✅ Post counts refresh complete: {stats}")
+        return stats
+
+    def _store_posts(self, posts: list[Post], stats: dict[str, int]) -> None:
+        """Store a page of validated posts with their users, topics and links.
+
+        The page is written in a single transaction. If that fails, the posts
+        are stored one at a time so a single bad post only skips itself.
+
+        Args:
+            posts: Validated posts from one page
+            stats: Sync statistics, updated in place
+        """
+        users: dict[str, dict[str, Any]] = {}
+        topics: dict[str, dict[str, Any]] = {}
+        topic_links: list[tuple[str, str]] = []
+        maker_links: list[tuple[str, str]] = []
+        counts = {"users": 0, "topics": 0}
+
+        for post in posts:
+            for user in ([post.user] if post.user else []) + list(post.makers):
+                users[user.id] = user.model_dump()
+                counts["users"] += 1
+            for topic in _post_topics(post):
+                topics[topic.id] = topic.model_dump()
+                topic_links.append((post.id, topic.id))
+                counts["topics"] += 1
+            maker_links.extend((post.id, maker.id) for maker in post.makers)
+
+        try:
+            self.db.upsert_posts_page(
+                posts=[post.model_dump() for post in posts],
+                users=list(users.values()),
+                topics=list(topics.values()),
+                post_topic_links=topic_links,
+                post_maker_links=maker_links,
+            )
+        except (SQLAlchemyError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Page write failed, storing posts individually: {e}")
+            for post in posts:
+                try:
+                    self._store_post(post, stats)
+                except Exception as e:
+                    logger.error(f"❌ Error processing post {post.id}: {e}")
+                    stats["skipped"] += 1
+            return
+
+        stats["users"] += counts["users"]
+        stats["topics"] += counts["topics"]
+        stats["posts"] += len(posts)
+
+    def _store_post(self, post: Post, stats: dict[str, int]) -> None:
+        """Store a single validated post with its users, topics and links.
+
+        Args:
+            post: Validated post
+            stats: Sync statistics, updated in place
+        """
+        # Store user (submitter)
+        if post.user:
+            self.db.upsert_user(post.user.model_dump())
+            stats["users"] += 1
+
+        # Store makers
+        for maker in post.makers:
+            self.db.upsert_user(maker.model_dump())
+            stats["users"] += 1
+
+        # Store topics
+        topic_ids = []
+        for topic in _post_topics(post):
+            self.db.upsert_topic(topic.model_dump())
+            topic_ids.append(topic.id)
+            stats["topics"] += 1
+
+        # Store post
+        self.db.upsert_post(post.model_dump())
+
+        # Create relationships
+        if topic_ids:
+            self.db.link_post_topics(post.id, topic_ids)
+
+        maker_ids = [m.id for m in post.makers]
+        if maker_ids:
+            self.db.link_post_makers(post.id, maker_ids)
+
+        stats["posts"] += 1
+
     async def sync_topics(
         self,
         max_pages: int | None = None,
@@ -328,23 +560,8 @@ class DataPipeline:
                         logger.info("✅ No more topics to fetch")
                         break
 
-                    for topic_data in nodes:
-                        try:
-                            topic = Topic(**topic_data)
-                            self.db.upsert_topic(topic.model_dump())
-                            stats["topics"] += 1
-
-                        except ValidationError as e:
-                            logger.warning(
-                                f"⚠️ Validation error for topic {topic_data.get('id')}: {e}"
-                            )
-                            stats["skipped"] += 1
-                            continue
-
-                        except Exception as e:
-                            logger.error(f"❌ Error processing topic {topic_data.get('id')}: {e}")
-                            stats["skipped"] += 1
-                            continue
+                    async with self._db_lock:
+                        await asyncio.to_thread(self._store_topics, nodes, stats)
 
                     cursor = page_info.get("endCursor")
                     has_next_page = page_info.get("hasNextPage", False)
@@ -360,6 +577,29 @@ class DataPipeline:
         logger.info(f"✅ Topics sync complete: {stats}")
         return stats
 
+    def _store_topics(self, nodes: list[dict[str, Any]], stats: dict[str, int]) -> None:
+        """Validate and store a page of topics.
+
+        Args:
+            nodes: Raw topic nodes from one page
+            stats: Sync statistics, updated in place
+        """
+        for topic_data in nodes:
+            try:
+                topic = Topic(**topic_data)
+                self.db.upsert_topic(topic.model_dump())
+                stats["topics"] += 1
+
+            except ValidationError as e:
+                logger.warning(f"⚠️ Validation error for topic {topic_data.get('id')}: {e}")
+                stats["skipped"] += 1
+                continue
+
+            except Exception as e:
+                logger.error(f"❌ Error processing topic {topic_data.get('id')}: {e}")
+                stats["skipped"] += 1
+                continue
+
     async def sync_collections(
         self,
         max_pages: int | None = None,
@@ -407,48 +647,8 @@ class DataPipeline:
                         logger.info("✅ No more collections to fetch")
                         break
 
-                    for collection_data in nodes:
-                        try:
-                            collection = Collection(**collection_data)
-
-                            # Store curator user
-                            if collection.user:
-                                self.db.upsert_user(collection.user.model_dump())
-                                stats["users"] += 1
-
-                            # Store collection
-                            from producthuntdb.models import CollectionRow
-
-                            if self.db.session is None:
-                                raise RuntimeError("Database not initialized")
-
-                            collection_row = CollectionRow.from_pydantic(collection)
-                            existing_collection = self.db.session.get(CollectionRow, collection.id)
-
-                            if existing_collection:
-                                # Update existing
-                                for key, value in collection_row.model_dump().items():
-                                    setattr(existing_collection, key, value)
-                            else:
-                                self.db.session.add(collection_row)
-
-                            self.db.session.commit()
-                            stats["collections"] += 1
-
-                        except ValidationError as e:
-                            logger.warning(
-                                f"⚠️ Validation error for collection "
-                                f"{collection_data.get('id')}: {e}"
-                            )
-                            stats["skipped"] += 1
-                            continue
-
-                        except Exception as e:
-                            logger.error(
-                                f"❌ Error processing collection {collection_data.get('id')}: {e}"
-                            )
-                            stats["skipped"] += 1
-                            continue
+                    async with self._db_lock:
+                        await asyncio.to_thread(self._store_collections, nodes, stats)
 
                     cursor = page_info.get("endCursor")
                     has_next_page = page_info.get("hasNextPage", False)
@@ -464,6 +664,53 @@ class DataPipeline:
         logger.info(f"✅ Collections sync complete: {stats}")
         return stats
 
+    def _store_collections(self, nodes: list[dict[str, Any]], stats: dict[str, int]) -> None:
+        """Validate and store a page of collections with their curators.
+
+        Args:
+            nodes: Raw collection nodes from one page
+            stats: Sync statistics, updated in place
+        """
+        for collection_data in nodes:
+            try:
+                collection = Collection(**collection_data)
+
+                # Store curator user
+                if collection.user:
+                    self.db.upsert_user(collection.user.model_dump())
+                    stats["users"] += 1
+
+                # Store collection
+                from producthuntdb.models import CollectionRow
+
+                if self.db.session is None:
+                    raise RuntimeError("Database not initialized")
+
+                collection_row = CollectionRow.from_pydantic(collection)
+                existing_collection = self.db.session.get(CollectionRow, collection.id)
+
+                if existing_collection:
+                    # Update existing
+                    for key, value in collection_row.model_dump().items():
+                        setattr(existing_collection, key, value)
+                else:
+                    self.db.session.add(collection_row)
+
+                self.db.session.commit()
+                stats["collections"] += 1
+
+            except ValidationError as e:
+                logger.warning(
+                    f"⚠️ Validation error for collection {collection_data.get('id')}: {e}"
+                )
+                stats["skipped"] += 1
+                continue
+
+            except Exception as e:
+                logger.error(f"❌ Error processing collection {collection_data.get('id')}: {e}")
+                stats["skipped"] += 1
+                continue
+
     async def sync_all(
         self,
         full_refresh: bool = False,
@@ -487,10 +734,20 @@ class DataPipeline:
         # Verify authentication first
         await self.verify_authentication()
 
-        # Sync all entities
-        posts_stats = await self.sync_posts(full_refresh, max_pages)
-        topics_stats = await self.sync_topics(max_pages)
-        collections_stats = await self.sync_collections(max_pages)
+        # Sync all entities concurrently; their requests multiplex over the shared
+        # HTTP/2 connection and _db_lock serializes use of the shared session.
+        # The TaskGroup cancels the other syncs as soon as one of them fails.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                posts_task = tg.create_task(self.sync_posts(full_refresh, max_pages))
+                topics_task = tg.create_task(self.sync_topics(max_pages))
+                collections_task = tg.create_task(self.sync_collections(max_pages))
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from group
+
+        posts_stats = posts_task.result()
+        topics_stats = topics_task.result()
+        collections_stats = collections_task.result()
 
         combined_stats = {
             "posts": posts_stats,
@@ -528,25 +785,22 @@ class DataPipeline:
         if self.db.session is None:
             raise RuntimeError("Database not initialized")
 
-        stats = {
-            "posts": self.db.session.exec(
-                select(func.count(PostRow.id))  # type: ignore[arg-type]
-            ).one(),
-            "users": self.db.session.exec(
-                select(func.count(UserRow.id))  # type: ignore[arg-type]
-            ).one(),
-            "topics": self.db.session.exec(
-                select(func.count(TopicRow.id))  # type: ignore[arg-type]
-            ).one(),
-            "collections": self.db.session.exec(
-                select(func.count(CollectionRow.id))  # type: ignore[arg-type]
-            ).one(),
-            "comments": self.db.session.exec(
-                select(func.count(CommentRow.id))  # type: ignore[arg-type]
-            ).one(),
-            "votes": self.db.session.exec(
-                select(func.count(VoteRow.id))  # type: ignore[arg-type]
-            ).one(),
+        tables = {
+            "posts": PostRow,
+            "users": UserRow,
+            "topics": TopicRow,
+            "collections": CollectionRow,
+            "comments": CommentRow,
+            "votes": VoteRow,
         }
 
+        # One round trip: a scalar COUNT subquery per table
+        counts = select(
+            *(
+                select(func.count()).select_from(model).scalar_subquery().label(name)
+                for name, model in tables.items()
+            )
+        )
+        row = self.db.session.exec(counts).one()
+        stats = dict(zip(tables, row, strict=True))
         return stats
@@ -4,11 +4,22 @@ This module provides common helper functions for datetime handling,
 GraphQL query construction, and data transformation.
 """
 
-from datetime import UTC, datetime
+import json
+import re
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from dateutil import parser as dateutil_parser  # type: ignore[import-untyped]
 
+# orjson serialization (optional - falls back to stdlib json if not installed)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def parse_datetime(value: str | datetime | None) -> datetime | None:
     """Parse ISO8601 timestamp string into timezone-aware UTC datetime.
@@ -36,7 +47,12 @@ def parse_datetime(value: str | datetime | None) -> datetime | None:
             value = value.replace(tzinfo=UTC)
         return value.astimezone(UTC)
 
-    dt = dateutil_parser.isoparse(value)
+    # datetime.fromisoformat is C-implemented and handles the API's
+    # "2024-01-15T10:30:00Z" form; dateutil covers the rarer ISO variants
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        dt = dateutil_parser.isoparse(value)
 
     # Ensure timezone-aware in UTC
     if dt.tzinfo is None:
@@ -90,9 +106,69 @@ def format_iso(dt: datetime | None) -> str | None:
     """
     if dt is None:
         return None
+    # Key on the offset too: aware datetimes in different zones compare equal
+    return _format_iso_cached(dt, dt.utcoffset())
+
+
+@lru_cache(maxsize=512)
+def _format_iso_cached(dt: datetime, utcoffset: timedelta | None) -> str:
+    """Memoized ISO8601 formatting backing ``format_iso``."""
     return dt.isoformat().replace("+00:00", "Z")
 
 
+# Exactly what format_iso emits: whole seconds, or six non-zero-only fraction digits
+_CANONICAL_ISO = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.(?!0{6})\d{6})?Z\Z")
+
+
+def normalize_iso(value: str | datetime) -> str:
+    """Normalize a timestamp to ``format_iso``'s UTC ISO8601 form.
+
+    Strings already in that form (as the API returns them) are passed
+    through without building a datetime; anything else is parsed and
+    reformatted.
+
+    Args:
+        value: ISO8601 timestamp string or datetime
+
+    Returns:
+        ISO8601 string in UTC with 'Z' suffix
+
+    Raises:
+        ValueError: If a non-canonical string is not a valid timestamp
+
+    Example:
+        >>> normalize_iso("2024-01-15T10:30:00Z")
+        '2024-01-15T10:30:00Z'
+        >>> normalize_iso("2024-01-15T12:30:00+02:00")
+        '2024-01-15T10:30:00Z'
+    """
+    if isinstance(value, str) and _CANONICAL_ISO.match(value):
+        return value
+    return format_iso(parse_datetime(value))  # type: ignore[return-value]
+
+
+def dump_json(value: Any) -> str:
+    """Serialize a value to compact JSON text for storage.
+
+    Uses no whitespace between tokens and keeps non-ASCII characters as-is,
+    which is both smaller and faster to encode than ``json.dumps`` defaults.
+    Encodes with orjson when available; the output is the same either way.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON string
+
+    Example:
+        >>> dump_json([{"type": "website", "url": "https://example.com"}])
+        '[{"type":"website","url":"https://example.com"}]'
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
 def redact_token(token: str | None) -> str:
     """Redact sensitive tokens for safe logging.
 
@@ -11,12 +11,27 @@ Priority: High - Critical path for data ingestion
 """
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from producthuntdb.api import AsyncGraphQLClient, TransientGraphQLError
+from producthuntdb.api import (
+    QUERY_POSTS_PAGE,
+    AdaptiveRateLimiter,
+    AsyncGraphQLClient,
+    PostFieldSet,
+    RateLimitedError,
+    TransientGraphQLError,
+    _parse_reset,
+    _retry_wait,
+    _seconds_until_reset,
+    build_posts_query,
+    close_shared_client,
+    encode_graphql_request,
+    get_shared_client,
+)
 
 
 # =============================================================================
@@ -202,6 +217,17 @@ async def test_no_retry_on_permanent_errors():
         assert call_count == 1
 
 
+def test_retry_wait_follows_backoff_schedule():
+    """Test precomputed backoff grows exponentially within its bounds."""
+    delays = [_retry_wait(MagicMock(attempt_number=n)) for n in (1, 2, 3, 7, 50)]
+
+    assert 5.0 <= delays[0] < 10.0  # 3s clamped up to the 5s minimum
+    assert 6.0 <= delays[1] < 11.0
+    assert 12.0 <= delays[2] < 17.0
+    assert 120.0 <= delays[3] < 125.0  # capped at 120s
+    assert 120.0 <= delays[4] < 125.0
+
+
 # =============================================================================
 # Rate Limiting Tests
 # =============================================================================
@@ -266,13 +292,10 @@ async def test_get_rate_limit_status():
 
 
 @pytest.mark.asyncio
-async def test_adaptive_delay_when_rate_limit_low():
-    """Test adaptive delay increases when rate limit is low."""
+async def test_no_delay_before_rate_limit_is_known():
+    """Test requests are not throttled until rate limit headers arrive."""
     client = AsyncGraphQLClient(token="test_token")
 
-    # Set low rate limit
-    client._rate_limit_remaining = "3"
-
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {}
@@ -282,66 +305,87 @@ async def test_adaptive_delay_when_rate_limit_low():
     mock_client.post = AsyncMock(return_value=mock_response)
 
     with patch.object(client, "_ensure_client", return_value=mock_client):
-        with patch("asyncio.sleep") as mock_sleep:
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
             await client._post_with_retry("query", {})
 
-            # Should use 5 second delay for remaining < 5
-            mock_sleep.assert_called()
-            # The actual call might be 5.0 or similar
-            sleep_call = mock_sleep.call_args[0][0]
-            assert sleep_call >= 4.5  # Allow some variation
+            mock_sleep.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_adaptive_delay_when_rate_limit_moderate():
-    """Test adaptive delay is moderate when rate limit is medium."""
-    client = AsyncGraphQLClient(token="test_token")
+async def test_token_bucket_spends_headroom_without_delay():
+    """Test remaining budget is spent immediately, not at a fixed pace."""
+    limiter = AdaptiveRateLimiter()
+    limiter.update(remaining=80, reset_seconds=800)
 
-    # Set moderate rate limit
-    client._rate_limit_remaining = "15"
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        for _ in range(10):
+            await limiter.acquire()
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.headers = {}
-    mock_response.json.return_value = {"data": {"test": "data"}}
+        mock_sleep.assert_not_called()
 
-    mock_client = MagicMock()
-    mock_client.post = AsyncMock(return_value=mock_response)
 
-    with patch.object(client, "_ensure_client", return_value=mock_client):
-        with patch("asyncio.sleep") as mock_sleep:
-            await client._post_with_retry("query", {})
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill_when_empty():
+    """Test an empty bucket waits roughly one refill interval per request."""
+    limiter = AdaptiveRateLimiter()
+    limiter.update(remaining=1, reset_seconds=10)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await limiter.acquire()
+        mock_sleep.assert_not_called()
 
-            # Should use 3 second delay for 5 <= remaining < 20
-            mock_sleep.assert_called()
-            sleep_call = mock_sleep.call_args[0][0]
-            assert 2.5 <= sleep_call <= 3.5
+        await limiter.acquire()
+        assert 9.0 <= mock_sleep.call_args[0][0] <= 10.0
 
 
 @pytest.mark.asyncio
-async def test_adaptive_delay_when_rate_limit_high():
-    """Test adaptive delay is minimal when rate limit is high."""
+async def test_token_bucket_charges_complexity_points_per_request():
+    """Test a points-based budget is spent at the observed cost per request."""
     client = AsyncGraphQLClient(token="test_token")
-
-    # Set high rate limit
-    client._rate_limit_remaining = "80"
-
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.headers = {}
-    mock_response.json.return_value = {"data": {"test": "data"}}
+    limiter = client._limiter
+
+    responses = []
+    for remaining in ("6250", "6200"):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {
+            "X-RateLimit-Limit": "6250",
+            "X-RateLimit-Remaining": remaining,
+            "X-RateLimit-Reset": "900",
+        }
+        response.json.return_value = {"data": {}}
+        responses.append(response)
 
     mock_client = MagicMock()
-    mock_client.post = AsyncMock(return_value=mock_response)
+    mock_client.post = AsyncMock(side_effect=responses)
 
     with patch.object(client, "_ensure_client", return_value=mock_client):
-        with patch("asyncio.sleep") as mock_sleep:
-            await client._post_with_retry("query", {})
+        await client._do_http_post("query", {})
+        await client._do_http_post("query", {})
+
+    assert limiter.cost == pytest.approx(50.0)
+    assert limiter.interval == pytest.approx(50.0 * 900 / 6200)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        # 6200 points cover 124 requests at 50 points each, not 6200 requests
+        for _ in range(124):
+            await limiter.acquire()
+        mock_sleep.assert_not_called()
+
+        await limiter.acquire()
+        mock_sleep.assert_awaited_once()
+
 
-            # Should use 2 second delay for remaining >= 20
-            mock_sleep.assert_called()
-            sleep_call = mock_sleep.call_args[0][0]
-            assert 1.5 <= sleep_call <= 2.5
+@pytest.mark.asyncio
+async def test_token_bucket_exhausted_budget_waits_for_reset():
+    """Test a zero remaining budget holds callers until the window resets."""
+    limiter = AdaptiveRateLimiter()
+    limiter.update(remaining=0, reset_seconds=60)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await limiter.acquire()
+
+        assert 55.0 <= mock_sleep.call_args[0][0] <= 60.0
 
 
 # =============================================================================
@@ -470,6 +514,32 @@ async def test_semaphore_limits_concurrency():
             assert max_active <= 2
 
 
+@pytest.mark.asyncio
+async def test_iter_posts_pages_prefetches_next_page():
+    """Test the next page is requested before the caller finishes the current one."""
+    client = AsyncGraphQLClient(token="test_token")
+    requested = []
+
+    async def mock_fetch(after_cursor=None, **kwargs):
+        requested.append(after_cursor)
+        index = len(requested)
+        return {
+            "nodes": [{"id": str(index)}],
+            "pageInfo": {"endCursor": f"c{index}", "hasNextPage": True},
+        }
+
+    seen = []
+    with patch.object(client, "fetch_posts_page", side_effect=mock_fetch):
+        async for page in client.iter_posts_pages(max_pages=3):
+            await asyncio.sleep(0)
+            seen.append(page["nodes"][0]["id"])
+            # The following page is already in flight while this one is handled
+            assert len(requested) == min(len(seen) + 1, 3)
+
+    assert seen == ["1", "2", "3"]
+    assert requested == [None, "c1", "c2"]
+
+
 # =============================================================================
 # Context Manager Tests
 # =============================================================================
@@ -513,6 +583,20 @@ async def test_context_manager_with_exception():
 # =============================================================================
 
 
+@pytest.mark.asyncio
+async def test_shared_client_reused_within_event_loop():
+    """Test the shared client is reused per loop until explicitly closed."""
+    client = get_shared_client()
+    assert get_shared_client() is client
+
+    with patch.object(client, "close", new_callable=AsyncMock) as mock_close:
+        await close_shared_client()
+
+    mock_close.assert_awaited_once()
+    assert get_shared_client() is not client
+    await close_shared_client()
+
+
 @pytest.mark.asyncio
 async def test_http2_enabled():
     """Test HTTP/2 is enabled in client configuration."""
@@ -528,6 +612,50 @@ async def test_http2_enabled():
         assert call_kwargs.get("http2") is True
 
 
+@pytest.mark.asyncio
+async def test_headers_built_once_per_client():
+    """Test the pooled client reuses the pre-built request headers."""
+    client = AsyncGraphQLClient(token="test_token")
+
+    with patch("httpx.AsyncClient") as mock_async_client:
+        await client._ensure_client()
+
+        headers = mock_async_client.call_args[1]["headers"]
+        assert headers is client._headers
+        assert headers["authorization"] == "Bearer test_token"
+
+
+@pytest.mark.asyncio
+async def test_compressed_responses_requested():
+    """Test the client asks for every response encoding httpx can decode."""
+    from httpx._decoders import SUPPORTED_DECODERS
+
+    async with AsyncGraphQLClient(token="test_token") as client:
+        accept_encoding = client._client.headers["accept-encoding"]
+
+    assert "gzip" in accept_encoding
+    for encoding in SUPPORTED_DECODERS:
+        if encoding != "identity":
+            assert encoding in accept_encoding
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_backend_selected_by_setting(monkeypatch):
+    """Test HTTP_BACKEND=aiohttp swaps the transport behind the same client API."""
+    pytest.importorskip("aiohttp")
+    from producthuntdb.api import _AiohttpClient
+    from producthuntdb.config import HttpBackend, settings
+
+    monkeypatch.setattr(settings, "http_backend", HttpBackend.AIOHTTP)
+
+    async with AsyncGraphQLClient(token="test_token", max_concurrency=8) as client:
+        assert isinstance(client._client, _AiohttpClient)
+        # HTTP/1.1 needs a connection per in-flight request
+        assert client._client._session.connector.limit == 8
+
+    assert client._client is None
+
+
 @pytest.mark.asyncio
 async def test_connection_pool_limits():
     """Test connection pool is configured correctly."""
@@ -541,8 +669,8 @@ async def test_connection_pool_limits():
 
         # Verify default limits are set
         assert limits is not None
-        assert limits.max_connections == 100
-        assert limits.max_keepalive_connections == 20
+        assert limits.max_connections == 4
+        assert limits.max_keepalive_connections == 4
 
 
 @pytest.mark.asyncio
@@ -556,3 +684,318 @@ async def test_custom_timeout_configuration():
 
         call_kwargs = mock_async_client.call_args[1]
         assert call_kwargs.get("timeout") == custom_timeout
+
+
+# =============================================================================
+# Request Encoding Tests
+# =============================================================================
+
+
+def test_encode_graphql_request_round_trips():
+    """Test pre-encoded envelope produces a valid GraphQL request body."""
+    variables = {"first": 10, "after": None, "order": "NEWEST", "postedAfter": "2024-01-01T00:00:00Z"}
+
+    body = encode_graphql_request(QUERY_POSTS_PAGE, variables)
+
+    assert isinstance(body, bytes)
+    assert json.loads(body) == {"query": QUERY_POSTS_PAGE, "variables": variables}
+
+
+def test_build_posts_query_minimal_field_set():
+    """Test minimal field set drops nested objects from the posts query."""
+    query = build_posts_query(PostFieldSet.MINIMAL)
+
+    assert "votesCount" in query
+    assert "makers" not in query
+    assert "media" not in query
+    assert build_posts_query(PostFieldSet.FULL) == QUERY_POSTS_PAGE
+    assert build_posts_query(PostFieldSet.MINIMAL) is query  # cached
+
+
+def test_queries_are_minified():
+    """Test query documents are sent as single-line minified text."""
+    from producthuntdb.api import QUERY_COLLECTIONS_PAGE, QUERY_VIEWER, _minify_query
+
+    for query in (QUERY_POSTS_PAGE, QUERY_VIEWER, QUERY_COLLECTIONS_PAGE):
+        assert "\n" not in query
+        assert "  " not in query
+
+    assert _minify_query("query {\n  # comment\n  viewer { id }\n}") == "query { viewer { id } }"
+
+
+@pytest.mark.asyncio
+async def test_do_http_post_decodes_raw_content():
+    """Test response bodies are decoded from raw bytes content."""
+    client = AsyncGraphQLClient(token="test_token")
+
+    response = httpx.Response(
+        200,
+        content=b'{"data": {"viewer": {"user": {"id": "1"}}}}',
+        request=httpx.Request("POST", "https://example.com/graphql"),
+    )
+
+    mock_client = MagicMock()
+    mock_client.post = AsyncMock(return_value=response)
+
+    with patch.object(client, "_ensure_client", return_value=mock_client):
+        result = await client._do_http_post("query", {})
+
+    assert result == {"viewer": {"user": {"id": "1"}}}
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_headers_pace_shared_limiter():
+    """Test rate limit headers spread the remaining budget across the window."""
+    client = AsyncGraphQLClient(token="test_token")
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.headers = {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "900"}
+    mock_response.json.return_value = {"data": {}}
+
+    mock_client = MagicMock()
+    mock_client.post = AsyncMock(return_value=mock_response)
+
+    with patch.object(client, "_ensure_client", return_value=mock_client):
+        await client._do_http_post("query", {})
+
+    assert client._limiter.interval == pytest.approx(9.0)
+
+
+def test_reset_header_parse_is_cached_per_value():
+    """Test reset header values are parsed once and stay relative to now."""
+    _parse_reset.cache_clear()
+    reset = "2099-01-01T00:00:00Z"
+
+    first = _seconds_until_reset(reset)
+    second = _seconds_until_reset(reset)
+
+    assert _parse_reset.cache_info().hits == 1
+    assert first is not None and second is not None
+    assert second <= first
+    assert _seconds_until_reset("30") == 30.0
+    assert _seconds_until_reset("1500000000") is None
+    assert _seconds_until_reset("not a date") is None
+
+
+@pytest.mark.asyncio
+async def test_http_429_with_reset_pauses_limiter_without_backoff():
+    """Test a 429 with a known reset pauses the limiter and skips backoff."""
+    client = AsyncGraphQLClient(token="test_token")
+
+    rate_limited = MagicMock()
+    rate_limited.status_code = 429
+    rate_limited.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}
+
+    mock_client = MagicMock()
+    mock_client.post = AsyncMock(return_value=rate_limited)
+
+    with patch.object(client, "_ensure_client", return_value=mock_client):
+        with pytest.raises(RateLimitedError):
+            await client._do_http_post("query", {})
+
+    retry_state = MagicMock(attempt_number=3)
+    retry_state.outcome.exception.return_value = RateLimitedError("HTTP 429")
+    assert _retry_wait(retry_state) == 0.0
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await client._limiter.acquire()
+
+    assert mock_sleep.call_args[0][0] > 25.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("instrumented", [False, True])
+async def test_fetch_posts_page_records_and_reraises_errors(monkeypatch, instrumented):
+    """Test fetch_posts_page returns results and re-raises failures on both paths."""
+    monkeypatch.setattr("producthuntdb.api.INSTRUMENTATION_ENABLED", instrumented)
+    client = AsyncGraphQLClient(token="test_token")
+
+    page = {"nodes": [{"id": "a"}], "pageInfo": {"hasNextPage": False}}
+    with patch.object(client, "_post_with_retry", AsyncMock(return_value={"posts": page})):
+        assert await client.fetch_posts_page(first=1) == page
+
+    with patch.object(client, "_post_with_retry", AsyncMock(side_effect=RuntimeError("boom"))):
+        with pytest.raises(RuntimeError, match="boom"):
+            await client.fetch_posts_page(first=1)
+
+
+@pytest.mark.asyncio
+async def test_fetch_viewer_is_cached_until_forced():
+    """Test viewer info is fetched once per client unless forced."""
+    client = AsyncGraphQLClient(token="test_token")
+    viewer = {"viewer": {"user": {"id": "1", "username": "me"}}}
+
+    with patch.object(client, "_post_with_retry", AsyncMock(return_value=viewer)) as mock_post:
+        results = await asyncio.gather(*(client.fetch_viewer() for _ in range(3)))
+        assert all(result == viewer["viewer"] for result in results)
+        assert mock_post.await_count == 1
+
+        await client.fetch_viewer(force=True)
+        assert mock_post.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_off_by_default():
+    """Test the client sends plain queries unless APQ is turned on."""
+    client = AsyncGraphQLClient(token="test_token")
+
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {}
+    response.json.return_value = {"data": {"viewer": {}}}
+
+    mock_client = MagicMock()
+    mock_client.post = AsyncMock(return_value=response)
+
+    with patch.object(client, "_ensure_client", return_value=mock_client):
+        await client._do_http_post("query { viewer { id } }", {})
+        await client._do_http_post("query { viewer { id } }", {})
+
+    for call in mock_client.post.call_args_list:
+        assert json.loads(call.kwargs["content"]) == {
+            "query": "query { viewer { id } }",
+            "variables": {},
+        }
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_send_hash_after_registration():
+    """Test APQ registers a query once, then sends only its hash."""
+    client = AsyncGraphQLClient(token="test_token", persisted_queries=True)
+
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {}
+    response.json.return_value = {"data": {"viewer": {}}}
+
+    mock_client = MagicMock()
+    mock_client.post = AsyncMock(return_value=response)
+
+    with patch.object(client, "_ensure_client", return_value=mock_client):
+        await client._do_http_post("query { viewer { id } }", {})
+        await client._do_http_post("query { viewer { id } }", {})
+
+    first, second = (json.loads(call.kwargs["content"]) for call in mock_client.post.call_args_list)
+    assert first["query"] == "query { viewer { id } }"
+    assert "query" not in second
+    assert second["extensions"] == first["extensions"]
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_disabled_when_hash_ignored():
+    """Test a server that ignores the APQ hash gets full queries for the session."""
+    query = "query { viewer { id } }"
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Like graphql-ruby without APQ: the extensions hash is ignored
+        payload = json.loads(request.content)
+        sent.append(payload)
+        if "query" not in payload:
+            return httpx.Response(200, json={"errors": [{"message": "No query string was present"}]})
+        return httpx.Response(200, json={"data": {"viewer": {"id": "1"}}})
+
+    client = AsyncGraphQLClient(token="test_token", persisted_queries=True)
+    client._limiter.acquire = AsyncMock()
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with patch.object(client, "_ensure_client", AsyncMock(return_value=http)):
+        for _ in range(3):
+            assert await client._send_once(query, {}) == {"viewer": {"id": "1"}}
+    await http.aclose()
+
+    assert client._persisted_queries is False
+    assert client._limiter.acquire.await_count == 4
+    # Registration, hash-only miss, full resend, then full text only
+    assert ["query" in payload for payload in sent] == [True, False, True, True]
+    assert sent[-1] == {"query": query, "variables": {}}
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_resend_full_query_on_errors():
+    """Test a hash-only request that errors is resent once with its full text."""
+    client = AsyncGraphQLClient(token="test_token", persisted_queries=True)
+    client._registered_queries.add("query { viewer { id } }")
+    client._limiter.acquire = AsyncMock()
+
+    failed = MagicMock()
+    failed.status_code = 200
+    failed.headers = {}
+    failed.content = b'{"errors":[{"message":"Field id is not defined"}]}'
+    failed.json.return_value = {"errors": [{"message": "Field id is not defined"}]}
+
+    mock_client = MagicMock()
+    mock_client.post = AsyncMock(return_value=failed)
+
+    with (
+        patch.object(client, "_ensure_client", return_value=mock_client),
+        pytest.raises(RuntimeError),
+    ):
+        await client._send_once("query { viewer { id } }", {})
+
+    assert mock_client.post.await_count == 2
+    resent = json.loads(mock_client.post.call_args_list[1].kwargs["content"])
+    assert resent["query"] == "query { viewer { id } }"
+    # The full query failed too, so the error is real and APQ stays on
+    assert client._persisted_queries is True
+
+
+@pytest.mark.asyncio
+async def test_dynamic_semaphore_resizes_while_held():
+    """Test shrinking capacity blocks new holders until enough slots free up."""
+    from producthuntdb.api import DynamicSemaphore
+
+    sem = DynamicSemaphore(2)
+    await sem.acquire()
+    await sem.acquire()
+    await sem.set_capacity(1)
+    await sem.release()
+
+    waiter = asyncio.create_task(sem.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()  # one holder left, capacity 1
+
+    await sem.set_capacity(2)
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_aimd_halves_on_overload_and_grows_when_fast():
+    """Test concurrency halves on overload and recovers additively."""
+    client = AsyncGraphQLClient(token="test_token", max_concurrency=8)
+
+    await client._adjust_concurrency(0.1, overloaded=True)
+    assert client._sem.capacity == 4
+
+    await client._adjust_concurrency(0.1, overloaded=False)
+    await client._adjust_concurrency(0.1, overloaded=False)
+    assert client._sem.capacity == 6
+
+    for _ in range(8):
+        await client._adjust_concurrency(5.0, overloaded=False)
+    assert client._sem.capacity < 8
+
+
+@pytest.mark.asyncio
+async def test_aimd_decreases_once_per_window():
+    """Test a burst of overloaded responses halves concurrency only once."""
+    client = AsyncGraphQLClient(token="test_token", max_concurrency=8)
+
+    for _ in range(8):
+        await client._adjust_concurrency(0.1, overloaded=True)
+    assert client._sem.capacity == 4
+
+    await client._adjust_concurrency(0.1, overloaded=True)
+    assert client._sem.capacity == 2
+
+
+@pytest.mark.asyncio
+async def test_aimd_uses_target_latency_setting():
+    """Test the latency target comes from settings."""
+    client = AsyncGraphQLClient(token="test_token", max_concurrency=8)
+    client._target_latency = 10.0
+
+    for _ in range(8):
+        await client._adjust_concurrency(5.0, overloaded=False)
+    assert client._sem.capacity == 8
@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 from pydantic import ValidationError
@@ -15,6 +16,19 @@ from producthuntdb.config import (
 )
 
 
+@pytest.fixture
+def fresh_settings_cache(monkeypatch):
+    """Give get_settings an empty private cache and restore the shared settings after."""
+    from functools import lru_cache
+
+    from producthuntdb import config
+
+    monkeypatch.setattr(
+        config, "get_settings", lru_cache(maxsize=1)(config.get_settings.__wrapped__)
+    )
+    monkeypatch.setattr(config, "settings", config.settings)
+
+
 class TestEnumClasses:
     """Tests for configuration enums."""
 
@@ -247,6 +261,50 @@ class TestConfigCoverage:
         secrets = load_kaggle_secrets()
         assert secrets == {}
 
+    def test_load_kaggle_secrets_fetches_only_missing(self, fresh_settings_cache, monkeypatch):
+        """Test only secrets missing from the environment are requested from Kaggle."""
+        import sys
+        import types
+
+        from producthuntdb import config
+
+        client = MagicMock()
+        client.get_secret.side_effect = lambda name: f"secret-{name.lower()}"
+        fake_module = types.SimpleNamespace(UserSecretsClient=lambda: client)
+        monkeypatch.setitem(sys.modules, "kaggle_secrets", fake_module)
+        monkeypatch.setenv("KAGGLE_KERNEL_RUN_TYPE", "Interactive")
+        monkeypatch.setenv("PRODUCTHUNT_TOKEN", "env_token_12345678")
+        monkeypatch.delenv("KAGGLE_USERNAME", raising=False)
+        monkeypatch.setenv("KAGGLE_KEY", "")
+
+        settings = config.get_settings()
+
+        requested = [call.args[0] for call in client.get_secret.call_args_list]
+        assert requested == ["KAGGLE_USERNAME", "KAGGLE_KEY"]
+        assert settings.producthunt_token == "env_token_12345678"
+        assert settings.kaggle_username == "secret-kaggle_username"
+
+    def test_directories_created_once(self, monkeypatch, tmp_path):
+        """Test repeat Settings builds and export_dir reads skip the mkdir syscall."""
+        monkeypatch.setenv("PRODUCTHUNT_TOKEN", "test_token_12345678")
+        monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+
+        created = []
+        real_mkdir = Path.mkdir
+
+        def spy(self, *args, **kwargs):
+            created.append(self)
+            return real_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", spy)
+
+        settings = Settings()  # type: ignore[call-arg]
+        assert settings.export_dir == settings.export_dir == tmp_path / "data" / "export"
+        Settings()  # type: ignore[call-arg]
+
+        assert sorted(created) == [tmp_path / "data", tmp_path / "data" / "export"]
+        assert settings.export_dir.is_dir()
+
     def test_get_settings(self):
         """Test get_settings function."""
         from producthuntdb.config import get_settings
@@ -254,6 +312,32 @@ class TestConfigCoverage:
         settings = get_settings()
         assert isinstance(settings, Settings)
 
+    def test_get_settings_is_cached(self, fresh_settings_cache, monkeypatch):
+        """Test get_settings builds the instance once until the cache is cleared."""
+        from producthuntdb import config
+
+        monkeypatch.setattr(config, "load_kaggle_secrets", MagicMock(return_value={}))
+        fresh = config.get_settings()
+        assert fresh is not config.settings
+        assert config.get_settings() is fresh
+        config.load_kaggle_secrets.assert_called_once()
+
+        config.get_settings.cache_clear()
+        assert config.get_settings() is not fresh
+
+    def test_reset_settings_rebuilds_on_next_access(self, fresh_settings_cache, monkeypatch):
+        """Test reset_settings drops the module-level instance until it is next used."""
+        from producthuntdb import config
+
+        original = config.settings
+        monkeypatch.setattr(config, "load_kaggle_secrets", MagicMock(return_value={}))
+        config.reset_settings()
+        assert "settings" not in vars(config)
+
+        rebuilt = config.settings
+        assert rebuilt is not original
+        assert rebuilt is config.get_settings()
+
     def test_redact_token_with_empty_token(self, monkeypatch):
         """Test token redaction with empty token (falls back to default)."""
         monkeypatch.setenv("PRODUCTHUNT_TOKEN", "test_token_12345678")
@@ -286,6 +370,22 @@ class TestConfigCoverage:
         assert os.environ.get("KAGGLE_USERNAME") == "testuser"
         assert os.environ.get("KAGGLE_KEY") == "testkey123"
 
+    def test_configure_kaggle_env_skips_unchanged_values(self, monkeypatch):
+        """Test configure_kaggle_env only writes variables whose value differs."""
+        from producthuntdb import config
+
+        monkeypatch.setenv("PRODUCTHUNT_TOKEN", "test_token_12345678")
+        monkeypatch.setenv("KAGGLE_USERNAME", "testuser")
+        monkeypatch.setenv("KAGGLE_KEY", "testkey123")
+        settings = Settings()  # type: ignore[call-arg]
+        settings.kaggle_key = "newkey456"
+
+        environ = MagicMock(wraps=dict(os.environ))
+        monkeypatch.setattr(config.os, "environ", environ)
+        settings.configure_kaggle_env()
+
+        environ.__setitem__.assert_called_once_with("KAGGLE_KEY", "newkey456")
+
     def test_configure_kaggle_env_without_credentials(self, monkeypatch):
         """Test configuring Kaggle environment without credentials."""
         monkeypatch.setenv("PRODUCTHUNT_TOKEN", "test_token_12345678")
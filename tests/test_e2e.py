@@ -80,8 +80,8 @@ class TestCompleteWorkflow:
         monkeypatch.setenv("DATABASE_PATH", str(db_path))
 
         # Step 1: Initialize database (mocked to use the correct path)
-        with patch("producthuntdb.cli.settings") as mock_settings, \
-             patch("producthuntdb.cli.DatabaseManager") as MockDB:
+        with patch("producthuntdb.config.settings") as mock_settings, \
+             patch("producthuntdb.io.DatabaseManager") as MockDB:
             # Configure mock settings
             mock_settings.database_path = db_path
             mock_settings.graphql_endpoint = "https://api.producthunt.com/v2/api/graphql"
@@ -100,7 +100,7 @@ class TestCompleteWorkflow:
             assert db_path.exists()
 
         # Step 2: Verify authentication (mocked)
-        with patch("producthuntdb.cli.DataPipeline") as MockPipeline:
+        with patch("producthuntdb.pipeline.DataPipeline") as MockPipeline:
             mock_pipeline = MockPipeline.return_value
             mock_pipeline.initialize = AsyncMock()
             mock_pipeline.verify_authentication = AsyncMock(
@@ -116,13 +116,13 @@ class TestCompleteWorkflow:
             assert result.exit_code == 0
 
         # Step 3: Check status
-        with patch("producthuntdb.cli.DatabaseManager") as MockDB:
+        with patch("producthuntdb.io.DatabaseManager") as MockDB:
             mock_db = MockDB.return_value
             mock_db.initialize = MagicMock()
             mock_db.get_crawl_state = MagicMock(return_value=None)
             mock_db.close = MagicMock()
 
-            with patch("producthuntdb.cli.DataPipeline") as MockPipeline:
+            with patch("producthuntdb.pipeline.DataPipeline") as MockPipeline:
                 mock_pipeline = MockPipeline.return_value
                 mock_pipeline.get_statistics = MagicMock(
                     return_value={
@@ -154,7 +154,7 @@ class TestExportAndPublishWorkflow:
         runner.invoke(app, ["init"])
 
         # Export data
-        with patch("producthuntdb.cli.KaggleManager") as MockKaggle:
+        with patch("producthuntdb.io.KaggleManager") as MockKaggle:
             mock_km = MockKaggle.return_value
             mock_km.export_database_to_csv = MagicMock()
 
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+from producthuntdb import io as io_module
 from producthuntdb.config import PostsOrder
 from producthuntdb.io import (
     AsyncGraphQLClient,
@@ -42,7 +43,7 @@ class TestAsyncGraphQLClient:
         mock_client.post = AsyncMock(return_value=mock_httpx_response)
 
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
 
             result = await client._do_http_post("query { test }", {})
 
@@ -67,13 +68,41 @@ class TestAsyncGraphQLClient:
         mock_client.post = AsyncMock(return_value=mock_response)
 
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
 
             await client._do_http_post("query", {})
 
             assert client._rate_limit_remaining == "25"
             assert client._rate_limit_limit == "100"
 
+    @pytest.mark.asyncio
+    async def test_request_and_response_bodies_are_raw_json(self, mocker):
+        """Test the request is sent as encoded bytes and the body decoded from bytes."""
+        import json
+
+        client = AsyncGraphQLClient(token="test_token")
+
+        mock_response = mocker.MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b'{"data": {"viewer": {"id": "1"}}}'
+        mock_response.json.return_value = {"data": {"viewer": {"id": "1"}}}
+
+        mock_client = mocker.MagicMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+
+        with patch("httpx.AsyncClient") as mock_async_client:
+            mock_async_client.return_value = mock_client
+
+            data = await client._do_http_post("query Q { viewer { id } }", {"first": 1})
+
+        assert data == {"viewer": {"id": "1"}}
+        content = mock_client.post.call_args.kwargs["content"]
+        assert json.loads(content) == {
+            "query": "query Q { viewer { id } }",
+            "variables": {"first": 1},
+        }
+
     @pytest.mark.asyncio
     async def test_http_429_raises_transient_error(self, mocker):
         """Test that HTTP 429 raises TransientGraphQLError."""
@@ -87,7 +116,7 @@ class TestAsyncGraphQLClient:
         mock_client.post = AsyncMock(return_value=mock_response)
 
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
 
             with pytest.raises(TransientGraphQLError) as exc_info:
                 await client._do_http_post("query", {})
@@ -106,7 +135,7 @@ class TestAsyncGraphQLClient:
         mock_client.post = AsyncMock(return_value=mock_response)
 
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
 
             with pytest.raises(TransientGraphQLError):
                 await client._do_http_post("query", {})
@@ -120,7 +149,7 @@ class TestAsyncGraphQLClient:
         mock_client.post = AsyncMock(side_effect=httpx.NetworkError("Connection failed"))
 
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
 
             with pytest.raises(TransientGraphQLError) as exc_info:
                 await client._do_http_post("query", {})
@@ -143,13 +172,31 @@ class TestAsyncGraphQLClient:
         mock_client.post = AsyncMock(return_value=mock_response)
 
         with patch("httpx.AsyncClient") as mock_async_client:
-            mock_async_client.return_value.__aenter__.return_value = mock_client
+            mock_async_client.return_value = mock_client
 
             with pytest.raises(RuntimeError) as exc_info:
                 await client._do_http_post("query", {})
 
             assert "GraphQL errors" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_http_client_is_reused_across_requests(self, mocker, mock_httpx_response):
+        """Test requests share one pooled client that close() releases."""
+        mock_client = mocker.MagicMock()
+        mock_client.post = AsyncMock(return_value=mock_httpx_response)
+        mock_client.aclose = AsyncMock()
+
+        with patch("httpx.AsyncClient", return_value=mock_client) as mock_async_client:
+            async with AsyncGraphQLClient(token="test_token") as client:
+                await client._do_http_post("query", {})
+                await client._do_http_post("query", {})
+
+        mock_async_client.assert_called_once()
+        assert mock_async_client.call_args.kwargs["headers"]["Authorization"] == "Bearer test_token"
+        assert mock_client.post.call_count == 2
+        mock_client.aclose.assert_awaited_once()
+        assert client._client is None
+
     @pytest.mark.asyncio
     async def test_fetch_posts_page(self, mocker, mock_posts_response):
         """Test fetching posts page."""
@@ -187,6 +234,21 @@ class TestAsyncGraphQLClient:
         assert "user" in result
         assert result["user"]["isViewer"] is True
 
+    @pytest.mark.asyncio
+    async def test_post_with_retry_retries_transient_errors(self, monkeypatch):
+        """Test each call retries with its own copy of the shared retry policy."""
+        from tenacity import wait_none
+
+        monkeypatch.setattr(io_module, "_RETRYING", io_module._RETRYING.copy(wait=wait_none()))
+        client = AsyncGraphQLClient(token="test_token")
+        client._send_once = AsyncMock(
+            side_effect=[TransientGraphQLError("HTTP 503"), {"viewer": {}}, {"viewer": {}}]
+        )
+
+        assert await client._post_with_retry("query", {}) == {"viewer": {}}
+        assert await client._post_with_retry("query", {}) == {"viewer": {}}
+        assert client._send_once.await_count == 3
+
     @pytest.mark.asyncio
     async def test_get_rate_limit_status(self):
         """Test getting rate limit status."""
@@ -222,6 +284,15 @@ class TestDatabaseManager:
 
         db.close()
 
+    def test_pragmas_applied_to_every_connection(self, test_db_manager):
+        """Test per-connection pragmas reach fresh pooled connections."""
+        test_db_manager.engine.dispose()
+
+        with test_db_manager.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+            assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2  # MEMORY
+
     def test_database_close(self, test_db_manager):
         """Test database closing."""
         test_db_manager.close()
@@ -347,21 +418,22 @@ class TestDatabaseManager:
             }
         )
 
-        # Create link
+        # Create link; relinking (and duplicate ids) must not add rows or fail
         test_db_manager.link_post_topics("post123", ["topic123"])
+        test_db_manager.link_post_topics("post123", ["topic123", "topic123"])
 
-        # Verify link exists
+        # Verify link exists once
         from producthuntdb.models import PostTopicLink
         from sqlmodel import select
 
-        link = test_db_manager.session.exec(
+        links = test_db_manager.session.exec(
             select(PostTopicLink).where(
                 PostTopicLink.post_id == "post123",
                 PostTopicLink.topic_id == "topic123",
             )
-        ).first()
+        ).all()
 
-        assert link is not None
+        assert len(links) == 1
 
     def test_link_post_makers(self, test_db_manager):
         """Test linking posts and makers."""
@@ -493,6 +565,137 @@ class TestKaggleManager:
         # Check database file was copied
         # (In real test would need actual db, here we're mocking)
 
+    def test_export_database_to_csv_writes_rows(self, test_db_manager, tmp_path, monkeypatch):
+        """Test exporting reads every table from the real database."""
+        from producthuntdb.config import settings
+
+        test_db_manager.upsert_user({"id": "user123", "username": "test", "name": "Test"})
+        monkeypatch.setattr(settings, "database_path", test_db_manager.database_path)
+
+        test_db_manager.upsert_user({"id": "user456", "username": "other", "name": "Other"})
+        test_db_manager.session.commit()
+
+        # A batch smaller than the table exercises the streaming loop
+        KaggleManager().export_database_to_csv(tmp_path, chunk_size=1)
+
+        users_csv = (tmp_path / "userrow.csv").read_text().splitlines()
+        assert users_csv[0].startswith("id,")
+        assert len(users_csv) == 3
+        assert any(line.startswith("user123,") for line in users_csv)
+        assert (tmp_path / "crawlstate.csv").exists()
+        assert (tmp_path / "producthunt.db").exists()
+
+    def test_export_database_to_csv_snapshot(self, test_db_manager, tmp_path, monkeypatch):
+        """Test export snapshots the database and reads the CSVs from the snapshot."""
+        import sqlite3
+
+        from producthuntdb.config import settings
+
+        test_db_manager.upsert_user({"id": "user123", "username": "test", "name": "Test"})
+        monkeypatch.setattr(settings, "database_path", test_db_manager.database_path)
+
+        exported = []
+        real_export_table = io_module._export_table
+
+        def spy(db_path, *args, **kwargs):
+            exported.append(db_path)
+            return real_export_table(db_path, *args, **kwargs)
+
+        monkeypatch.setattr(io_module, "_export_table", spy)
+        monkeypatch.setattr(io_module, "DUCKDB_AVAILABLE", False)
+
+        KaggleManager().export_database_to_csv(tmp_path)
+
+        snapshot = tmp_path / "producthunt.db"
+        assert set(exported) == {snapshot}
+        assert not (tmp_path / "producthunt.db-wal").exists()
+        with sqlite3.connect(snapshot) as conn:
+            assert conn.execute("SELECT id FROM userrow").fetchall() == [("user123",)]
+
+    def test_export_database_to_csv_booleans(self, test_db_manager, tmp_path, monkeypatch):
+        """Test BOOLEAN columns are exported as True/False rather than 1/0."""
+        import csv
+
+        from producthuntdb.config import settings
+
+        test_db_manager.upsert_user(
+            {
+                "id": "user123",
+                "username": "test",
+                "name": "Test",
+                "isMaker": True,
+                "isViewer": False,
+            }
+        )
+        monkeypatch.setattr(settings, "database_path", test_db_manager.database_path)
+        monkeypatch.setattr(io_module, "DUCKDB_AVAILABLE", False)
+
+        KaggleManager().export_database_to_csv(tmp_path)
+
+        with open(tmp_path / "userrow.csv", newline="", encoding="utf-8") as f:
+            (user,) = csv.DictReader(f)
+        assert user["isMaker"] == "True"
+        assert user["isViewer"] == "False"
+        assert user["isFollowing"] == ""
+
+    def test_export_duckdb_and_csv_writer_match(self, test_db_manager, tmp_path):
+        """Test the DuckDB COPY and csv writer paths write the same file for a table."""
+        import sqlite3
+
+        pytest.importorskip("duckdb")
+
+        test_db_manager.upsert_user(
+            {
+                "id": "user123",
+                "username": "test",
+                "name": "Test",
+                "createdAt": "2024-01-15T10:00:00Z",
+                "isMaker": True,
+                "isViewer": False,
+            }
+        )
+        db_path = test_db_manager.database_path
+        duckdb_dir = tmp_path / "duckdb"
+        csv_dir = tmp_path / "csv"
+        duckdb_dir.mkdir()
+        csv_dir.mkdir()
+
+        if io_module._export_tables_with_duckdb(db_path, ["userrow"], duckdb_dir):
+            pytest.skip("DuckDB sqlite extension unavailable")
+        with sqlite3.connect(db_path) as conn:
+            io_module._export_table_to_csv(conn, "userrow", csv_dir / "userrow.csv", 100)
+
+        duckdb_csv = (duckdb_dir / "userrow.csv").read_text(encoding="utf-8")
+        assert duckdb_csv == (csv_dir / "userrow.csv").read_text(encoding="utf-8")
+
+    def test_duckdb_export_skips_tables_with_temporal_columns(self, tmp_path):
+        """Test tables DuckDB would reformat timestamps for are left to the csv writer."""
+        import sqlite3
+
+        with sqlite3.connect(tmp_path / "types.db") as conn:
+            conn.execute('CREATE TABLE events (id VARCHAR, "seenAt" DATETIME)')
+            conn.execute('CREATE TABLE plain (id VARCHAR, "createdAt" VARCHAR, flag BOOLEAN)')
+
+            assert io_module._has_temporal_columns(conn, "events")
+            assert not io_module._has_temporal_columns(conn, "plain")
+
+    def test_export_database_to_csv_compressed(self, test_db_manager, tmp_path, monkeypatch):
+        """Test compressed export writes readable gzip CSV files."""
+        import gzip
+
+        from producthuntdb.config import settings
+
+        test_db_manager.upsert_user({"id": "user123", "username": "test", "name": "Test"})
+        monkeypatch.setattr(settings, "database_path", test_db_manager.database_path)
+
+        KaggleManager().export_database_to_csv(tmp_path, compress=True)
+
+        with gzip.open(tmp_path / "userrow.csv.gz", "rt", encoding="utf-8") as f:
+            users_csv = f.read().splitlines()
+        assert users_csv[0].startswith("id,")
+        assert users_csv[1].startswith("user123,")
+        assert not (tmp_path / "userrow.csv").exists()
+
     def test_publish_dataset_without_credentials(self, tmp_path, monkeypatch):
         """Test publishing without credentials."""
         monkeypatch.delenv("KAGGLE_USERNAME", raising=False)
@@ -1,5 +1,6 @@
 """Unit tests for data pipeline orchestration."""
 
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -152,6 +153,45 @@ class TestDataPipeline:
 
         pipeline.close()
 
+    @pytest.mark.asyncio
+    async def test_refresh_post_counts_updates_stored_posts(
+        self, mocker, temp_db_path, mock_post_data, mock_user_data
+    ):
+        """Test count refresh uses the minimal query and only touches stored posts."""
+        from producthuntdb.api import PostFieldSet
+        from producthuntdb.database import DatabaseManager
+        from producthuntdb.models import PostRow
+
+        db = DatabaseManager(database_path=temp_db_path)
+        db.initialize()
+        db.upsert_posts_page(posts=[mock_post_data], users=[mock_user_data])
+        pipeline = DataPipeline(db=db)
+        fetch = mocker.patch.object(
+            pipeline.client,
+            "fetch_posts_page",
+            AsyncMock(
+                return_value={
+                    "nodes": [
+                        {"id": "post123", "votesCount": 75, "commentsCount": 12},
+                        {"id": "unknown", "votesCount": 3, "commentsCount": 0},
+                    ],
+                    "pageInfo": {"endCursor": "c1", "hasNextPage": False},
+                }
+            ),
+        )
+
+        stats = await pipeline.refresh_post_counts(max_pages=1)
+
+        assert stats == {"posts": 1, "pages": 1}
+        assert fetch.call_args.kwargs["fields"] == PostFieldSet.MINIMAL
+        db.session.expire_all()
+        post = db.session.get(PostRow, "post123")
+        assert (post.votesCount, post.commentsCount) == (75, 12)
+        assert post.name == "Awesome Product"
+        assert db.session.get(PostRow, "unknown") is None
+
+        pipeline.close()
+
     @pytest.mark.asyncio
     async def test_sync_topics(self, mocker, mock_topics_response):
         """Test syncing topics."""
@@ -209,6 +249,72 @@ class TestDataPipeline:
 
         pipeline.close()
 
+    @pytest.mark.asyncio
+    async def test_sync_all_runs_entity_syncs_concurrently(self, mocker, mock_viewer_response):
+        """Test sync_all overlaps the posts, topics and collections syncs."""
+        pipeline = DataPipeline()
+        mocker.patch.object(
+            pipeline.client,
+            "fetch_viewer",
+            AsyncMock(return_value=mock_viewer_response["viewer"]),
+        )
+
+        started = []
+        all_started = asyncio.Event()
+
+        def fake_sync(name, stats):
+            async def run(*args, **kwargs):
+                started.append(name)
+                if len(started) == 3:
+                    all_started.set()
+                # Would deadlock if the syncs ran one after another
+                await asyncio.wait_for(all_started.wait(), timeout=1)
+                return stats
+
+            return run
+
+        mocker.patch.object(pipeline, "sync_posts", fake_sync("posts", {"posts": 2}))
+        mocker.patch.object(pipeline, "sync_topics", fake_sync("topics", {"topics": 3}))
+        mocker.patch.object(
+            pipeline, "sync_collections", fake_sync("collections", {"collections": 4})
+        )
+
+        stats = await pipeline.sync_all()
+
+        assert sorted(started) == ["collections", "posts", "topics"]
+        assert stats["total_entities"] == 9
+
+    @pytest.mark.asyncio
+    async def test_sync_all_cancels_other_syncs_on_failure(self, mocker, mock_viewer_response):
+        """Test a failing entity sync cancels the others and surfaces its error."""
+        pipeline = DataPipeline()
+        mocker.patch.object(
+            pipeline.client,
+            "fetch_viewer",
+            AsyncMock(return_value=mock_viewer_response["viewer"]),
+        )
+
+        cancelled = []
+
+        async def slow_sync(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def failing_sync(*args, **kwargs):
+            raise RuntimeError("posts failed")
+
+        mocker.patch.object(pipeline, "sync_posts", failing_sync)
+        mocker.patch.object(pipeline, "sync_topics", slow_sync)
+        mocker.patch.object(pipeline, "sync_collections", slow_sync)
+
+        with pytest.raises(RuntimeError, match="posts failed"):
+            await asyncio.wait_for(pipeline.sync_all(), timeout=5)
+
+        assert cancelled == [True, True]
+
     def test_get_statistics(self, populated_db):
         """Test getting database statistics."""
         pipeline = DataPipeline(db=populated_db)
@@ -267,6 +373,81 @@ class TestPipelineErrorHandling:
 
         pipeline.close()
 
+    @pytest.mark.asyncio
+    async def test_sync_posts_stores_pages_fetched_before_error(self, mock_post_data):
+        """Test pages fetched before a fetch error are still written."""
+        db = MagicMock()
+
+        async def pages(**kwargs):
+            for i in range(3):
+                yield {
+                    "nodes": [{**mock_post_data, "id": f"post{i}"}],
+                    "pageInfo": {"hasNextPage": True, "endCursor": f"cursor{i}"},
+                }
+            raise RuntimeError("API Error")
+
+        client = MagicMock()
+        client.iter_posts_pages = pages
+        pipeline = DataPipeline(client=client, db=db)
+        db.get_crawl_state.return_value = None
+
+        stats = await pipeline.sync_posts()
+
+        assert stats["pages"] == 3
+        assert stats["posts"] == 3
+        stored = [
+            post["id"]
+            for call in db.upsert_posts_page.call_args_list
+            for post in call.kwargs["posts"]
+        ]
+        assert stored == ["post0", "post1", "post2"]
+        db.update_crawl_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sync_posts_surfaces_unexpected_producer_error(self, mock_post_data):
+        """Test an unexpected fetch failure ends the sync instead of stalling the writer."""
+        db = MagicMock()
+
+        async def pages(**kwargs):
+            yield {
+                "nodes": [{**mock_post_data, "id": "post0"}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "cursor0"},
+            }
+            raise KeyError("pageInfo")
+
+        client = MagicMock()
+        client.iter_posts_pages = pages
+        pipeline = DataPipeline(client=client, db=db)
+        db.get_crawl_state.return_value = None
+
+        stats = await asyncio.wait_for(pipeline.sync_posts(), timeout=5)
+
+        assert stats["posts"] == 1
+        db.upsert_posts_page.assert_called_once()
+
+    def test_validate_posts_returns_errors_in_place(self, mock_post_data):
+        """Test that page validation keeps one result per node, in order."""
+        from producthuntdb.models import Post
+        from producthuntdb.pipeline import _validate_posts
+        from pydantic import ValidationError
+
+        results = _validate_posts([mock_post_data, {"id": "bad"}])
+
+        assert isinstance(results[0], Post)
+        assert isinstance(results[1], ValidationError)
+
+    def test_validate_posts_whole_page(self, mock_post_data):
+        """Test a valid page is validated in one pass, in order."""
+        from producthuntdb.models import Post
+        from producthuntdb.pipeline import _validate_posts
+
+        nodes = [{**mock_post_data, "id": f"post{i}"} for i in range(3)]
+        results = _validate_posts(nodes)
+
+        assert all(isinstance(result, Post) for result in results)
+        assert [result.id for result in results] == ["post0", "post1", "post2"]
+        assert results[0].thumbnail.url == "https://example.com/thumb.jpg"
+
 
 class TestPipelineFullCoverage:
     """Tests to achieve full pipeline coverage."""
@@ -383,6 +564,291 @@ class TestPipelineFullCoverage:
         finally:
             pipeline.close()
 
+    @pytest.mark.asyncio
+    async def test_sync_posts_writes_page_in_one_transaction(self, mocker, temp_db_path):
+        """Test a posts page is stored with a single page write."""
+        from producthuntdb.database import DatabaseManager
+        from producthuntdb.models import MakerPostLink, MediaRow, PostRow, PostTopicLink
+        from sqlmodel import select
+
+        db = DatabaseManager(database_path=temp_db_path)
+        pipeline = DataPipeline(db=db)
+        await pipeline.initialize()
+
+        try:
+            user = {"id": "user1", "username": "maker", "name": "Maker"}
+            topic = {"id": "topic1", "name": "AI", "slug": "ai"}
+            nodes = [
+                {
+                    "id": f"post{i}",
+                    "userId": "user1",
+                    "name": f"Product {i}",
+                    "tagline": "Tagline",
+                    "url": "https://test.com",
+                    "commentsCount": 0,
+                    "votesCount": i,
+                    "reviewsRating": 0.0,
+                    "reviewsCount": 0,
+                    "isCollected": False,
+                    "isVoted": False,
+                    "createdAt": "2024-01-15T10:00:00Z",
+                    "thumbnail": {"type": "image", "url": "https://example.com/thumb.jpg"},
+                    "media": [{"type": "image", "url": "https://example.com/media.jpg"}],
+                    "user": user,
+                    "makers": [user],
+                    "topics": [topic],
+                }
+                for i in range(3)
+            ]
+            mocker.patch.object(
+                pipeline.client,
+                "fetch_posts_page",
+                AsyncMock(
+                    return_value={
+                        "nodes": nodes,
+                        "pageInfo": {"hasNextPage": False, "endCursor": "cursor"},
+                    }
+                ),
+            )
+            page_write = mocker.spy(db, "upsert_posts_page")
+            single_write = mocker.spy(db, "upsert_post")
+
+            stats = await pipeline.sync_posts(max_pages=1)
+
+            assert stats["posts"] == 3
+            assert stats["users"] == 6
+            assert stats["topics"] == 3
+            assert page_write.call_count == 1
+            assert single_write.call_count == 0
+
+            session = db.session
+            rows = session.exec(select(PostRow)).all()
+            assert {row.id for row in rows} == {"post0", "post1", "post2"}
+            assert all(row.thumbnail_url == "https://example.com/thumb.jpg" for row in rows)
+            assert len(session.exec(select(PostTopicLink)).all()) == 3
+            assert len(session.exec(select(MakerPostLink)).all()) == 3
+            assert len(session.exec(select(MediaRow)).all()) == 3
+
+            # Re-syncing the same page updates rows in place
+            await pipeline.sync_posts(max_pages=1)
+            assert len(session.exec(select(PostRow)).all()) == 3
+            assert len(session.exec(select(MediaRow)).all()) == 3
+
+        finally:
+            pipeline.close()
+
+    def test_upsert_posts_batch_upserts_without_prefetch(self, temp_db_path):
+        """Test batch upserts insert and update rows and return them in input order."""
+        from producthuntdb.database import DatabaseManager
+        from producthuntdb.models import PostRow
+        from sqlalchemy.exc import IntegrityError
+
+        db = DatabaseManager(database_path=temp_db_path)
+        db.initialize()
+
+        try:
+            db.upsert_user({"id": "user1", "username": "maker", "name": "Maker"})
+            base = {
+                "userId": "user1",
+                "tagline": "Tagline",
+                "url": "https://test.com",
+                "commentsCount": 0,
+                "votesCount": 1,
+                "reviewsRating": 0.0,
+                "reviewsCount": 0,
+                "isCollected": False,
+                "isVoted": False,
+                "createdAt": "2024-01-15T10:00:00Z",
+            }
+            first = db.upsert_post(
+                {**base, "id": "post1", "name": "Old", "thumbnail": {"type": "image", "url": "t"}}
+            )
+            assert first.thumbnail_url == "t"
+
+            rows = db.upsert_posts_batch(
+                [
+                    {**base, "id": "post2", "name": "New"},
+                    {**base, "id": "post1", "name": "Renamed", "votesCount": 7},
+                ],
+                batch_size=1,
+            )
+
+            assert [(row.id, row.name) for row in rows] == [("post2", "New"), ("post1", "Renamed")]
+            assert rows[1].votesCount == 7
+            # Columns absent from the update are left as they were
+            assert rows[1].thumbnail_url == "t"
+            assert rows[0].createdAt == "2024-01-15T10:00:00Z"
+
+            # All batches share one transaction: a bad row rolls back the earlier batches
+            posts = [
+                {**base, "id": "post3", "name": "Valid"},
+                {**base, "id": "post4", "name": None},
+            ]
+            with pytest.raises(IntegrityError):
+                db.upsert_posts_batch(posts, batch_size=1)
+            assert db.session.get(PostRow, "post3") is None
+        finally:
+            db.close()
+
+    def test_iter_upsert_posts_batch_writes_eagerly_and_streams(self, temp_db_path):
+        """Test the iterator variant commits up front and yields rows in input order."""
+        from producthuntdb.database import DatabaseManager
+        from producthuntdb.models import PostRow
+
+        db = DatabaseManager(database_path=temp_db_path)
+        db.initialize()
+
+        try:
+            db.upsert_user({"id": "user1", "username": "maker", "name": "Maker"})
+            base = {
+                "userId": "user1",
+                "tagline": "Tagline",
+                "url": "https://test.com",
+                "commentsCount": 0,
+                "votesCount": 1,
+                "reviewsRating": 0.0,
+                "reviewsCount": 0,
+                "isCollected": False,
+                "isVoted": False,
+                "createdAt": "2024-01-15T10:00:00Z",
+            }
+            ids = ["p3", "p1", "p5", "p2", "p4"]
+            rows = db.iter_upsert_posts_batch(
+                [{**base, "id": post_id, "name": post_id.upper()} for post_id in ids],
+                batch_size=2,
+            )
+
+            # Written before the iterator is consumed
+            assert db.session.get(PostRow, "p5") is not None
+            assert [(row.id, row.name) for row in rows] == [(i, i.upper()) for i in ids]
+        finally:
+            db.close()
+
+    def test_pragmas_apply_to_every_connection(self, temp_db_path):
+        """Test every pooled connection gets the per-connection pragmas."""
+        from producthuntdb.database import DatabaseManager
+        from sqlalchemy import text
+
+        db = DatabaseManager(database_path=temp_db_path)
+        db.initialize()
+
+        try:
+            # Two connections checked out at once: the second is a fresh pool connection
+            with db.engine.connect() as first, db.engine.connect() as second:
+                for conn in (first, second):
+                    assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+                    assert conn.execute(text("PRAGMA cache_size")).scalar() == -64000
+                    assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+                    assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        finally:
+            db.close()
+
+    def test_create_indexes_covers_link_lookups(self, temp_db_path):
+        """Test reverse link lookups are index-only without the superseded indexes."""
+        from producthuntdb.database import DatabaseManager
+        from sqlalchemy import text
+
+        db = DatabaseManager(database_path=temp_db_path)
+        db.initialize()
+
+        try:
+            with db.engine.connect() as conn:
+                names = set(
+                    conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))
+                    .scalars()
+                    .all()
+                )
+                query = "SELECT post_id FROM posttopiclink WHERE topic_id = 't'"
+                plan = conn.execute(text(f"EXPLAIN QUERY PLAN {query}")).all()
+
+            assert "idx_post_topic_topic" not in names
+            assert "COVERING INDEX idx_post_topic_cover" in plan[0][-1]
+        finally:
+            db.close()
+
+    def test_initialize_can_defer_index_creation(self, temp_db_path):
+        """Test initialize skips secondary indexes until create_indexes is called."""
+        from producthuntdb.database import DatabaseManager
+        from sqlalchemy import text
+
+        db = DatabaseManager(database_path=temp_db_path)
+        db.initialize(create_indexes=False)
+        query = text(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'index' AND name GLOB 'idx_*'"
+        )
+
+        try:
+            db.upsert_user({"id": "user1", "username": "maker", "name": "Maker"})
+            with db.engine.connect() as conn:
+                assert conn.execute(query).scalar() == 0
+
+            db.create_indexes()
+            with db.engine.connect() as conn:
+                assert conn.execute(query).scalar() > 0
+        finally:
+            db.close()
+
+    def test_bulk_load_mode_rebuilds_indexes(self, temp_db_path, mocker):
+        """Test bulk load mode drops secondary indexes and restores them on exit."""
+        from producthuntdb.database import DatabaseManager
+        from sqlalchemy import text
+
+        db = DatabaseManager(database_path=temp_db_path)
+        db.initialize()
+        optimize = mocker.spy(db, "optimize")
+
+        def index_names():
+            with db.engine.connect() as conn:
+                query = "SELECT name FROM sqlite_master WHERE type = 'index' AND name GLOB 'idx_*'"
+                return set(conn.execute(text(query)).scalars().all())
+
+        try:
+            before = index_names()
+            assert "idx_post_created_at" in before
+
+            with pytest.raises(ValueError), db.bulk_load_mode():
+                assert index_names() == set()
+                db.upsert_user({"id": "user1", "username": "maker", "name": "Maker"})
+                raise ValueError("load failed")
+
+            assert index_names() == before
+            optimize.assert_called_once()
+        finally:
+            db.close()
+
+    def test_upsert_posts_batch_runs_optimize_periodically(self, temp_db_path, mocker):
+        """Test PRAGMA optimize runs once enough rows have been written."""
+        from producthuntdb import database
+        from producthuntdb.database import DatabaseManager
+
+        mocker.patch.object(database, "_OPTIMIZE_EVERY_ROWS", 3)
+        db = DatabaseManager(database_path=temp_db_path)
+        db.initialize()
+        optimize = mocker.spy(db, "optimize")
+
+        try:
+            db.upsert_user({"id": "user1", "username": "maker", "name": "Maker"})
+            base = {
+                "userId": "user1",
+                "tagline": "Tagline",
+                "url": "https://test.com",
+                "commentsCount": 0,
+                "votesCount": 1,
+                "reviewsRating": 0.0,
+                "reviewsCount": 0,
+                "isCollected": False,
+                "isVoted": False,
+                "createdAt": "2024-01-15T10:00:00Z",
+            }
+            db.upsert_posts_batch([{**base, "id": "post1", "name": "A"}])
+            db.upsert_posts_batch([{**base, "id": f"post{i}", "name": "B"} for i in (2, 3)])
+            assert optimize.call_count == 1
+
+            db.upsert_posts_batch([{**base, "id": "post4", "name": "C"}])
+            assert optimize.call_count == 1
+        finally:
+            db.close()
+
     @pytest.mark.asyncio
     async def test_sync_posts_incremental_with_cutoff(self, mocker):
         """Test incremental sync with safety cutoff."""
@@ -812,3 +1278,53 @@ class TestPipelineEdgeCases:
         stats = await pipeline.sync_collections()
 
         assert stats["collections"] == 0
+
+    def test_upsert_post_syncs_media_differentially(self, temp_db_path):
+        """Test re-upserting a post only rewrites media that changed."""
+        from producthuntdb.database import DatabaseManager
+        from producthuntdb.models import MediaRow
+        from sqlmodel import select
+
+        db = DatabaseManager(database_path=temp_db_path)
+        db.initialize()
+
+        def stored_media():
+            stmt = (
+                select(MediaRow).where(MediaRow.post_id == "post1").order_by(MediaRow.order_index)
+            )
+            return [(m.id, m.url) for m in db.session.exec(stmt)]
+
+        try:
+            db.upsert_user({"id": "user1", "username": "maker", "name": "Maker"})
+            post = {
+                "id": "post1",
+                "userId": "user1",
+                "name": "Post",
+                "tagline": "Tagline",
+                "url": "https://test.com",
+                "commentsCount": 0,
+                "votesCount": 1,
+                "reviewsRating": 0.0,
+                "reviewsCount": 0,
+                "isCollected": False,
+                "isVoted": False,
+                "createdAt": "2024-01-15T10:00:00Z",
+                "media": [{"type": "image", "url": "a"}, {"type": "image", "url": "b"}],
+            }
+            db.upsert_post(post)
+            original = stored_media()
+
+            # Unchanged media keeps its rows
+            db.upsert_post(post)
+            assert stored_media() == original
+
+            # Only the changed item is replaced
+            db.upsert_post(
+                {**post, "media": [{"type": "image", "url": "a"}, {"type": "image", "url": "c"}]}
+            )
+            media = stored_media()
+            assert media[0] == original[0]
+            assert media[1][1] == "c"
+            assert len(db.session.exec(select(MediaRow)).all()) == 2
+        finally:
+            db.close()
@@ -1,14 +1,16 @@
 """Unit tests for utility functions."""
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime, timedelta, timezone
 
 import pytest
 
 from producthuntdb.utils import (
     chunk_list,
+    dump_json,
     ensure_list,
     format_iso,
     normalize_id,
+    normalize_iso,
     parse_datetime,
     redact_token,
     safe_get,
@@ -48,6 +50,33 @@ class TestDatetimeFunctions:
         with pytest.raises(ValueError):
             parse_datetime("not-a-date")
 
+    def test_parse_datetime_falls_back_to_dateutil(self):
+        """Test ISO forms rejected by fromisoformat are still parsed."""
+        result = parse_datetime("2024-01-15T24:00:00Z")
+        assert result == datetime(2024, 1, 16, tzinfo=UTC)
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2024-01-15T10:30:00Z", "2024-01-15T10:30:00Z"),
+            ("2024-01-15T10:30:00.123456Z", "2024-01-15T10:30:00.123456Z"),
+            ("2024-01-15T10:30:00.000000Z", "2024-01-15T10:30:00Z"),
+            ("2024-01-15T10:30:00.5Z", "2024-01-15T10:30:00.500000Z"),
+            ("2024-01-15T12:30:00+02:00", "2024-01-15T10:30:00Z"),
+            ("2024-01-15T10:30:00", "2024-01-15T10:30:00Z"),
+            (datetime(2024, 1, 15, 10, 30, tzinfo=UTC), "2024-01-15T10:30:00Z"),
+        ],
+    )
+    def test_normalize_iso_matches_format_iso(self, value, expected):
+        """Test normalize_iso gives format_iso's output, passing canonical strings through."""
+        assert normalize_iso(value) == expected
+        assert normalize_iso(value) == format_iso(parse_datetime(value))
+
+    def test_normalize_iso_invalid(self):
+        """Test normalize_iso still rejects strings that are not timestamps."""
+        with pytest.raises(ValueError):
+            normalize_iso("not-a-date")
+
     def test_utc_now(self):
         """Test getting current UTC time."""
         now = utc_now()
@@ -71,6 +100,14 @@ class TestDatetimeFunctions:
         """Test formatting None returns None."""
         assert format_iso(None) is None
 
+    def test_format_iso_cache_respects_offset(self):
+        """Test cached formatting distinguishes equal instants in different zones."""
+        utc_dt = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+        offset_dt = utc_dt.astimezone(timezone(timedelta(hours=2)))
+
+        assert format_iso(utc_dt) == "2024-01-15T10:30:00Z"
+        assert format_iso(offset_dt) == "2024-01-15T12:30:00+02:00"
+
 
 class TestTokenRedaction:
     """Tests for token redaction."""
@@ -172,6 +209,30 @@ class TestDictionaryUtilities:
         assert result == "empty"
 
 
+class TestJsonSerialization:
+    """Tests for compact JSON serialization."""
+
+    def test_dump_json_is_compact(self):
+        """Test dump_json omits whitespace and round-trips."""
+        import json
+
+        value = [{"type": "website", "url": "https://example.com"}]
+        text = dump_json(value)
+        assert text == '[{"type":"website","url":"https://example.com"}]'
+        assert json.loads(text) == value
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_dump_json_keeps_unicode(self, monkeypatch, orjson_available):
+        """Test dump_json does not escape non-ASCII characters with either encoder."""
+        from producthuntdb import utils
+
+        if orjson_available:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(utils, "ORJSON_AVAILABLE", orjson_available)
+        text = dump_json({"name": "café", "links": [1, None]})
+        assert text == '{"name":"café","links":[1,null]}'
+
+
 class TestIdNormalization:
     """Tests for ID normalization."""
 